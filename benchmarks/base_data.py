@@ -0,0 +1,64 @@
+"""
+Compare the memory and sort time of BaseData with the regular dataclass it
+used to be, which had a ``__dict__`` and was sorted with a Python ``__lt__``.
+
+    python benchmarks/base_data.py [COUNT]
+"""
+import random
+import sys
+import time
+import tracemalloc
+import typing as t
+from dataclasses import dataclass
+from operator import attrgetter
+
+from opendigger_pycli.datatypes import BaseData
+
+
+@dataclass
+class DataclassBaseData:
+    year: int
+    month: int
+    value: float
+    is_raw: bool = False
+
+    def __lt__(self, other: "DataclassBaseData") -> bool:
+        if self.year == other.year:
+            if self.month == other.month:
+                return self.is_raw > other.is_raw
+            return self.month < other.month
+        return self.year < other.year
+
+
+def measure(cls: t.Type, months: t.List[t.Tuple[int, int, bool]]) -> t.List[t.Any]:
+    tracemalloc.start()
+    instances = [cls(year=y, month=m, value=1.5, is_raw=r) for y, m, r in months]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{cls.__name__:>17}: {size / len(months):6.1f} bytes per instance")
+    return instances
+
+
+def time_sort(name: str, instances: t.List[t.Any], **kwargs: t.Any) -> None:
+    start = time.perf_counter()
+    sorted(instances, **kwargs)
+    print(f"{name:>33}: {time.perf_counter() - start:6.3f} s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    months = [
+        (rng.randint(2015, 2023), rng.randint(1, 12), rng.random() < 0.1)
+        for _ in range(count)
+    ]
+    # The value is shared by every instance and not counted
+    dataclass_instances = measure(DataclassBaseData, months)
+    slotted_instances = measure(BaseData, months)
+    time_sort("DataclassBaseData, __lt__", dataclass_instances)
+    time_sort("BaseData, __lt__", slotted_instances)
+    time_sort("BaseData, key=sort_key", slotted_instances, key=attrgetter("sort_key"))
+
+
+if __name__ == "__main__":
+    main()
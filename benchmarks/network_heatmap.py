@@ -0,0 +1,62 @@
+"""
+Time the heatmap data of a network with the IndexedGraph it is now built
+from, against the node_names.index() lookups it used to make per edge.
+
+    python benchmarks/network_heatmap.py [NODES] [EDGES]
+"""
+import random
+import sys
+import time
+import typing as t
+
+from opendigger_pycli.console.print_indicator_graph import get_network_heatmap_data
+from opendigger_pycli.dataloaders.utils import load_network_data
+from opendigger_pycli.datatypes import BaseNetworkData
+
+
+def list_index_heatmap_data(network_data: BaseNetworkData) -> t.List[t.List[float]]:
+    # Ranked like the heatmap, which shows nodes by descending value
+    node_names = [node.name for node in network_data.sorted_nodes]
+    heatmap_data = [[0.0] * len(node_names) for _ in range(len(node_names))]
+    for edge in network_data.sorted_edges:
+        heatmap_data[node_names.index(edge.name0)][
+            node_names.index(edge.name1)
+        ] = edge.value
+    return heatmap_data
+
+
+def main() -> None:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 30_000
+    rng = random.Random(0)
+    names = [f"user-{i}" for i in range(node_count)]
+    network_data = load_network_data(
+        {
+            "nodes": [[name, rng.random() * 100] for name in names],
+            "edges": [
+                [rng.choice(names), rng.choice(names), rng.random() * 100]
+                for _ in range(edge_count)
+            ],
+        }
+    )
+
+    start = time.perf_counter()
+    expected = list_index_heatmap_data(network_data)
+    list_index_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    network_data.indexed
+    index_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    heatmap_data, _, _ = get_network_heatmap_data(network_data)
+    dense_seconds = time.perf_counter() - start
+    assert heatmap_data == expected
+
+    print(f"{node_count} nodes, {edge_count} edges")
+    print(f"  node_names.index(): {list_index_seconds * 1e3:8.1f} ms")
+    print(f"  IndexedGraph build: {index_seconds * 1e3:8.1f} ms")
+    print(f"  heatmap from CSR:   {dense_seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
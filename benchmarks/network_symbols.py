@@ -0,0 +1,84 @@
+"""
+Memory of monthly project_openrank_detail networks loaded for one project,
+as columns of symbols from the table of a symbol scope and as dicts with a
+new string for every name in every file, as they used to be loaded. Each
+month is also indexed, as the graph display does.
+
+    python benchmarks/network_symbols.py [MONTHS] [DEVELOPERS]
+"""
+import json
+import random
+import sys
+import tracemalloc
+import typing as t
+
+from opendigger_pycli.dataloaders.utils import decode_openrank_network_data
+from opendigger_pycli.datatypes import BaseNetworkData, symbol_scope
+from opendigger_pycli.utils.json_stream import iter_object_members
+
+
+def decode_without_symbols(chunks: t.Iterable[bytes]) -> BaseNetworkData:
+    nodes = []
+    edges = []
+    for key, value in iter_object_members(chunks, ("nodes", "links")):
+        if key == "nodes":
+            nodes.append(value)
+        elif key == "links":
+            edges.append(value)
+    return BaseNetworkData(nodes=nodes, edges=edges)
+
+
+def make_snapshots(months: int, developers: int) -> t.List[bytes]:
+    rng = random.Random(0)
+    ids = [f"u{rng.randrange(10**8)}" for _ in range(developers)]
+    names = {node_id: f"developer-{node_id[1:]}" for node_id in ids}
+    snapshots = []
+    for _ in range(months):
+        active = rng.sample(ids, developers * 3 // 4)
+        nodes = [
+            {"id": i, "n": names[i], "c": "u", "i": 1, "r": 0.5, "v": rng.random()}
+            for i in active
+        ]
+        links = [
+            {"s": rng.choice(active), "t": rng.choice(active), "w": rng.random()}
+            for _ in range(len(active) * 2)
+        ]
+        snapshots.append(json.dumps({"nodes": nodes, "links": links}).encode())
+    return snapshots
+
+
+def measure(decode: t.Callable, snapshots: t.List[bytes]) -> t.List[int]:
+    """Memory in use after each month is loaded"""
+    sizes = []
+    loaded = []
+    tracemalloc.start()
+    for snapshot in snapshots:
+        network_data = decode([snapshot])
+        network_data.indexed
+        loaded.append(network_data)
+        sizes.append(tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+    return sizes
+
+
+def main() -> None:
+    months = int(sys.argv[1]) if len(sys.argv) > 1 else 36
+    developers = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    snapshots = make_snapshots(months, developers)
+    with symbol_scope() as symbols:
+        for name, decode in (
+            ("new strings", decode_without_symbols),
+            ("symbols", decode_openrank_network_data),
+        ):
+            sizes = measure(decode, snapshots)
+            growth = (sizes[-1] - sizes[0]) / (months - 1)
+            print(
+                f"{name:>11}: {sizes[0] / 1e6:6.2f} MB for the first month, "
+                f"{growth / 1e6:6.2f} MB per month after it, "
+                f"{sizes[-1] / 1e6:7.2f} MB for {months} months"
+            )
+        print(f"{len(symbols)} symbols")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Time creating a network and reading its top nodes and edges, now that they
+are ranked on read, against the full sorts it used to make when created.
+
+    python benchmarks/network_top.py [NODES] [EDGES] [K]
+"""
+import random
+import sys
+import time
+
+from opendigger_pycli.datatypes import BaseNetworkData, NameAndValue, NameNameAndValue
+
+
+def main() -> None:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    edge_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    rng = random.Random(0)
+    names = [f"user-{i}" for i in range(node_count)]
+    nodes = [NameAndValue(name, rng.random() * 100) for name in names]
+    edges = [
+        NameNameAndValue(rng.choice(names), rng.choice(names), rng.random() * 100)
+        for _ in range(edge_count)
+    ]
+
+    start = time.perf_counter()
+    sorted(nodes, key=lambda x: x.value, reverse=True)
+    sorted(edges, key=lambda x: x.value, reverse=True)
+    eager_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    network_data = BaseNetworkData(nodes=nodes, edges=edges)
+    create_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    network_data.top_nodes(k)
+    network_data.top_edges(k)
+    top_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    network_data.top_nodes(k)
+    network_data.top_edges(k)
+    cached_seconds = time.perf_counter() - start
+
+    print(f"{node_count} nodes, {edge_count} edges, k={k}")
+    print(f"  full sorts when created: {eager_seconds * 1e3:8.2f} ms")
+    print(f"  create:                  {create_seconds * 1e3:8.2f} ms")
+    print(f"  top {k}:                  {top_seconds * 1e3:8.2f} ms")
+    print(f"  top {k} again:            {cached_seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Time queries on duration indicators such as issue_response_time, whose
+seven series used to be deep-copied before every query.
+
+    python benchmarks/query_non_trivial.py [REPOS]
+"""
+import copy
+import sys
+import time
+
+from opendigger_pycli.cli.parsers import QueryParser
+from opendigger_pycli.dataloaders.utils import load_non_trival_indicator_data
+from opendigger_pycli.datatypes import IssueResponseTimeData
+from opendigger_pycli.results.query import query_non_trivial_indicator
+
+MONTHS = [f"{year}-{month:02}" for year in range(2015, 2024) for month in range(1, 13)]
+DURATION_DATA = {
+    "avg": {month: 1.5 for month in MONTHS},
+    "levels": {month: [1, 2, 3, 4] for month in MONTHS},
+    **{f"quantile_{i}": {month: float(i) for month in MONTHS} for i in range(5)},
+}
+
+
+def main() -> None:
+    repos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    indicators = [
+        IssueResponseTimeData(value=load_non_trival_indicator_data(DURATION_DATA))
+        for _ in range(repos)
+    ]
+    for query_str in ("2021", "2015-01~2023-12"):
+        queries = [QueryParser().try_parse_indicator_query(query_str)]
+
+        start = time.perf_counter()
+        for indicator in indicators:
+            copy.deepcopy(indicator)
+        deepcopy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for indicator in indicators:
+            query_non_trivial_indicator(indicator, queries)  # type: ignore
+        query_seconds = time.perf_counter() - start
+
+        print(
+            f"{query_str:>16}: query {query_seconds / repos * 1e6:6.1f} us per repo, "
+            f"the deepcopy it used to make alone took "
+            f"{deepcopy_seconds / repos * 1e6:6.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
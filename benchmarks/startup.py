@@ -0,0 +1,54 @@
+"""
+Time how long the CLI takes to start.
+
+Every command is run in a fresh interpreter a few times and the fastest run
+is reported, which is what a user sees once the files are in the OS cache.
+
+    python benchmarks/startup.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+RUNS = 7
+COMMANDS: t.List[t.List[str]] = [
+    ["--help"],
+    ["config", "--help"],
+    ["repo", "--help"],
+    ["user", "--help"],
+]
+
+
+def time_command(argv: t.List[str], env: t.Dict[str, str]) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            argv,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as config_home:
+        # Do not touch the config of the user running the benchmark
+        env = dict(os.environ, XDG_CONFIG_HOME=config_home)
+        # What any Python program pays before its first import
+        interpreter = time_command([sys.executable, "-c", "pass"], env)
+        print(f"{interpreter * 1000:8.1f} ms  python -c pass")
+        for args in COMMANDS:
+            seconds = time_command(
+                [sys.executable, "-m", "opendigger_pycli", *args], env
+            )
+            print(f"{seconds * 1000:8.1f} ms  opendigger {' '.join(args)}")
+
+
+if __name__ == "__main__":
+    main()
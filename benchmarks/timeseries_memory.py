@@ -0,0 +1,48 @@
+"""
+Compare the memory used by indicators loaded as lists of BaseData and as
+TimeSeries (``data.columnar``).
+
+    python benchmarks/timeseries_memory.py [SERIES]
+
+The default loads 30 000 series of five years, a thousand repositories
+with 30 indicators each, and extrapolates to ten thousand repositories.
+"""
+import sys
+import tracemalloc
+import typing as t
+
+from opendigger_pycli.dataloaders.utils import load_base_data
+from opendigger_pycli.datatypes import TimeSeries
+
+MONTHLY_DATA = {
+    f"{year}-{month:02}": year + month / 10
+    for year in range(2019, 2024)
+    for month in range(1, 13)
+}
+
+
+def measure(load: t.Callable[[], t.Any], count: int) -> int:
+    tracemalloc.start()
+    loaded = [load() for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    months = len(MONTHLY_DATA)
+    for name, load in (
+        ("List[BaseData]", lambda: load_base_data(MONTHLY_DATA, float)),
+        ("TimeSeries", lambda: TimeSeries.from_dict(MONTHLY_DATA, float)),
+    ):
+        size = measure(load, count)
+        print(
+            f"{name:>15}: {size / count / months:6.1f} bytes per month, "
+            f"{size / count * 300_000 / 1e6:7.1f} MB for 10k repos x 30 indicators"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,19 @@
+import itertools
 import typing as t
+from pathlib import Path
 
 import click
-from click_plugins import with_plugins
-from pkg_resources import iter_entry_points  # type: ignore
 
+from opendigger_pycli.config.utils import get_optional_github_pat
 from opendigger_pycli.console import CONSOLE
-from opendigger_pycli.console.print_base_info import (
-    print_indicator_info,
-    print_repo_info,
-    print_user_info,
-)
-from opendigger_pycli.results.query import RepoQueryResult, UserQueryResult
+from opendigger_pycli.dataloaders.source import is_offline, set_data_source
+from opendigger_pycli.results.scheduler import DEFAULT_HOST_JOBS, DEFAULT_JOBS
+from opendigger_pycli.utils import chunked
 from opendigger_pycli.utils.decorators import (
     pass_filtered_dataloaders,
     process_commands,
 )
+from opendigger_pycli.utils.files import read_targets
 
 from .custom_types import (
     FILTERED_METRIC_QUERY_TYPE,
@@ -24,11 +23,13 @@ from .custom_types import (
     INDICATOR_QUERY_TYPE,
 )
 from .env import Environment
+from .lazy import LazyGroup
 from .utils import (
     add_indicator_type,
     add_introducer,
     distinct_indicator_names,
     distinct_indicator_queries,
+    read_repo_targets,
 )
 
 if t.TYPE_CHECKING:
@@ -40,10 +41,18 @@ if t.TYPE_CHECKING:
 pass_environment = click.make_pass_decorator(Environment, ensure=True)
 
 
+# The modules of the commands below, of the query processors and of the
+# dataloaders are imported only when they are used, which keeps --help fast
 @click.group(  # type: ignore
+    cls=LazyGroup,
     context_settings={
         "help_option_names": ["-h", "--help"],
-    }
+    },
+    lazy_subcommands={
+        "cache": "opendigger_pycli.cli.commands.cache_cmd:cache",
+        "config": "opendigger_pycli.cli.commands.config_cmd:config",
+        "mirror": "opendigger_pycli.cli.commands.mirror_cmd:mirror",
+    },
 )
 @click.option(
     "--log-level",
@@ -52,13 +61,32 @@ pass_environment = click.make_pass_decorator(Environment, ensure=True)
     type=click.Choice(["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
     help="Enables verbose mode.",
 )
+@click.option(
+    "--offline",
+    "offline",
+    is_flag=True,
+    default=None,
+    envvar="OPENDIGGER_OFFLINE",
+    help="Never access the network, read data from the mirror or the cache.",
+)
+@click.option(
+    "--mirror",
+    "mirror_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    envvar="OPENDIGGER_MIRROR",
+    help="Read data from a local mirror of the OpenDigger dataset.",
+)
 @pass_environment
 def opendigger(
     env: Environment,
     log_level: t.Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    offline: t.Optional[bool],
+    mirror_dir: t.Optional[Path],
 ) -> None:
     """Open Digger CLI"""
     env.set_log_level(log_level)
+    data_source = set_data_source(mirror_dir=mirror_dir, offline=offline)
+    env.dlog("data source:", data_source)
 
 
 opendigger_cmd = t.cast("Group", opendigger)
@@ -73,29 +101,73 @@ opendigger_cmd = t.cast("Group", opendigger)
     multiple=True,
     help="GitHub username",
 )
+@click.option(
+    "--no-verify",
+    "no_verify",
+    is_flag=True,
+    envvar="OPENDIGGER_NO_VERIFY",
+    help="Do not check that the users exist on GitHub.",
+)
+@click.option(
+    "--targets-file",
+    "targets_path",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=Path),
+    help="File with one username per line, - for stdin. "
+    "It is read lazily and the users in it are not checked on GitHub.",
+)
 @pass_environment
-def user(env: Environment, usernames: t.List[str]) -> None:
+def user(
+    env: Environment,
+    usernames: t.List[str],
+    no_verify: bool,
+    targets_path: t.Optional[Path],
+) -> None:
     """
     Operate on user indicators
     """
+    from opendigger_pycli.console.print_base_info import print_user_info
+    from opendigger_pycli.results.query import TARGETS_CHUNK_SIZE
+    from opendigger_pycli.utils.checkers import find_missing_gh_users
+
     env.vlog("indicator mode: [green]USER")
 
     usernames = list(set(usernames))
     env.dlog("usernames:", usernames)
 
+    # Cannot check GitHub without network access
+    if usernames and not no_verify and not is_offline():
+        with CONSOLE.status("[bold green]checking users on GitHub..."):
+            missing_usernames = find_missing_gh_users(usernames)
+        if missing_usernames:
+            raise click.BadParameter(
+                ", ".join(
+                    f"{username} user does not exist, "
+                    f"please check https://www.github.com/{username}"
+                    for username in missing_usernames
+                ),
+                param_hint="'--username' / '-u'",
+            )
+
+    all_usernames: t.Iterable[str] = usernames
+    if targets_path is not None:
+        all_usernames = itertools.chain(usernames, read_targets(targets_path))
+
     if click.get_current_context().invoked_subcommand is None:
+        if is_offline():
+            raise click.UsageError("User info needs network access.")
         env.vlog("[bold green]requesting users info...")
         with CONSOLE.status("[bold green]requesting users info..."):
-            env.dlog(print_user_info(usernames, env.cli_config.app_keys.github_pat))
+            for chunk in chunked(all_usernames, TARGETS_CHUNK_SIZE):
+                env.dlog(print_user_info(chunk, get_optional_github_pat()))
             env.vlog("[bold green]end requesting users info...")
             return
 
-    if not usernames:
+    if not usernames and targets_path is None:
         env.elog("You must specify the username.")
         raise click.UsageError("You must specify the username.")
 
     env.set_mode("user")
-    env.set_params(usernames)
+    env.set_params(all_usernames)
     env.dlog("Set params to env")
     env.dlog("env.mode:", env.mode)
     env.dlog("env.params:", env.params)
@@ -111,37 +183,86 @@ def user(env: Environment, usernames: t.List[str]) -> None:
     help="GitHub repository, e.g. X-lab2017/open-digger",
     metavar="<org>/<repo>",
 )
+@click.option(
+    "--no-verify",
+    "no_verify",
+    is_flag=True,
+    envvar="OPENDIGGER_NO_VERIFY",
+    help="Do not check that the repositories exist on GitHub.",
+)
+@click.option(
+    "--targets-file",
+    "targets_path",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=Path),
+    help="File with one <org>/<repo> per line, - for stdin. "
+    "It is read lazily and the repositories in it are not checked on GitHub.",
+)
 @pass_environment
-def repo(env: Environment, repos: t.List[t.Tuple[str, str]]) -> None:
+def repo(
+    env: Environment,
+    repos: t.List[t.Tuple[str, str]],
+    no_verify: bool,
+    targets_path: t.Optional[Path],
+) -> None:
     """
     Operate on repository indicators
     """
+    from opendigger_pycli.console.print_base_info import print_repo_info
+    from opendigger_pycli.results.query import TARGETS_CHUNK_SIZE
+    from opendigger_pycli.utils.checkers import find_missing_gh_repos
+
     env.vlog("indicator mode: [green]REPO")
 
     repos = list(set(repos))
     env.dlog("repos:", repos)
 
+    # Cannot check GitHub without network access
+    if repos and not no_verify and not is_offline():
+        with CONSOLE.status("[bold green]checking repos on GitHub..."):
+            missing_repos = find_missing_gh_repos(repos)
+        if missing_repos:
+            raise click.BadParameter(
+                ", ".join(
+                    f"{org_name}/{repo_name} repo does not exist, "
+                    f"please check https://www.github.com/{org_name}/{repo_name}"
+                    for org_name, repo_name in missing_repos
+                ),
+                param_hint="'--repo' / '-r'",
+            )
+
+    all_repos: t.Iterable[t.Tuple[str, str]] = repos
+    if targets_path is not None:
+        all_repos = itertools.chain(repos, read_repo_targets(targets_path))
+
     if click.get_current_context().invoked_subcommand is None:
+        if is_offline():
+            raise click.UsageError("Repository info needs network access.")
         env.vlog("[bold green]fetching repos info...")
         with CONSOLE.status("[bold green]fetching repos info..."):
-            env.dlog(print_repo_info(repos, env.cli_config.app_keys.github_pat))
+            for chunk in chunked(all_repos, TARGETS_CHUNK_SIZE):
+                env.dlog(print_repo_info(chunk, get_optional_github_pat()))
             env.vlog("[bold green]end fetching repos info...")
         return
 
-    if not repos:
+    if not repos and targets_path is None:
         env.elog("You must specify the repository.")
         raise click.UsageError("You must specify the repository.")
 
     env.set_mode("repo")
-    env.set_params(repos)
+    env.set_params(all_repos)
     env.vlog("Set params to env")
 
 
-@with_plugins(iter_entry_points("opendigger_pycli.plugins"))  # type: ignore
 @click.group(  # type: ignore
+    cls=LazyGroup,
     chain=True,
     help="Query indicators",
     invoke_without_command=True,
+    lazy_subcommands={
+        "display": "opendigger_pycli.cli.commands.display_cmd:display",
+        "export": "opendigger_pycli.cli.commands.export_cmd:export",
+    },
+    entry_point_group="opendigger_pycli.plugins",
 )
 @click.option(
     "--index",
@@ -233,6 +354,34 @@ def repo(env: Environment, repos: t.List[t.Tuple[str, str]]) -> None:
     is_eager=True,
     help="The query applying to all indicators",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="The number of indicators fetched in parallel, "
+    "at most --host-jobs of them from the same host.",
+)
+@click.option(
+    "--host-jobs",
+    "host_jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_HOST_JOBS,
+    show_default=True,
+    help="The number of indicators fetched in parallel from the same host. "
+    "All built-in indicators come from the same host.",
+)
+@click.option(
+    "--deadline",
+    "deadline",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Seconds the whole query may take to fetch data, "
+    "or each batch of targets read from --targets-file. "
+    "Indicators not loaded in time are reported as failed.",
+)
 def query(
     indicator_types: t.Set[t.Literal["index", "metric", "network"]],
     introducers: t.Set[t.Literal["X-lab", "CHAOSS"]],
@@ -240,6 +389,9 @@ def query(
     is_only_select: bool,
     ignore_indicator_names: t.List[str],
     uniform_query: t.Optional["IndicatorQuery"],
+    jobs: int,
+    host_jobs: int,
+    deadline: t.Optional[float],
 ) -> None:
     """
     Query Metrics
@@ -267,7 +419,17 @@ def process_query_results(
     is_only_select: bool,
     ignore_indicator_names: t.List[str],
     uniform_query: t.Optional["IndicatorQuery"],
+    jobs: int,
+    host_jobs: int,
+    deadline: t.Optional[float],
 ) -> None:
+    from opendigger_pycli.console.print_base_info import print_indicator_info
+    from opendigger_pycli.results.query import (
+        RepoQueryResult,
+        UserQueryResult,
+        iter_query_results,
+    )
+
     # Processing parameters: deduplication and default value processing
     selected_indicator_queries = distinct_indicator_queries(selected_indicator_queries)
     ignore_indicator_names = distinct_indicator_names(ignore_indicator_names)
@@ -283,7 +445,10 @@ def process_query_results(
         selected_indicator_queries: {selected_indicator_queries},
         is_only_select: {is_only_select},
         ignore_indicator_names: {ignore_indicator_names},
-        uniform_query: {uniform_query}
+        uniform_query: {uniform_query},
+        jobs: {jobs},
+        host_jobs: {host_jobs},
+        deadline: {deadline}
         """
     )
 
@@ -328,39 +493,50 @@ def process_query_results(
         raise click.UsageError("Your query cannot query any indicators.")
 
     mode = env.mode  # This is assigned in the repo command
-    results: t.Union[t.List[UserQueryResult], t.List[RepoQueryResult]]
+    results: t.Union[t.Iterable[UserQueryResult], t.Iterable[RepoQueryResult]]
     if mode == "user":
-        usernames = t.cast(t.List[str], env.params)
+        usernames = t.cast(t.Iterable[str], env.params)
         # build result
         env.vlog("Fetching user indicators data...")
-        results = [
+        results = (
             UserQueryResult(
                 username=username,
                 dataloaders=dataloaders,
                 indicator_queries=selected_indicator_queries,
                 uniform_query=uniform_query,
+                fetch=False,
             )
             for username in usernames
-        ]
+        )
     else:
         # repo mode
-        repos = t.cast(t.List[t.Tuple[str, str]], env.params)
+        repos = t.cast(t.Iterable[t.Tuple[str, str]], env.params)
         # build result
         env.vlog("Fetching repo indicators data...")
-        results = [
+        results = (
             RepoQueryResult(
                 repo=repo,
                 dataloaders=dataloaders,
                 indicator_queries=selected_indicator_queries,
                 uniform_query=uniform_query,
+                fetch=False,
             )
             for repo in repos
-        ]
-
-    env.vlog("End fetching indicators data...")
-    env.dlog("Query Results:", results)
-
-    return process_commands(processors, results)
+        )
+
+    # Results are fetched chunk by chunk while the processors consume them,
+    # so a long list of targets never sits in memory at once
+    return process_commands(
+        processors,
+        iter_query_results(
+            results,
+            jobs=jobs,
+            host_jobs=host_jobs,
+            deadline=deadline,
+            # Reporting missing data to GitHub needs network access
+            report_nodata=not is_offline(),
+        ),
+    )
 
 
 user.add_command(query_cmd)
@@ -0,0 +1,69 @@
+import typing as t
+
+import click
+from rich import box
+from rich.table import Table
+
+from opendigger_pycli.console import CONSOLE
+from opendigger_pycli.dataloaders.cache import open_http_cache
+
+from ..base import pass_environment
+
+if t.TYPE_CHECKING:
+    from ..base import Environment
+
+
+def format_size(size: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+@click.group("cache")
+def cache() -> None:
+    """Manage the local cache of OpenDigger data"""
+
+
+@cache.command("stats")
+@pass_environment
+def stats(env: "Environment") -> None:
+    """Show cache usage"""
+    cache_stats = open_http_cache().stats()
+    env.dlog("cache stats:", cache_stats)
+
+    table = Table("Key", "Value", title="cache", box=box.HORIZONTALS)
+    table.add_row("Directory", str(cache_stats.cache_dir))
+    table.add_row("Entries", str(cache_stats.entries))
+    table.add_row("Total Size", format_size(cache_stats.total_size))
+    table.add_row("Max Size", format_size(cache_stats.max_size))
+    table.add_row("Known Missing", str(cache_stats.missing))
+    CONSOLE.print(table)
+
+
+@cache.command("clear")
+@pass_environment
+def clear(env: "Environment") -> None:
+    """Remove all cached data"""
+    evicted, freed = open_http_cache().clear()
+    env.dlog(f"cleared {evicted} entries")
+    CONSOLE.print(f"[green]Removed {evicted} entries, freed {format_size(freed)}[/]")
+
+
+@cache.command("prune")  # type: ignore
+@click.option(
+    "--max-size",
+    "-m",
+    "max_size_mb",
+    type=click.FloatRange(min=0),
+    help="Target cache size in MB, defaults to cache.max_size_mb",
+)
+@pass_environment
+def prune(env: "Environment", max_size_mb: t.Optional[float]) -> None:
+    """Evict least recently used data until the cache fits"""
+    http_cache = open_http_cache()
+    max_size = None if max_size_mb is None else int(max_size_mb * 1024 * 1024)
+    evicted, freed = http_cache.prune(max_size)
+    env.dlog(f"pruned {evicted} entries")
+    CONSOLE.print(f"[green]Removed {evicted} entries, freed {format_size(freed)}[/]")
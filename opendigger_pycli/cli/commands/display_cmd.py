@@ -59,7 +59,6 @@ def display(
 ):
     env.dlog(f"Received Params: format_name={format_name}, save_path={save_path}")
     env.vlog(f"Displaying results, format: {format_name}")
-    DisplyCMDResult(
+    yield from DisplyCMDResult(
         results, format_name, save_path, paging=paging, color=pager_color
-    ).display()
-    yield from results
+    ).iter_display()
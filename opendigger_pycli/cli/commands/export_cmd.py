@@ -54,5 +54,4 @@ def export(
     if is_split and format not in CAN_SPLIT_EXPORT_FORMATS:
         raise click.BadParameter(f"This format {format} does not support split")
 
-    ExportResult(results, format, save_dir, is_split).export()
-    yield from results
+    yield from ExportResult(results, format, save_dir, is_split).iter_export()
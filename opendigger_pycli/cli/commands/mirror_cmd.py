@@ -0,0 +1,183 @@
+import datetime
+import typing as t
+from pathlib import Path
+
+import click
+
+from opendigger_pycli.console import CONSOLE
+from opendigger_pycli.dataloaders.source import get_data_source
+from opendigger_pycli.utils.files import read_targets
+
+from ..base import pass_environment
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.dataloaders.mirror import SyncStats
+    from opendigger_pycli.datatypes import DataloaderProto
+
+    from ..base import Environment
+
+
+def get_sync_dataloaders(
+    indicator_names: t.Optional[t.List[str]],
+) -> t.List["DataloaderProto"]:
+    from opendigger_pycli.dataloaders import (
+        ALL_INDICATOR_TYPES,
+        ALL_INTRODUCERS,
+        ALL_TYPES,
+        filter_dataloader,
+    )
+
+    dataloaders = list(
+        filter_dataloader(ALL_TYPES, ALL_INDICATOR_TYPES, ALL_INTRODUCERS)
+    )
+    if not indicator_names:
+        return dataloaders
+    unknown_names = set(indicator_names) - {d.name for d in dataloaders}
+    if unknown_names:
+        raise click.BadParameter(
+            f"Unknown indicators: {', '.join(sorted(unknown_names))}",
+            param_hint="'--indicators'",
+        )
+    return [d for d in dataloaders if d.name in indicator_names]
+
+
+@click.group("mirror")
+def mirror() -> None:
+    """Manage a local mirror of OpenDigger data"""
+
+
+@mirror.command("sync")  # type: ignore
+@click.option(
+    "--targets",
+    "-t",
+    "targets_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+    help="File with one <org>/<repo> or username per line.",
+)
+@click.option(
+    "--indicators",
+    "-i",
+    "indicator_names",
+    help="Comma separated indicator names, defaults to all indicators.",
+)
+@click.option(
+    "--month",
+    "-m",
+    "months",
+    type=click.DateTime(["%Y-%m"]),
+    multiple=True,
+    help="Month to download for monthly indicators, e.g. 2023-08. "
+    "Monthly indicators are skipped if not given.",
+)
+@click.option(
+    "--output",
+    "-o",
+    "mirror_dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Mirror directory, defaults to source.mirror_dir.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Number of files downloaded at the same time.",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Download everything again, ignoring the checkpoint and existing files.",
+)
+@click.option(
+    "--no-compress",
+    "no_compress",
+    is_flag=True,
+    help="Store files as plain JSON instead of compressing them.",
+)
+@pass_environment
+def sync(
+    env: "Environment",
+    targets_path: Path,
+    indicator_names: t.Optional[str],
+    months: t.Tuple[datetime.datetime, ...],
+    mirror_dir: t.Optional[Path],
+    jobs: int,
+    force: bool,
+    no_compress: bool,
+) -> None:
+    """Download indicator data of many repos or users into the mirror
+
+    An interrupted sync resumes where it stopped when run again.
+    """
+    import asyncio
+
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from opendigger_pycli.dataloaders.mirror import MirrorSync
+
+    if mirror_dir is None:
+        mirror_dir = get_data_source().mirror_dir
+    if mirror_dir is None:
+        raise click.UsageError(
+            "No mirror directory, use --output or set source.mirror_dir."
+        )
+
+    dataloaders = get_sync_dataloaders(
+        [name.strip() for name in indicator_names.split(",") if name.strip()]
+        if indicator_names
+        else None
+    )
+    dates = [(month.year, month.month) for month in months]
+    total_targets = sum(1 for _ in read_targets(targets_path))
+    env.dlog(f"syncing {total_targets} targets into {mirror_dir}")
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total} targets"),
+        TextColumn("{task.fields[rate]}"),
+        TimeElapsedColumn(),
+        console=CONSOLE,
+    ) as progress:
+        task_id = progress.add_task("Syncing mirror", total=total_targets, rate="")
+
+        def on_progress(stats: "SyncStats") -> None:
+            progress.update(
+                task_id,
+                completed=stats.targets + stats.resumed,
+                rate=f"{stats.files_per_second:.1f} files/s "
+                f"{stats.mb_per_second:.2f} MB/s",
+            )
+
+        mirror_sync = MirrorSync(
+            mirror_dir,
+            dataloaders,
+            dates=dates,
+            jobs=jobs,
+            force=force,
+            compress=not no_compress,
+            on_progress=on_progress,
+        )
+        stats = asyncio.run(mirror_sync.run(read_targets(targets_path)))
+
+    env.dlog("sync stats:", stats)
+    CONSOLE.print(
+        f"[green]Downloaded {stats.files} files ({stats.bytes / 1024 / 1024:.1f} MB) "
+        f"for {stats.targets} targets in {stats.elapsed:.1f}s, "
+        f"{stats.files_per_second:.1f} files/s, {stats.mb_per_second:.2f} MB/s[/]"
+    )
+    if stats.resumed or stats.existing:
+        CONSOLE.print(
+            f"Skipped {stats.resumed} finished targets "
+            f"and {stats.existing} existing files"
+        )
+    if stats.missing:
+        CONSOLE.print(f"{stats.missing} files do not exist on OpenDigger")
+    if stats.failed:
+        CONSOLE.print(
+            f"[yellow]{stats.failed} files failed, "
+            "run the same command again to retry them[/]"
+        )
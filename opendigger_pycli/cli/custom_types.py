@@ -3,13 +3,6 @@ import typing as t
 import click
 from click.shell_completion import CompletionItem
 
-from opendigger_pycli.dataloaders import (
-    DeveloperNetworkRepoDataloader,
-    ProjectOpenRankNetworkRepoDataloader,
-    RepoNetworkRepoDataloader,
-)
-from opendigger_pycli.utils.checkers import exist_gh_repo, exist_gh_user
-
 from .parsers import QueryParser
 
 if t.TYPE_CHECKING:
@@ -27,13 +20,10 @@ class GhRepoNameType(click.ParamType):
         param: t.Optional["Parameter"],
         ctx: t.Optional["Context"],
     ) -> t.Tuple[str, str]:
+        # Whether the repo exists is checked for all repos at once by the
+        # repo command, never while parsing (e.g. for shell completion)
         try:
             org_name, repo_name = value.split("/")
-            if not exist_gh_repo(org_name, repo_name):
-                self.fail(
-                    f"{value} repo does not exist, "
-                    f"please check https://www.github.com/{org_name}/{repo_name}"
-                )
             return org_name, repo_name
         except ValueError:
             self.fail(f"{value} is not a valid repo name")
@@ -48,11 +38,7 @@ class GhUserNameType(click.ParamType):
         param: t.Optional["Parameter"],
         ctx: t.Optional["Context"],
     ) -> str:
-        if not exist_gh_user(value):
-            self.fail(
-                f"{value} user does not exist, "
-                f"please check https://www.github.com/{value}"
-            )
+        # Checked by the user command, like repo names
         return value
 
 
@@ -77,6 +63,12 @@ class FilteredMetricQueryType(click.ParamType):
         param: t.Optional["Parameter"],
         ctx: t.Optional["Context"],
     ) -> t.Tuple[str, t.Optional["IndicatorQuery"]]:
+        from opendigger_pycli.dataloaders import (
+            DeveloperNetworkRepoDataloader,
+            ProjectOpenRankNetworkRepoDataloader,
+            RepoNetworkRepoDataloader,
+        )
+
         if ctx is None:
             raise ValueError("ctx should not be None")
         indicator_name, indicator_query_str = self._try_split_value(value)
@@ -6,7 +6,7 @@ import typing as t
 import click
 from rich.logging import RichHandler
 
-from opendigger_pycli.config import OpenDiggerCliConfig
+from opendigger_pycli.config import OpenDiggerCliConfig, get_config
 from opendigger_pycli.console import CONSOLE
 
 FORMAT = "%(message)s"
@@ -23,7 +23,8 @@ class Environment:
     home: str
     cli_config: OpenDiggerCliConfig
     mode: t.Literal["repo", "user"]
-    params: t.Union[t.List[t.Tuple[str, str]], t.List[str]]
+    # Targets of the repo or user command, read lazily from --targets-file
+    params: t.Union[t.Iterable[t.Tuple[str, str]], t.Iterable[str]]
 
     def __init__(self):
         self.verbose = False
@@ -77,7 +78,7 @@ class Environment:
     def load_configs(self) -> bool:
         try:
             self.vlog("[bold green]loading configs...")
-            self.cli_config = OpenDiggerCliConfig()
+            self.cli_config = get_config()
             return True
         except Exception as e:
             self.log(f"[bold red]load configs failed: {e}")
@@ -87,7 +88,7 @@ class Environment:
         self.mode = mode
 
     def set_params(
-        self, params: t.Union[t.List[t.Tuple[str, str]], t.List[str]]
+        self, params: t.Union[t.Iterable[t.Tuple[str, str]], t.Iterable[str]]
     ) -> None:
         self.params = params
 
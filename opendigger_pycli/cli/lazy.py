@@ -0,0 +1,97 @@
+"""
+Click groups whose subcommands are imported only when they are used.
+
+The modules behind ``display``, ``export``, ``mirror`` and plugin commands
+pull in pyecharts, openai, aiohttp and the dataloaders, so importing them
+all would make ``opendigger --help`` and ``opendigger config`` slow.
+"""
+import importlib
+import typing as t
+
+import click
+
+if t.TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+    from click.core import Context
+
+
+def iter_entry_points(group: str) -> t.List["EntryPoint"]:
+    """Return the entry points of a group without importing them"""
+    from importlib.metadata import entry_points
+
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        return list(all_entry_points.select(group=group))
+    # Python < 3.10 returns a dict of groups
+    return list(t.cast(t.Dict, all_entry_points).get(group, []))
+
+
+class LazyGroup(click.Group):
+    """A group that imports its subcommands on first use
+
+    ``lazy_subcommands`` maps command names to ``"module:attribute"``, and
+    the commands registered under the ``entry_point_group`` entry points
+    are loaded the same way.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        lazy_subcommands: t.Optional[t.Dict[str, str]] = None,
+        entry_point_group: t.Optional[str] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.entry_point_group = entry_point_group
+        self._entry_points: t.Optional[t.Dict[str, "EntryPoint"]] = None
+
+    @property
+    def entry_points(self) -> t.Dict[str, "EntryPoint"]:
+        if self._entry_points is None:
+            self._entry_points = (
+                {}
+                if self.entry_point_group is None
+                else {
+                    entry_point.name: entry_point
+                    for entry_point in iter_entry_points(self.entry_point_group)
+                }
+            )
+        return self._entry_points
+
+    def list_commands(self, ctx: "Context") -> t.List[str]:
+        return sorted(
+            {*super().list_commands(ctx), *self.lazy_subcommands, *self.entry_points}
+        )
+
+    def get_command(self, ctx: "Context", cmd_name: str) -> t.Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":", 1)
+            command = getattr(importlib.import_module(module_name), attr_name)
+        elif cmd_name in self.entry_points:
+            command = self._load_entry_point(self.entry_points[cmd_name])
+        else:
+            return None
+        self.add_command(t.cast(click.Command, command), cmd_name)
+        return command
+
+    def _load_entry_point(self, entry_point: "EntryPoint") -> click.Command:
+        try:
+            return entry_point.load()
+        except Exception as e:
+            # A broken plugin must not break the other commands
+            message = f"The plugin {entry_point.value} could not be loaded: {e!r}"
+
+            def broken() -> None:
+                raise click.ClickException(message)
+
+            return click.Command(
+                entry_point.name,
+                callback=broken,
+                help=message,
+                short_help="Broken plugin, run it for details",
+            )
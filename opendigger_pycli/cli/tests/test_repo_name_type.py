@@ -1,6 +1,7 @@
 from click.testing import CliRunner
 
 from opendigger_pycli.cli import opendigger
+from opendigger_pycli.utils import checkers
 
 
 def test_repo_name_type():
@@ -22,3 +23,30 @@ def test_repo_name_type():
         opendigger, ["repo", "--repo", test_non_existing_repo]
     )  # type: ignore
     assert result.exit_code == 2
+
+
+def test_repo_names_checked_in_one_batch(tmp_path, monkeypatch):
+    verified_names = checkers.VerifiedNames(tmp_path / "names.json", ttl=60)
+    monkeypatch.setattr(checkers, "open_verified_names", lambda: verified_names)
+    checked = []
+
+    def fake_exist_gh_path(path):
+        checked.append(path)
+        return path != "opendigger/opendigger"
+
+    monkeypatch.setattr(checkers, "_exist_gh_path", fake_exist_gh_path)
+    runner = CliRunner()
+    args = ["repo", "-r", "X-lab2017/open-digger", "-r", "opendigger/opendigger"]
+    result = runner.invoke(opendigger, args)  # type: ignore
+    assert result.exit_code == 2
+    assert "opendigger/opendigger repo does not exist" in result.output
+    assert sorted(checked) == ["X-lab2017/open-digger", "opendigger/opendigger"]
+
+    # Existing repos are remembered, and nothing is checked with --no-verify
+    checked.clear()
+    assert checkers.find_missing_gh_repos([("x-lab2017", "open-digger")]) == []
+    result = runner.invoke(
+        opendigger, ["repo", "--no-verify", "-r", "opendigger/opendigger", "query"]
+    )  # type: ignore
+    assert "does not exist" not in result.output
+    assert checked == []
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["aiohttp", "jinja2", "openai", "pkg_resources", "pyecharts"]
+
+SCRIPT = f"""
+import sys
+from opendigger_pycli.cli import opendigger
+
+try:
+    opendigger(sys.argv[1:])
+except SystemExit:
+    pass
+print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))
+"""
+
+
+def test_help_does_not_import_heavy_modules(tmp_path):
+    for args in (["--help"], ["config", "--help"], ["repo", "--help"]):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT, *args],
+            env={"XDG_CONFIG_HOME": str(tmp_path), "PATH": ""},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.splitlines()[-1] == "", args
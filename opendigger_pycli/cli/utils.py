@@ -1,9 +1,13 @@
 import typing as t
 from collections import defaultdict
+from pathlib import Path
 
 import click
 
-from opendigger_pycli.dataloaders import filter_dataloader
+from opendigger_pycli.console import CONSOLE
+from opendigger_pycli.utils.files import read_targets
+
+from .custom_types import GH_REPO_NAME_TYPE
 
 if t.TYPE_CHECKING:
     from click import Context
@@ -12,6 +16,8 @@ if t.TYPE_CHECKING:
 
 
 def update_filtered_indicator_dataloaders(ctx: "Context") -> None:
+    from opendigger_pycli.dataloaders import filter_dataloader
+
     if "indicator_types" in ctx.params and ctx.params["indicator_types"]:
         indicator_types = ctx.params["indicator_types"]
     else:
@@ -101,3 +107,16 @@ def distinct_indicator_queries(
 
 def distinct_indicator_names(indicator_names: t.List[str]) -> t.List[str]:
     return list(set(indicator_names))
+
+
+def read_repo_targets(path: Path) -> t.Iterator[t.Tuple[str, str]]:
+    """Yield the ``(org, repo)`` on each line of a targets file
+
+    Invalid lines are reported and skipped instead of failing a long run
+    halfway through.
+    """
+    for target in read_targets(path):
+        try:
+            yield GH_REPO_NAME_TYPE.convert(target, None, None)
+        except click.BadParameter as e:
+            CONSOLE.print(f"[yellow]{e.message}, skipping it")
@@ -1 +1 @@
-from .config import OpenDiggerCliConfig, ALL_CONFIGS
+from .config import OpenDiggerCliConfig, ALL_CONFIGS, get_config
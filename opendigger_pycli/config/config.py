@@ -1,4 +1,8 @@
 import configparser
+import itertools
+import os
+import threading
+import time
 import typing as t
 from dataclasses import fields, is_dataclass
 from pathlib import Path
@@ -7,28 +11,73 @@ import click
 from rich import box
 from rich.table import Table
 
-from opendigger_pycli.datatypes import ALL_CONFIGS, AppKeyConfig, UserInfoConfig
+from opendigger_pycli.datatypes import (
+    ALL_CONFIGS,
+    AppKeyConfig,
+    CacheConfig,
+    DataConfig,
+    HttpConfig,
+    SourceConfig,
+    UserInfoConfig,
+)
 
 if t.TYPE_CHECKING:
     from rich.console import Console, ConsoleOptions, RenderResult
 
+ENV_PREFIX = "OPENDIGGER"
+# Seconds a loaded config is used before config.ini is checked for changes
+RELOAD_CHECK_INTERVAL = 1.0
+
+# Numbers every loaded or updated config, see ``OpenDiggerCliConfig.generation``
+_GENERATIONS = itertools.count()
+
+
+def get_config_env_var(section_name: str, key: str) -> str:
+    """Environment variable overriding a config value, e.g.
+    ``OPENDIGGER_APP_KEYS_GITHUB_PAT`` for ``app_keys.github_pat``"""
+    return f"{ENV_PREFIX}_{section_name}_{key}".upper()
+
+
+def read_env_overrides() -> t.Dict[t.Tuple[str, str], str]:
+    overrides = {}
+    for config_dataclass in ALL_CONFIGS.values():
+        for field in fields(config_dataclass):
+            value = os.environ.get(
+                get_config_env_var(config_dataclass.config_name, field.name)
+            )
+            if value is not None:
+                overrides[(config_dataclass.config_name, field.name)] = value
+    return overrides
+
 
 class OpenDiggerCliConfig:
     app_keys: AppKeyConfig
     user_info: UserInfoConfig
+    cache: CacheConfig
+    http: HttpConfig
+    source: SourceConfig
+    data: DataConfig
 
     def __init__(self):
+        self._app_dir_path = Path(click.get_app_dir("opendigger-pycli"))
+        self._app_dir_path.mkdir(parents=True, exist_ok=True)
+        user_config = self._app_dir_path / "config.ini"
+        if not user_config.exists():
+            user_config.touch()
+        self._user_config_file_path = str(user_config)
         self.__load_config()
 
+    @property
+    def app_dir_path(self) -> Path:
+        return self._app_dir_path
+
+    @property
+    def cache_dir_path(self) -> Path:
+        return self.app_dir_path / "cache"
+
     @property
     def user_config_file_path(self) -> str:
-        config_dir_str = click.get_app_dir("opendigger-pycli")
-        config_dir = Path(config_dir_str)
-        config_dir.mkdir(parents=True, exist_ok=True)
-        user_config = config_dir / "config.ini"
-        if not user_config.exists():
-            user_config.touch()
-        return str(user_config)
+        return self._user_config_file_path
 
     @property
     def default_config_file_path(self) -> str:
@@ -39,7 +88,26 @@ class OpenDiggerCliConfig:
     def config_file_paths(self) -> t.List[str]:
         return [str(self.default_config_file_path), str(self.user_config_file_path)]
 
+    def _user_config_mtime(self) -> t.Optional[int]:
+        try:
+            return os.stat(self.user_config_file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def is_stale(self) -> bool:
+        """Whether config.ini or the environment changed since loading"""
+        return (
+            self._user_config_mtime() != self.loaded_mtime
+            or read_env_overrides() != self.env_overrides
+        )
+
     def __load_config(self):
+        # Changes whenever the values may have changed, so that values
+        # computed from the config know when to compute them again
+        self.generation = next(_GENERATIONS)
+        # Taken before reading, a change while reading triggers a reload
+        self.loaded_mtime = self._user_config_mtime()
+        self.env_overrides = read_env_overrides()
         parser = configparser.RawConfigParser()
         parser.read(self.config_file_paths)
 
@@ -51,8 +119,11 @@ class OpenDiggerCliConfig:
             setattr(self, config_dataclass.config_name, config_dataclass())
             config_fields = fields(config_dataclass)
             for field in config_fields:
-                data = parser.get(
-                    config_dataclass.config_name, field.name, fallback=field.default
+                data = self.env_overrides.get(
+                    (config_dataclass.config_name, field.name),
+                    parser.get(
+                        config_dataclass.config_name, field.name, fallback=field.default
+                    ),
                 )
                 setattr(getattr(self, config_dataclass.config_name), field.name, data)
 
@@ -68,14 +139,19 @@ class OpenDiggerCliConfig:
             config = getattr(self, config_dataclass.config_name, config_dataclass())
             config_fields = fields(config_dataclass)
             for field in config_fields:
-                parser.set(
-                    config_dataclass.config_name,
-                    field.name,
-                    getattr(config, field.name),
+                value = getattr(config, field.name)
+                override = self.env_overrides.get(
+                    (config_dataclass.config_name, field.name)
                 )
+                if override is not None and value == override:
+                    # Keep secrets passed through the environment out of the file
+                    continue
+                parser.set(config_dataclass.config_name, field.name, value)
 
         with open(self.user_config_file_path, "w") as file:
             parser.write(file)
+        self.loaded_mtime = self._user_config_mtime()
+        self.generation = next(_GENERATIONS)
 
     def __rich_console__(
         self, console: "Console", options: "ConsoleOptions"
@@ -94,3 +170,32 @@ class OpenDiggerCliConfig:
             for field in config_fields:
                 table.add_row(field.name, getattr(config, field.name))
             yield table
+
+
+_CONFIG: t.Optional[OpenDiggerCliConfig] = None
+_CONFIG_CHECKED_AT = 0.0
+_CONFIG_LOCK = threading.Lock()
+
+
+def get_config(reload: bool = False) -> OpenDiggerCliConfig:
+    """The config shared by the whole process
+
+    It is loaded once, and loaded again when config.ini or the
+    ``OPENDIGGER_*`` environment variables change. Those are checked at most
+    every ``RELOAD_CHECK_INTERVAL`` seconds, so that reading a config value
+    costs no system call.
+    """
+    global _CONFIG, _CONFIG_CHECKED_AT
+    now = time.monotonic()
+    config = _CONFIG
+    if (
+        not reload
+        and config is not None
+        and now - _CONFIG_CHECKED_AT < RELOAD_CHECK_INTERVAL
+    ):
+        return config
+    with _CONFIG_LOCK:
+        if reload or _CONFIG is None or _CONFIG.is_stale():
+            _CONFIG = OpenDiggerCliConfig()
+        _CONFIG_CHECKED_AT = now
+        return _CONFIG
@@ -1,27 +1,90 @@
 from __future__ import annotations
+import functools
 import typing as t
 
-from .config import OpenDiggerCliConfig
+from .config import get_config
 
 if t.TYPE_CHECKING:
-    from opendigger_pycli.datatypes.config import UserInfoConfig
+    from pathlib import Path
+
+    from opendigger_pycli.datatypes.config import (
+        CacheConfig,
+        DataConfig,
+        HttpConfig,
+        SourceConfig,
+        UserInfoConfig,
+    )
+
+T = t.TypeVar("T")
+
+
+def cache_per_config(func: t.Callable[[], T]) -> t.Callable[[], T]:
+    """Cache the value of ``func`` until the config is reloaded or updated"""
+    cached: t.List[t.Tuple[int, T]] = []
+
+    @functools.wraps(func)
+    def wrapper() -> T:
+        generation = get_config().generation
+        if not cached or cached[0][0] != generation:
+            cached[:] = [(generation, func())]
+        return cached[0][1]
+
+    return wrapper
+
+
+def strip_config_value(value: str) -> str:
+    """Config values may be written with or without quotes in config.ini"""
+    return value.strip().strip('"').strip()
+
+
+def is_config_value_true(value: str) -> bool:
+    return strip_config_value(value).lower() not in ("false", "no", "off", "0", "")
+
+
+def is_config_value_set(value: str) -> bool:
+    return strip_config_value(value) not in ("", "None")
 
 
 def get_github_pat() -> str:
-    return OpenDiggerCliConfig().app_keys.github_pat
+    return strip_config_value(get_config().app_keys.github_pat)
 
 
 def has_github_pat() -> bool:
-    return get_github_pat() != "None"
+    return is_config_value_set(get_github_pat())
+
+
+def get_optional_github_pat() -> t.Optional[str]:
+    github_pat = get_github_pat()
+    return github_pat if is_config_value_set(github_pat) else None
 
 
 def get_user_info() -> UserInfoConfig:
-    return OpenDiggerCliConfig().user_info
+    return get_config().user_info
 
 
 def get_openai_api_key_from_config() -> str:
-    return OpenDiggerCliConfig().app_keys.openai_key
+    return strip_config_value(get_config().app_keys.openai_key)
 
 
 def has_openai_api_key() -> bool:
-    return get_openai_api_key_from_config() != "None"
+    return is_config_value_set(get_openai_api_key_from_config())
+
+
+def get_cache_config() -> CacheConfig:
+    return get_config().cache
+
+
+def get_cache_dir_path() -> Path:
+    return get_config().cache_dir_path
+
+
+def get_http_config() -> HttpConfig:
+    return get_config().http
+
+
+def get_source_config() -> SourceConfig:
+    return get_config().source
+
+
+def get_data_config() -> DataConfig:
+    return get_config().data
@@ -3,7 +3,6 @@ import typing as t
 from rich import box
 from rich.table import Table
 
-from opendigger_pycli.dataloaders import filter_dataloader
 from opendigger_pycli.utils import THREAD_POOL
 from opendigger_pycli.utils.gtihub_api import (
     RepoInfoType,
@@ -116,6 +115,8 @@ def print_indicator_info(
     table.add_column("Introducer", overflow="fold")
     table.add_column("Demo URL", overflow="fold")
 
+    from opendigger_pycli.dataloaders import filter_dataloader
+
     indicator_dataloaders = filter_dataloader({mode}, indicator_types, introducers)
     for indicator_dataloader in indicator_dataloaders:
         table.add_row(
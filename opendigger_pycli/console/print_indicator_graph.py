@@ -1,6 +1,6 @@
 import math
 import typing as t
-from functools import partial
+from functools import lru_cache, partial
 
 from rich.color import blend_rgb
 from rich.color_triplet import ColorTriplet
@@ -236,7 +236,8 @@ def print_heatmap(data: t.List[t.List[t.Union[int, float]]], *args, **kwargs):
         data[0]
     ) + row_label_width + 3 > console_width
 
-    # define color gradient
+    # define color gradient, most cells share a few values such as 0
+    @lru_cache(maxsize=1024)
     def get_color(val):
         linear_ratio = (val - min_val) / (max_val - min_val)
         enhanced_ratio = linear_ratio**0.5
@@ -293,7 +294,7 @@ def print_heatmap(data: t.List[t.List[t.Union[int, float]]], *args, **kwargs):
         CONSOLE.print()
 
 
-def print_base_data_graph(base_data_list: t.List["BaseData"], *args, **kwargs):
+def print_base_data_graph(base_data_list: t.Sequence["BaseData"], *args, **kwargs):
     base_data_list = [base_data for base_data in base_data_list if not base_data.is_raw]
     caption = kwargs.pop("caption", None)
     if caption:
@@ -328,50 +329,22 @@ def print_base_data_graph(base_data_list: t.List["BaseData"], *args, **kwargs):
         print_trivial_base_data_graph(base_data_list)
 
 
-def get_trivival_network_heatmap_data(
-    netwok_data: "BaseNetworkData",
+def get_network_heatmap_data(
+    network_data: "BaseNetworkData",
 ) -> t.Tuple[
     t.List[t.List[float]],
     t.List[t.Tuple[str, float]],
     t.List[t.Tuple[str, float]],
 ]:
-    node_names = [node.name for node in netwok_data.nodes]
-    node_values = [node.value for node in netwok_data.nodes]
-    nodes_length = len(node_names)
-
-    heatmap_data = [[0.0] * nodes_length for _ in range(nodes_length)]
-    row_labels = col_labels = t.cast(
-        t.List[t.Tuple[str, float]], list(zip(node_names, node_values))
-    )
-    for edge in netwok_data.edges:
-        heatmap_data[node_names.index(edge.name0)][
-            node_names.index(edge.name1)
-        ] = edge.value
-
+    graph = network_data.indexed
+    heatmap_data = graph.to_dense()
+    row_labels = col_labels = list(zip(graph.node_ids, graph.node_values))
     return heatmap_data, row_labels, col_labels
 
 
-def get_non_trivival_network_heatmap_data(
-    netwok_data: "BaseNetworkData",
-) -> t.Tuple[
-    t.List[t.List[float]],
-    t.List[t.Tuple[str, float]],
-    t.List[t.Tuple[str, float]],
-]:
-    node_names = [node["id"] for node in netwok_data.nodes]
-    node_values = [node["v"] for node in netwok_data.nodes]
-    nodes_length = len(node_names)
-
-    heatmap_data = [[0.0] * nodes_length for _ in range(nodes_length)]
-    row_labels = col_labels = t.cast(
-        t.List[t.Tuple[str, float]], list(zip(node_names, node_values))
-    )
-    for edge in netwok_data.edges:
-        heatmap_data[node_names.index(edge["s"])][node_names.index(edge["t"])] = edge[
-            "w"
-        ]
-
-    return heatmap_data, row_labels, col_labels
+# Both kinds of networks are indexed the same way
+get_trivival_network_heatmap_data = get_network_heatmap_data
+get_non_trivival_network_heatmap_data = get_network_heatmap_data
 
 
 def print_base_network_data_graph(network_data: "BaseNetworkData", *args, **kwargs):
@@ -379,19 +352,7 @@ def print_base_network_data_graph(network_data: "BaseNetworkData", *args, **kwar
     if caption:
         CONSOLE.print(f"[green]# {caption}", end="\n\n")
 
-    warm_up_data = network_data.nodes[0]
-    if hasattr(warm_up_data, "name"):
-        (
-            heatmap_data,
-            row_labels,
-            col_labels,
-        ) = get_trivival_network_heatmap_data(network_data)
-    else:
-        (
-            heatmap_data,
-            row_labels,
-            col_labels,
-        ) = get_non_trivival_network_heatmap_data(network_data)
+    heatmap_data, row_labels, col_labels = get_network_heatmap_data(network_data)
 
     print_heatmap(
         heatmap_data,
@@ -16,7 +16,7 @@ if t.TYPE_CHECKING:
     )
 
 
-def print_base_data_json(base_data_list: t.List["BaseData"], *args, **kwarg):
+def print_base_data_json(base_data_list: t.Sequence["BaseData"], *args, **kwarg):
     rows_data = []
     for data in base_data_list:
         value = str(data.value) if not if_prettey(data.value) else Pretty(data.value)
@@ -46,6 +46,9 @@ def print_time_duration_related_indicator_json(
 
 
 def print_base_network_data_json(network_data: "BaseNetworkData", *args, **kwargs):
-    from dataclasses import asdict
-
-    CONSOLE.print(asdict(network_data))
+    CONSOLE.print(
+        {
+            "nodes": list(network_data.sorted_nodes),
+            "edges": list(network_data.sorted_edges),
+        }
+    )
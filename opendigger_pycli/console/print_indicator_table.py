@@ -19,7 +19,7 @@ def print_table(table: "Table"):
     CONSOLE.print()
 
 
-def print_base_data_table(base_data_list: t.List["BaseData"], *args, **kwargs):
+def print_base_data_table(base_data_list: t.Sequence["BaseData"], *args, **kwargs):
     title = kwargs.pop("title", None)
     caption = kwargs.pop("caption", None)
 
@@ -59,8 +59,8 @@ def print_base_network_data_table(network_data: "BaseNetworkData", *args, **kwar
     table.add_column("nodes", overflow="fold")
     table.add_column("edges", overflow="fold")
     table.add_row(
-        pretty_repr(network_data.nodes, indent_size=2),
-        pretty_repr(network_data.edges, indent_size=2),
+        pretty_repr(list(network_data.sorted_nodes), indent_size=2),
+        pretty_repr(list(network_data.sorted_edges), indent_size=2),
     )
     print_table(table)
     CONSOLE.print()
@@ -1,38 +1,69 @@
-from .base import DATALOADERS, filter_dataloader
-from .indices import (
-    ActivityRepoDataloader,
-    ActivityUserDataLoader,
-    AttentionRepoDataloader,
-    OpenRankRepoDataloader,
-    OpenRankUserDataLoader,
-)
-from .metrics import (
-    AcceptedChangeRequestRepoDataloader,
-    ActiveDateAndTimeRepoDataloader,
-    AddedCodeChangeLineRepoDataloader,
-    BusFactorRepoDataloader,
-    ChangeRequestAgeRepoDataloader,
-    ChangeRequestRepoDataloader,
-    ChangeRequestResolutionDurationRepoDataloader,
-    ChangeRequestResponseTimeRepoDataloader,
-    ChangeRequestReviewRepoDataloader,
-    ClosedIssueRepoDataloader,
-    InactiveContributorRepoDataloader,
-    IssueAgeRepoDataloader,
-    IssueCommentRepoDataloader,
-    IssueResolutionDurationRepoDataloader,
-    IssueResponseTimeRepoDataloader,
-    NewContributorRepoDataloader,
-    NewIssueRepoDataloader,
-    ParticipantRepoDataloader,
-    RemovedCodeChangeLineRepoDataloader,
-    StarRepoDataloader,
-    TechnicalForkRepoDataloader,
-)
-from .networks import (
-    DeveloperNetworkRepoDataloader,
-    DeveloperNetworkUserDataloader,
-    ProjectOpenRankNetworkRepoDataloader,
-    RepoNetworkRepoDataloader,
-    RepoNetworkUserDataloader,
-)
+"""
+The OpenDigger dataloaders.
+
+They import requests and aiohttp, so the modules defining them are only
+imported once one of the names below is used. Submodules such as
+``source`` can be imported on their own without loading them.
+"""
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .base import (
+        ALL_INDICATOR_TYPES,
+        ALL_INTRODUCERS,
+        ALL_TYPES,
+        DATALOADER_INDEX,
+        DATALOADERS,
+        filter_dataloader,
+    )
+    from .indices import (
+        ActivityRepoDataloader,
+        ActivityUserDataLoader,
+        AttentionRepoDataloader,
+        OpenRankRepoDataloader,
+        OpenRankUserDataLoader,
+    )
+    from .metrics import (
+        AcceptedChangeRequestRepoDataloader,
+        ActiveDateAndTimeRepoDataloader,
+        AddedCodeChangeLineRepoDataloader,
+        BusFactorRepoDataloader,
+        ChangeRequestAgeRepoDataloader,
+        ChangeRequestRepoDataloader,
+        ChangeRequestResolutionDurationRepoDataloader,
+        ChangeRequestResponseTimeRepoDataloader,
+        ChangeRequestReviewRepoDataloader,
+        ClosedIssueRepoDataloader,
+        InactiveContributorRepoDataloader,
+        IssueAgeRepoDataloader,
+        IssueCommentRepoDataloader,
+        IssueResolutionDurationRepoDataloader,
+        IssueResponseTimeRepoDataloader,
+        NewContributorRepoDataloader,
+        NewIssueRepoDataloader,
+        ParticipantRepoDataloader,
+        RemovedCodeChangeLineRepoDataloader,
+        StarRepoDataloader,
+        TechnicalForkRepoDataloader,
+    )
+    from .networks import (
+        DeveloperNetworkRepoDataloader,
+        DeveloperNetworkUserDataloader,
+        ProjectOpenRankNetworkRepoDataloader,
+        RepoNetworkRepoDataloader,
+        RepoNetworkUserDataloader,
+    )
+
+_MODULES = ("base", "indices", "metrics", "networks")
+
+
+def __getattr__(name: str) -> t.Any:
+    # Importing all modules registers all dataloaders before any is used
+    modules = [importlib.import_module(f".{module}", __name__) for module in _MODULES]
+    for module in modules:
+        if name in vars(module):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,8 @@ import itertools
 import typing as t
 from collections import defaultdict
 
+from .utils import aload_with
+
 if t.TYPE_CHECKING:
     from opendigger_pycli.datatypes import DataloaderProto
 
@@ -19,6 +21,29 @@ DATALOADERS = DataLoadersType(
     network=defaultdict(list),
 )
 
+DataloaderKey = t.Tuple[
+    t.Literal["repo", "user"],
+    t.Literal["index", "metric", "network"],
+    t.Literal["X-lab", "CHAOSS"],
+]
+FilterKey = t.Tuple[t.FrozenSet[str], t.FrozenSet[str], t.FrozenSet[str]]
+
+ALL_TYPES: t.FrozenSet[t.Literal["repo", "user"]] = frozenset(["repo", "user"])
+ALL_INDICATOR_TYPES: t.FrozenSet[t.Literal["index", "metric", "network"]] = frozenset(
+    ["index", "metric", "network"]
+)
+ALL_INTRODUCERS: t.FrozenSet[t.Literal["X-lab", "CHAOSS"]] = frozenset(
+    ["X-lab", "CHAOSS"]
+)
+
+# The shared instance of every registered dataloader, by its
+# (type, indicator_type, introducer), built once at registration
+DATALOADER_INDEX: t.Dict[DataloaderKey, t.List["DataloaderProto"]] = defaultdict(list)
+# Where each dataloader comes in the order of DATALOADERS
+_SORT_KEYS: t.Dict[int, t.Tuple[int, int, int]] = {}
+# Results of filter_dataloader, cleared when a dataloader is registered
+_FILTERED: t.Dict[FilterKey, t.Tuple["DataloaderProto", ...]] = {}
+
 
 T = t.TypeVar("T")
 
@@ -30,51 +55,55 @@ def register_dataloader(
         t.Type["BaseOpenRankNetworkDataloader"],
     ]
 ):
-    DATALOADERS[cls.indicator_type][cls.name].append(
-        t.cast(t.Type["DataloaderProto"], cls)
+    indicator_dict = DATALOADERS[cls.indicator_type]
+    indicator_dict[cls.name].append(t.cast(t.Type["DataloaderProto"], cls))
+
+    # Dataloaders keep no per-query state, one instance serves every query
+    dataloader = t.cast("DataloaderProto", cls())
+    DATALOADER_INDEX[(cls.type, cls.indicator_type, cls.introducer)].append(dataloader)
+    _SORT_KEYS[id(dataloader)] = (
+        list(DATALOADERS).index(cls.indicator_type),
+        list(indicator_dict).index(cls.name),
+        len(_SORT_KEYS),
     )
+    _FILTERED.clear()
     return cls
 
 
 def filter_dataloader(
-    types: t.Set[t.Literal["repo", "user"]],
-    indicator_types: t.Set[t.Literal["index", "metric", "network"]],
-    introducers: t.Set[t.Literal["X-lab", "CHAOSS"]],
+    types: t.AbstractSet[t.Literal["repo", "user"]],
+    indicator_types: t.AbstractSet[t.Literal["index", "metric", "network"]],
+    introducers: t.AbstractSet[t.Literal["X-lab", "CHAOSS"]],
 ) -> t.Iterator["DataloaderProto"]:
-    indicator_dicts: t.List[t.Dict[str, t.List[t.Type["DataloaderProto"]]]] = list(
-        t.cast(
-            t.ValuesView,
-            DATALOADERS.values(),
-        )
-    )
-    indicator_dataloaders = itertools.chain.from_iterable(
-        itertools.chain.from_iterable(
-            [
-                [
-                    indicator_dataloader()
-                    for indicator_dataloader in indicator_dataloaders
-                    if (
-                        indicator_dataloader.type in types
-                        and not indicator_types
-                        and indicator_dataloader.introducer in introducers
-                    )
-                    or (
-                        indicator_dataloader.type in types
-                        and indicator_dataloader.indicator_type in indicator_types
-                        and not introducers
-                    )
-                    or (
-                        indicator_dataloader.type in types
-                        and indicator_dataloader.indicator_type in indicator_types
-                        and indicator_dataloader.introducer in introducers
-                    )
-                ]
-                for indicator_dataloaders in indicator_dict.values()
-            ]
-            for indicator_dict in indicator_dicts
-        )
+    """Yield the shared dataloaders matching all the given sets
+
+    An empty ``indicator_types`` or ``introducers`` matches everything,
+    but not both at once. Dataloaders come in the order of DATALOADERS.
+    """
+    key: FilterKey = (
+        frozenset(types),
+        frozenset(indicator_types),
+        frozenset(introducers),
     )
-    return indicator_dataloaders
+    dataloaders = _FILTERED.get(key)
+    if dataloaders is None:
+        dataloaders = ()
+        if indicator_types or introducers:
+            dataloaders = tuple(
+                sorted(
+                    itertools.chain.from_iterable(
+                        DATALOADER_INDEX.get(index_key, ())
+                        for index_key in itertools.product(
+                            types,
+                            indicator_types or ALL_INDICATOR_TYPES,
+                            introducers or ALL_INTRODUCERS,
+                        )
+                    ),
+                    key=lambda dataloader: _SORT_KEYS[id(dataloader)],
+                )
+            )
+        _FILTERED[key] = dataloaders
+    return iter(dataloaders)
 
 
 class BaseRepoDataloader(abc.ABC):
@@ -96,6 +125,9 @@ class BaseRepoDataloader(abc.ABC):
     def load(self, org: str, repo: str):
         pass
 
+    async def aload(self, org: str, repo: str):
+        return await aload_with(self.load, org, repo)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -119,6 +151,9 @@ class BaseOpenRankNetworkDataloader(abc.ABC):
     def load(self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]):
         pass
 
+    async def aload(self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]):
+        return await aload_with(self.load, org, repo, dates)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
 
@@ -139,5 +174,8 @@ class BaseUserDataloader(abc.ABC):
     def load(self, username: str):
         pass
 
+    async def aload(self, username: str):
+        return await aload_with(self.load, username)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
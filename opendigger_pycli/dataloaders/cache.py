@@ -0,0 +1,373 @@
+"""
+On-disk cache for the indicator files fetched from OpenDigger.
+
+Response bodies are stored as plain files under the cache directory, while an
+SQLite index keeps their validators (ETag/Last-Modified), size and access
+time. SQLite takes care of the locking, so several CLI processes can share one
+cache directory. Bodies are written to a temporary file and renamed into
+place, and every write gets a fresh file name, so a reader never sees a
+half-written body and eviction never removes a newer copy of the same URL.
+Bodies are stored compressed with a dictionary trained on earlier bodies
+(see ``opendigger_pycli.utils.compression``) and sizes count the bytes on
+disk.
+
+URLs that answered 404 are remembered in a separate table for
+``missing_ttl`` seconds, so that indicators a repo does not have are not
+requested again on every run. An in-memory Bloom filter in front of that
+table answers the common "not missing" case without touching SQLite.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from opendigger_pycli.config.utils import (
+    cache_per_config,
+    get_cache_config,
+    get_cache_dir_path,
+    is_config_value_true,
+    strip_config_value,
+)
+from opendigger_pycli.utils.bloom import BloomFilter
+from opendigger_pycli.utils.compression import BodyCodec
+from opendigger_pycli.utils.files import write_file_atomic
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO usage (id, total_size) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN
+    UPDATE usage SET total_size = total_size + new.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN
+    UPDATE usage SET total_size = total_size - old.size WHERE id = 0;
+END;
+CREATE TABLE IF NOT EXISTS missing (
+    url TEXT PRIMARY KEY,
+    checked_at REAL NOT NULL
+);
+"""
+
+_MB = 1024 * 1024
+_HOUR = 60 * 60
+# Number of missing urls the Bloom filter is sized for
+MISSING_FILTER_CAPACITY = 1_000_000
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    url: str
+    filename: str
+    etag: t.Optional[str]
+    last_modified: t.Optional[str]
+    size: int
+    fetched_at: float
+    accessed_at: float
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    cache_dir: Path
+    entries: int
+    total_size: int
+    max_size: int
+    missing: int
+
+
+class HttpCache:
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size: int,
+        ttl: float,
+        missing_ttl: float = 6 * _HOUR,
+        compress: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.body_dir = self.cache_dir / "bodies"
+        self.max_size = max_size
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = BodyCodec(self.cache_dir / "dicts", compress=compress)
+        self._local = threading.local()
+        self._missing_lock = threading.Lock()
+        self._missing_filter: t.Optional[BloomFilter] = None
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.cache_dir / "index.db"), timeout=30, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _body_path(self, filename: str) -> Path:
+        return self.body_dir / filename[:2] / filename
+
+    def _new_filename(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return f"{digest}-{os.urandom(4).hex()}"
+
+    def _unlink(self, filenames: t.Iterable[str]) -> None:
+        for filename in filenames:
+            try:
+                self._body_path(filename).unlink()
+            except OSError:
+                # Already removed by another process
+                continue
+
+    def lookup(self, url: str) -> t.Optional[CacheEntry]:
+        row = self._conn.execute(
+            "SELECT url, filename, etag, last_modified, size, fetched_at, "
+            "accessed_at FROM entries WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(*row)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def conditional_headers(self, entry: t.Optional[CacheEntry]) -> t.Dict[str, str]:
+        headers: t.Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def open_body(self, entry: CacheEntry) -> t.Optional[t.Iterator[bytes]]:
+        """Return the decompressed chunks of a body, None if it was evicted"""
+        try:
+            f = self._body_path(entry.filename).open("rb")
+        except OSError:
+            # The body was evicted under us, forget the stale index row
+            self._conn.execute(
+                "DELETE FROM entries WHERE url = ? AND filename = ?",
+                (entry.url, entry.filename),
+            )
+            return None
+        self._conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE url = ?",
+            (time.time(), entry.url),
+        )
+        return self.codec.read_file(f)
+
+    def read(self, entry: CacheEntry) -> t.Optional[bytes]:
+        chunks = self.open_body(entry)
+        if chunks is None:
+            return None
+        return b"".join(chunks)
+
+    def revalidate(self, entry: CacheEntry) -> None:
+        """Mark an entry as fresh again after a ``304 Not Modified``"""
+        now = time.time()
+        self._conn.execute(
+            "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+            (now, now, entry.url),
+        )
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+    ) -> None:
+        filename = self._new_filename(url)
+        size = self.codec.write(self._body_path(filename), body)
+        self._insert(url, filename, size, etag, last_modified)
+
+    def store_stream(
+        self,
+        url: str,
+        chunks: t.Iterable[bytes],
+        etag: t.Optional[str] = None,
+        last_modified: t.Optional[str] = None,
+    ) -> t.Iterator[bytes]:
+        """Pass the chunks of a body through while writing them to the cache
+
+        The entry is added once the last chunk has been read, so a body
+        that is not read to the end is never cached.
+        """
+        filename = self._new_filename(url)
+        size = yield from self.codec.write_stream(self._body_path(filename), chunks)
+        self._insert(url, filename, size, etag, last_modified)
+
+    def _insert(
+        self,
+        url: str,
+        filename: str,
+        size: int,
+        etag: t.Optional[str],
+        last_modified: t.Optional[str],
+    ) -> None:
+        now = time.time()
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT filename FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            conn.execute("DELETE FROM missing WHERE url = ?", (url,))
+            conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, filename, etag, last_modified, size, now, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if row is not None:
+            self._unlink([row[0]])
+
+        if self.total_size() > self.max_size:
+            self.prune()
+
+    def _get_missing_filter(self) -> BloomFilter:
+        # Called with _missing_lock held
+        if self._missing_filter is None:
+            rows = self._conn.execute(
+                "SELECT url FROM missing WHERE checked_at > ?",
+                (time.time() - self.missing_ttl,),
+            ).fetchall()
+            self._missing_filter = BloomFilter(
+                max(MISSING_FILTER_CAPACITY, 2 * len(rows))
+            )
+            for (url,) in rows:
+                self._missing_filter.add(url)
+        return self._missing_filter
+
+    def has_missing(self) -> bool:
+        return (
+            self._conn.execute("SELECT 1 FROM missing LIMIT 1").fetchone() is not None
+        )
+
+    def is_missing(self, url: str) -> bool:
+        """Whether the url answered 404 less than ``missing_ttl`` seconds ago"""
+        with self._missing_lock:
+            if url not in self._get_missing_filter():
+                return False
+        # The filter can give false positives, the table has the final say
+        row = self._conn.execute(
+            "SELECT checked_at FROM missing WHERE url = ?", (url,)
+        ).fetchone()
+        return row is not None and time.time() - row[0] < self.missing_ttl
+
+    def mark_missing(self, url: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO missing VALUES (?, ?)", (url, time.time())
+        )
+        with self._missing_lock:
+            self._get_missing_filter().add(url)
+
+    def total_size(self) -> int:
+        return self._conn.execute(
+            "SELECT total_size FROM usage WHERE id = 0"
+        ).fetchone()[0]
+
+    def prune(self, max_size: t.Optional[int] = None) -> t.Tuple[int, int]:
+        """Evict least recently used entries until the cache fits in max_size
+
+        Returns the number of evicted entries and the number of freed bytes.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        conn = self._conn
+        evicted: t.List[t.Tuple[str, str, int]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            total_size = self.total_size()
+            cursor = conn.execute(
+                "SELECT url, filename, size FROM entries ORDER BY accessed_at"
+            )
+            for url, filename, size in cursor:
+                if total_size <= max_size:
+                    break
+                evicted.append((url, filename, size))
+                total_size -= size
+            cursor.close()
+            conn.executemany(
+                "DELETE FROM entries WHERE url = ?", [(url,) for url, _, _ in evicted]
+            )
+            conn.execute(
+                "DELETE FROM missing WHERE checked_at <= ?",
+                (time.time() - self.missing_ttl,),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._unlink(filename for _, filename, _ in evicted)
+        return len(evicted), sum(size for _, _, size in evicted)
+
+    def clear(self) -> t.Tuple[int, int]:
+        self._conn.execute("DELETE FROM missing")
+        with self._missing_lock:
+            self._missing_filter = None
+        return self.prune(max_size=0)
+
+    def stats(self) -> CacheStats:
+        entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        missing = self._conn.execute(
+            "SELECT COUNT(*) FROM missing WHERE checked_at > ?",
+            (time.time() - self.missing_ttl,),
+        ).fetchone()[0]
+        return CacheStats(
+            cache_dir=self.cache_dir,
+            entries=entries,
+            total_size=self.total_size(),
+            max_size=self.max_size,
+            missing=missing,
+        )
+
+
+def open_http_cache() -> HttpCache:
+    """Open the cache directory configured in the ``cache`` config section"""
+    cache_config = get_cache_config()
+    return HttpCache(
+        get_cache_dir_path(),
+        max_size=int(float(strip_config_value(cache_config.max_size_mb)) * _MB),
+        ttl=float(strip_config_value(cache_config.ttl_hours)) * _HOUR,
+        missing_ttl=float(strip_config_value(cache_config.missing_ttl_hours)) * _HOUR,
+        compress=is_config_value_true(cache_config.compress),
+    )
+
+
+@cache_per_config
+def get_http_cache() -> t.Optional[HttpCache]:
+    """Return the process-wide cache, or None if caching is disabled"""
+    cache_config = get_cache_config()
+    if not is_config_value_true(cache_config.enabled):
+        return None
+    return open_http_cache()
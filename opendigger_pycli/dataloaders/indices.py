@@ -12,6 +12,7 @@ from .utils import (
     get_developer_data,
     get_repo_data,
     load_base_data,
+    load_number_data,
     load_name_and_value,
 )
 
@@ -40,7 +41,7 @@ class OpenRankRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=OpenRankData(value=load_base_data(data, float)),
+            data=OpenRankData(value=load_number_data(data, float)),
             desc="",
         )
 
@@ -67,7 +68,7 @@ class ActivityRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=ActivityData(
-                value=load_base_data(data, float),
+                value=load_number_data(data, float),
             ),
             desc="",
         )
@@ -95,7 +96,7 @@ class AttentionRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=AttentionData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -120,7 +121,7 @@ class OpenRankUserDataLoader(BaseUserDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=OpenRankData(value=load_base_data(data, float)),
+            data=OpenRankData(value=load_number_data(data, float)),
             desc="",
         )
 
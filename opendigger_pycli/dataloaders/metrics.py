@@ -31,6 +31,7 @@ from .base import BaseRepoDataloader, register_dataloader
 from .utils import (
     get_repo_data,
     load_base_data,
+    load_number_data,
     load_name_and_value,
     load_non_trival_indicator_data,
 )
@@ -86,7 +87,7 @@ class StarRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=StarData(value=load_base_data(data, int)),
+            data=StarData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -110,7 +111,7 @@ class TechnicalForkRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=TechnicalForkData(value=load_base_data(data, int)),
+            data=TechnicalForkData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -134,7 +135,7 @@ class ParticipantRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=ParticipantData(value=load_base_data(data, int)),
+            data=ParticipantData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -186,7 +187,7 @@ class InactiveContributorRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=InactiveContributorData(value=load_base_data(data, int)),
+            data=InactiveContributorData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -240,7 +241,7 @@ class NewIssueRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=NewIssueData(value=load_base_data(data, int)),
+            data=NewIssueData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -265,7 +266,7 @@ class ClosedIssueRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=ClosedIssueData(value=load_base_data(data, int)),
+            data=ClosedIssueData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -290,7 +291,7 @@ class IssueCommentRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=IssueCommentData(value=load_base_data(data, int)),
+            data=IssueCommentData(value=load_number_data(data, int)),
             desc="",
         )
 
@@ -399,7 +400,7 @@ class AddedCodeChangeLineRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=AddedCodeChangeLineData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -426,7 +427,7 @@ class RemovedCodeChangeLineRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=RemovedCodeChangeLineData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -453,7 +454,7 @@ class SummedCodeChangeLineRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=SumCodeChangeLineData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -480,7 +481,7 @@ class ChangeRequestRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=ChangeRequestData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -507,7 +508,7 @@ class AcceptedChangeRequestRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=AcceptedChangeRequestData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -534,7 +535,7 @@ class ChangeRequestReviewRepoDataloader(BaseRepoDataloader):
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=ChangeRequestReviewData(
-                value=load_base_data(data, int),
+                value=load_number_data(data, int),
             ),
             desc="",
         )
@@ -0,0 +1,192 @@
+"""
+Bulk download of the OpenDigger dataset into a local mirror directory.
+
+The mirror is laid out like the URL tree below ``BASE_API_URL``, so that it
+can be read back with ``opendigger --mirror``. Files are written atomically,
+and every finished target is appended to a checkpoint file in the mirror, so
+an interrupted sync resumes with the first unfinished target. Unless
+``compress`` is False, files are stored compressed (see ``get_mirror_codec``).
+"""
+import asyncio
+import hashlib
+import time
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from opendigger_pycli.utils import aio_http
+
+from .source import get_mirror_codec
+from .utils import BASE_API_URL, record_urls
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.datatypes import DataloaderProto
+
+
+@dataclass
+class SyncStats:
+    targets: int = 0
+    resumed: int = 0
+    files: int = 0
+    bytes: int = 0
+    existing: int = 0
+    missing: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.perf_counter() - self.started_at, 1e-9)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / self.elapsed / (1024 * 1024)
+
+
+def get_mirror_path(mirror_dir: Path, url: str) -> Path:
+    return mirror_dir / url.split(BASE_API_URL, 1)[1]
+
+
+class MirrorSync:
+    def __init__(
+        self,
+        mirror_dir: Path,
+        dataloaders: t.List["DataloaderProto"],
+        dates: t.Optional[t.List[t.Tuple[int, int]]] = None,
+        jobs: int = 64,
+        force: bool = False,
+        compress: bool = True,
+        on_progress: t.Optional[t.Callable[[SyncStats], None]] = None,
+    ) -> None:
+        self.mirror_dir = Path(mirror_dir)
+        self.dataloaders = dataloaders
+        self.dates = sorted(set(dates or []))
+        self.jobs = jobs
+        self.force = force
+        self.on_progress = on_progress
+        self.codec = get_mirror_codec(self.mirror_dir, compress)
+        self.stats = SyncStats()
+
+    @property
+    def checkpoint_path(self) -> Path:
+        # One checkpoint per selection of indicators and months, so that a
+        # sync of other indicators does not skip the targets of this one
+        spec = ",".join(sorted(dataloader.name for dataloader in self.dataloaders))
+        spec += ";" + ",".join(f"{year}-{month:02}" for year, month in self.dates)
+        digest = hashlib.sha1(spec.encode("utf-8")).hexdigest()[:12]
+        return self.mirror_dir / f".sync-{digest}.checkpoint"
+
+    def read_checkpoint(self) -> t.Set[str]:
+        if self.force or not self.checkpoint_path.exists():
+            return set()
+        return set(self.checkpoint_path.read_text(encoding="utf-8").split())
+
+    def get_target_urls(self, target: str) -> t.List[str]:
+        if "/" in target:
+            target_type = "repo"
+            args: t.Tuple[str, ...] = tuple(target.split("/", 1))
+        else:
+            target_type = "user"
+            args = (target,)
+
+        urls: t.Dict[str, None] = {}
+        for dataloader in self.dataloaders:
+            if dataloader.type != target_type:
+                continue
+            if not dataloader.pass_date:
+                urls.update(dict.fromkeys(record_urls(dataloader.load, *args)))
+            elif self.dates:
+                urls.update(
+                    dict.fromkeys(record_urls(dataloader.load, *args, self.dates))
+                )
+        return list(urls)
+
+    async def _sync_url(self, url: str) -> bool:
+        """Download one file, return False if it should be retried later"""
+        path = get_mirror_path(self.mirror_dir, url)
+        if not self.force and path.exists():
+            self.stats.existing += 1
+            return True
+        try:
+            r = await aio_http.get(url)
+        except Exception:
+            self.stats.failed += 1
+            return False
+        if r.status_code == 404:
+            self.stats.missing += 1
+            return True
+        if r.status_code != 200:
+            self.stats.failed += 1
+            return False
+        try:
+            self.codec.write(path, r.content)
+        except OSError:
+            self.stats.failed += 1
+            return False
+        self.stats.files += 1
+        self.stats.bytes += len(r.content)
+        return True
+
+    async def run(self, targets: t.Iterable[str]) -> SyncStats:
+        self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        finished_targets = self.read_checkpoint()
+        remaining: t.Dict[str, int] = {}
+        failed_targets: t.Set[str] = set()
+        queue: "asyncio.Queue[t.Optional[t.Tuple[str, str]]]" = asyncio.Queue(
+            maxsize=self.jobs * 4
+        )
+
+        with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint:
+
+            def finish_target(target: str) -> None:
+                self.stats.targets += 1
+                if target not in failed_targets:
+                    checkpoint.write(f"{target}\n")
+                    checkpoint.flush()
+                if self.on_progress is not None:
+                    self.on_progress(self.stats)
+
+            async def worker() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    target, url = item
+                    if not await self._sync_url(url):
+                        failed_targets.add(target)
+                    if self.on_progress is not None:
+                        self.on_progress(self.stats)
+                    remaining[target] -= 1
+                    if remaining[target] == 0:
+                        del remaining[target]
+                        finish_target(target)
+
+            async with aio_http.session_scope():
+                workers = [asyncio.ensure_future(worker()) for _ in range(self.jobs)]
+                try:
+                    for target in targets:
+                        if target in remaining:
+                            continue
+                        if target in finished_targets:
+                            self.stats.resumed += 1
+                            if self.on_progress is not None:
+                                self.on_progress(self.stats)
+                            continue
+                        urls = self.get_target_urls(target)
+                        if not urls:
+                            finish_target(target)
+                            continue
+                        remaining[target] = len(urls)
+                        for url in urls:
+                            await queue.put((target, url))
+                    for _ in workers:
+                        await queue.put(None)
+                    await asyncio.gather(*workers)
+                finally:
+                    for worker_task in workers:
+                        worker_task.cancel()
+        return self.stats
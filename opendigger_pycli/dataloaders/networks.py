@@ -15,10 +15,13 @@ from .base import (
     register_dataloader,
 )
 from .utils import (
+    DECODE_ERRORS,
+    FETCH_ERRORS,
+    decode_network_data,
+    decode_openrank_network_data,
+    describe_fetch_error,
     get_developer_data,
     get_repo_data,
-    load_network_data,
-    load_openrank_network_data,
 )
 
 if t.TYPE_CHECKING:
@@ -33,7 +36,9 @@ class DeveloperNetworkRepoDataloader(BaseRepoDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/developer_network.json"
 
     def load(self, org: str, repo: str) -> DataloaderResult[DeveloperNetworkData]:
-        data = get_repo_data(org, repo, DeveloperNetworkData.name)
+        data = get_repo_data(
+            org, repo, DeveloperNetworkData.name, decode=decode_network_data
+        )
         if data is None:
             return DataloaderResult(
                 is_success=False,
@@ -44,7 +49,7 @@ class DeveloperNetworkRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=DeveloperNetworkData(value=load_network_data(data)),
+            data=DeveloperNetworkData(value=data),
             desc="",
         )
 
@@ -57,7 +62,9 @@ class RepoNetworkRepoDataloader(BaseRepoDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/repo_network.json"
 
     def load(self, org: str, repo: str) -> DataloaderResult[RepoNetworkData]:
-        data = get_repo_data(org, repo, RepoNetworkData.name)
+        data = get_repo_data(
+            org, repo, RepoNetworkData.name, decode=decode_network_data
+        )
         if data is None:
             return DataloaderResult(
                 is_success=False,
@@ -68,7 +75,7 @@ class RepoNetworkRepoDataloader(BaseRepoDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=RepoNetworkData(value=load_network_data(data)),
+            data=RepoNetworkData(value=data),
             desc="",
         )
 
@@ -82,27 +89,49 @@ class ProjectOpenRankNetworkRepoDataloader(BaseOpenRankNetworkDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/X-lab2017/open-digger/project_openrank_detail/2022-12.json"
     pass_date = True
 
+    def _load_date(
+        self, org: str, repo: str, date: t.Tuple[int, int]
+    ) -> t.Tuple[BaseData, t.Optional[str]]:
+        """Return the data of a month and why it failed to load, if it did"""
+        year, month = date
+        try:
+            value = get_repo_data(
+                org,
+                repo,
+                ProjectOpenRankNetworkData.name,
+                date,
+                decode=decode_openrank_network_data,
+            )
+        except FETCH_ERRORS as e:
+            error = describe_fetch_error(e)
+            return BaseData(year=int(year), month=int(month), value=None), error
+        except DECODE_ERRORS:
+            error = "Failed to load data"
+            return BaseData(year=int(year), month=int(month), value=None), error
+        return BaseData(year=int(year), month=int(month), value=value), None
+
     def load(
         self, org: str, repo: str, dates: t.List[t.Tuple[int, int]]
     ) -> DataloaderResult[ProjectOpenRankNetworkData]:
-        values = []
-        for date in dates:
-            data = get_repo_data(org, repo, ProjectOpenRankNetworkData.name, date)
-            year, month = date
-            values.append(
-                BaseData(
-                    year=int(year),
-                    month=int(month),
-                    value=load_openrank_network_data(data)
-                    if data is not None
-                    else None,
+        # The query schedules one job per month, so months are downloaded
+        # in parallel there and a single call loads them one by one
+        loaded = [self._load_date(org, repo, date) for date in sorted(set(dates))]
+
+        values = [value for value, _ in loaded]
+        failed_dates: t.Dict[str, t.List[str]] = {}
+        for value, error in loaded:
+            if error is not None:
+                failed_dates.setdefault(error, []).append(
+                    f"{value.year}-{value.month:02}"
                 )
-            )
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
             data=ProjectOpenRankNetworkData(value=values),
-            desc="",
+            desc="; ".join(
+                f"{error} in {', '.join(dates)}"
+                for error, dates in failed_dates.items()
+            ),
         )
 
 
@@ -116,7 +145,9 @@ class DeveloperNetworkUserDataloader(BaseUserDataloader):
     )
 
     def load(self, username: str) -> DataloaderResult[DeveloperNetworkData]:
-        data = get_developer_data(username, DeveloperNetworkData.name)
+        data = get_developer_data(
+            username, DeveloperNetworkData.name, decode=decode_network_data
+        )
         if data is None:
             return DataloaderResult(
                 is_success=False,
@@ -127,7 +158,7 @@ class DeveloperNetworkUserDataloader(BaseUserDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=DeveloperNetworkData(value=load_network_data(data)),
+            data=DeveloperNetworkData(value=data),
             desc="",
         )
 
@@ -140,7 +171,9 @@ class RepoNetworkUserDataloader(BaseUserDataloader):
     demo_url = "https://oss.x-lab.info/open_digger/github/frank-zsy/repo_network.json"
 
     def load(self, username: str) -> DataloaderResult[RepoNetworkData]:
-        data = get_developer_data(username, RepoNetworkData.name)
+        data = get_developer_data(
+            username, RepoNetworkData.name, decode=decode_network_data
+        )
         if data is None:
             return DataloaderResult(
                 is_success=False,
@@ -151,6 +184,6 @@ class RepoNetworkUserDataloader(BaseUserDataloader):
         return DataloaderResult(
             is_success=True,
             dataloader=t.cast("DataloaderProto", self),
-            data=RepoNetworkData(value=load_network_data(data)),
+            data=RepoNetworkData(value=data),
             desc="",
         )
@@ -0,0 +1,79 @@
+"""
+Where the dataloaders read the OpenDigger dataset from.
+
+By default indicator files are downloaded from OpenDigger. A mirror
+directory laid out like the URL tree below ``BASE_API_URL`` can be used
+instead, e.g. ``<mirror_dir>/X-lab2017/open-digger/openrank.json``. In
+offline mode without a mirror, only the on-disk cache is read. In both
+local modes no request is ever sent.
+
+Files written by ``opendigger mirror sync`` are compressed with a
+dictionary kept in ``<mirror_dir>/.dicts``, plain JSON files are read too.
+"""
+import functools
+import typing as t
+from pathlib import Path
+
+from opendigger_pycli.config.utils import (
+    get_source_config,
+    is_config_value_true,
+    strip_config_value,
+)
+
+if t.TYPE_CHECKING:
+    from opendigger_pycli.utils.compression import BodyCodec
+
+MIRROR_DICT_DIR = ".dicts"
+
+
+class DataSource(t.NamedTuple):
+    mirror_dir: t.Optional[Path]
+    offline: bool
+
+    @property
+    def is_local(self) -> bool:
+        return self.offline or self.mirror_dir is not None
+
+
+_DATA_SOURCE: t.Optional[DataSource] = None
+
+
+def load_data_source() -> DataSource:
+    """Read the data source from the ``source`` config section"""
+    source_config = get_source_config()
+    mirror_dir = strip_config_value(source_config.mirror_dir)
+    return DataSource(
+        mirror_dir=None if mirror_dir in ("", "None") else Path(mirror_dir),
+        offline=is_config_value_true(source_config.offline),
+    )
+
+
+def get_data_source() -> DataSource:
+    global _DATA_SOURCE
+    if _DATA_SOURCE is None:
+        _DATA_SOURCE = load_data_source()
+    return _DATA_SOURCE
+
+
+def set_data_source(
+    mirror_dir: t.Optional[Path] = None, offline: t.Optional[bool] = None
+) -> DataSource:
+    """Override the configured data source, e.g. from command line options"""
+    global _DATA_SOURCE
+    source = get_data_source()
+    _DATA_SOURCE = DataSource(
+        mirror_dir=source.mirror_dir if mirror_dir is None else Path(mirror_dir),
+        offline=source.offline if offline is None else offline,
+    )
+    return _DATA_SOURCE
+
+
+def is_offline() -> bool:
+    return get_data_source().is_local
+
+
+@functools.lru_cache(maxsize=None)
+def get_mirror_codec(mirror_dir: Path, compress: bool = True) -> "BodyCodec":
+    from opendigger_pycli.utils.compression import BodyCodec
+
+    return BodyCodec(Path(mirror_dir) / MIRROR_DICT_DIR, compress=compress)
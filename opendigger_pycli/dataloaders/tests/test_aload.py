@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+from opendigger_pycli.dataloaders import utils
+from opendigger_pycli.dataloaders.indices import OpenRankRepoDataloader
+from opendigger_pycli.dataloaders.networks import ProjectOpenRankNetworkRepoDataloader
+from opendigger_pycli.utils.rate_limit import HostUnavailableError
+
+from . import TEST_ORG, TEST_REPO
+
+
+def test_aload_prefetches_urls(monkeypatch):
+    fetched_rounds = []
+
+    async def fake_afetch_body(url):
+        fetched_rounds[-1].append(url)
+        if url.endswith("openrank.json"):
+            return b'{"2023-01": 1.5, "2023-02": 2.5}'
+        if url.endswith("2023-02.json"):
+            raise HostUnavailableError("oss.x-lab.info", "boom")
+        return (
+            b'{"nodes": [{"id": "a", "n": "a", "c": "u", "i": 1, "r": 1, "v": 1}],'
+            b' "links": []}'
+        )
+
+    original_gather = asyncio.gather
+
+    def counting_gather(*aws, **kwargs):
+        fetched_rounds.append([])
+        return original_gather(*aws, **kwargs)
+
+    monkeypatch.setattr(utils, "afetch_body", fake_afetch_body)
+    monkeypatch.setattr(utils.asyncio, "gather", counting_gather)
+
+    result = asyncio.run(OpenRankRepoDataloader().aload(TEST_ORG, TEST_REPO))
+    assert result.is_success
+    assert [d.value for d in result.data.value] == [1.5, 2.5]
+    assert len(fetched_rounds) == 1
+
+    fetched_rounds.clear()
+    result = asyncio.run(
+        ProjectOpenRankNetworkRepoDataloader().aload(
+            TEST_ORG, TEST_REPO, [(2023, 1), (2023, 2), (2023, 3)]
+        )
+    )
+    # All months are downloaded in a single round
+    assert len(fetched_rounds) == 1
+    assert len(fetched_rounds[0]) == 3
+    assert result.data.value[1].value is None
+    assert result.desc == (
+        "oss.x-lab.info is unavailable: boom, try again later in 2023-02"
+    )
+
+
+def test_aload_runs_load_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def load(name):
+        threads.append(threading.get_ident())
+        return utils.fetch_json(f"{utils.BASE_API_URL}{name}.json")
+
+    async def fake_afetch_body(url):
+        return b'{"2023-01": 1.5}'
+
+    async def main():
+        return threading.get_ident(), await utils.aload_with(load, "openrank")
+
+    monkeypatch.setattr(utils, "afetch_body", fake_afetch_body)
+    loop_thread, data = asyncio.run(main())
+
+    assert data == {"2023-01": 1.5}
+    # Both passes of load, recording the url then decoding it
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_urls_recorded_once_per_load():
+    calls = []
+
+    def load(org, repo, dates):
+        calls.append((org, repo, dates))
+        for date in dates:
+            utils.get_repo_data(org, repo, "project_openrank_detail", date)
+
+    assert utils.get_urls(load, "X-lab2017", "open-digger", [(2023, 1)]) == [
+        f"{utils.BASE_API_URL}X-lab2017/open-digger/project_openrank_detail/2023-01.json"
+    ]
+    assert utils.get_urls(load, "a", "b", [(2022, 11), (2022, 12)]) == [
+        f"{utils.BASE_API_URL}a/b/project_openrank_detail/2022-11.json",
+        f"{utils.BASE_API_URL}a/b/project_openrank_detail/2022-12.json",
+    ]
+    assert utils.get_urls(load, "c", "d", [(2021, 6)]) == [
+        f"{utils.BASE_API_URL}c/d/project_openrank_detail/2021-06.json"
+    ]
+    # Once for one date and once for two dates, with placeholders
+    assert len(calls) == 2
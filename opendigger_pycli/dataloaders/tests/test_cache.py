@@ -0,0 +1,67 @@
+from opendigger_pycli.dataloaders.cache import HttpCache
+from opendigger_pycli.utils import compression
+
+
+def test_http_cache(tmp_path):
+    cache = HttpCache(tmp_path, max_size=10, ttl=60, compress=False)
+    assert cache.lookup("https://a") is None
+
+    cache.store("https://a", b"aaaa", etag='"a"')
+    entry = cache.lookup("https://a")
+    assert entry is not None
+    assert cache.is_fresh(entry)
+    assert cache.read(entry) == b"aaaa"
+    assert cache.conditional_headers(entry) == {"If-None-Match": '"a"'}
+
+    cache.store("https://b", b"bbbb")
+    cache.read(entry)
+    # a is the most recently used one, so b is evicted first
+    cache.store("https://c", b"cccc")
+    assert cache.lookup("https://b") is None
+    assert cache.lookup("https://a") is not None
+    assert cache.stats().total_size == 8
+
+    assert cache.clear() == (2, 8)
+    assert cache.stats().entries == 0
+    assert not any(p.is_file() for p in (tmp_path / "bodies").rglob("*"))
+
+
+def test_missing_index(tmp_path):
+    url = "https://a/technical_fork.json"
+    cache = HttpCache(tmp_path, max_size=10, ttl=60, missing_ttl=60)
+    assert not cache.has_missing()
+    assert not cache.is_missing(url)
+
+    cache.mark_missing(url)
+    assert cache.is_missing(url)
+    assert not cache.is_missing("https://a/openrank.json")
+    assert cache.stats().missing == 1
+    # A new process rebuilds its filter from the index
+    assert HttpCache(tmp_path, max_size=10, ttl=60, missing_ttl=60).is_missing(url)
+    assert not HttpCache(tmp_path, max_size=10, ttl=60, missing_ttl=0).is_missing(url)
+
+    cache.store(url, b"{}")
+    assert not cache.is_missing(url)
+
+
+def test_compressed_bodies(tmp_path):
+    cache = HttpCache(tmp_path, max_size=10 * 1024 * 1024, ttl=60)
+    bodies = [
+        b'{"2023-%02d": %d.5, "2023-%02dq": %d}' % (i % 12 + 1, i, i % 12 + 1, i)
+        for i in range(compression.TRAIN_SAMPLE_COUNT + 1)
+    ]
+    for i, body in enumerate(bodies):
+        cache.store(f"https://a/{i}.json", body)
+    # A dictionary was trained on the first bodies and is used from then on
+    assert list((tmp_path / "dicts").glob("*.dict"))
+    url = f"https://a/{len(bodies) - 1}.json"
+    assert cache.lookup(url).size < len(bodies[-1])
+
+    # Another process reads every body back with the saved dictionary
+    cache = HttpCache(tmp_path, max_size=10 * 1024 * 1024, ttl=60)
+    for i, body in enumerate(bodies):
+        assert cache.read(cache.lookup(f"https://a/{i}.json")) == body
+
+    chunks = cache.store_stream("https://a/big.json", iter([b"[1, ", b"2]"]))
+    assert b"".join(chunks) == b"[1, 2]"
+    assert cache.read(cache.lookup("https://a/big.json")) == b"[1, 2]"
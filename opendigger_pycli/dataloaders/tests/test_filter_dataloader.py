@@ -0,0 +1,29 @@
+from opendigger_pycli.dataloaders import (
+    ALL_INDICATOR_TYPES,
+    ALL_INTRODUCERS,
+    DATALOADERS,
+    filter_dataloader,
+)
+
+
+def test_filter_dataloader():
+    dataloaders = list(filter_dataloader({"repo"}, {"index"}, set()))
+    assert dataloaders
+    assert all(
+        dataloader.type == "repo" and dataloader.indicator_type == "index"
+        for dataloader in dataloaders
+    )
+    # Every call returns the same shared instances
+    assert next(filter_dataloader({"repo"}, {"index"}, set())) is dataloaders[0]
+    assert next(filter_dataloader({"repo"}, {"index"}, ALL_INTRODUCERS)) in dataloaders
+    assert list(filter_dataloader({"repo", "user"}, set(), set())) == []
+
+    all_dataloaders = filter_dataloader(
+        {"repo", "user"}, ALL_INDICATOR_TYPES, ALL_INTRODUCERS
+    )
+    assert [type(dataloader) for dataloader in all_dataloaders] == [
+        dataloader_cls
+        for indicator_dict in DATALOADERS.values()
+        for dataloader_classes in indicator_dict.values()
+        for dataloader_cls in dataloader_classes
+    ]
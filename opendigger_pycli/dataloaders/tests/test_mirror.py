@@ -0,0 +1,35 @@
+import asyncio
+
+from opendigger_pycli.dataloaders.indices import OpenRankRepoDataloader
+from opendigger_pycli.dataloaders.mirror import MirrorSync, get_mirror_path
+from opendigger_pycli.dataloaders.source import get_mirror_codec
+from opendigger_pycli.utils import aio_http
+
+from . import TEST_ORG, TEST_REPO
+
+
+def test_mirror_sync_resumes(tmp_path, monkeypatch):
+    requested = []
+
+    async def fake_get(url, headers=None):
+        requested.append(url)
+        if "non-exist-repo" in url:
+            return aio_http.Response(404, {}, b"")
+        return aio_http.Response(200, {}, b'{"2023-01": 1}')
+
+    monkeypatch.setattr(aio_http, "get", fake_get)
+    targets = [f"{TEST_ORG}/{TEST_REPO}", f"{TEST_ORG}/non-exist-repo"]
+
+    stats = asyncio.run(
+        MirrorSync(tmp_path, [OpenRankRepoDataloader()], jobs=4).run(targets)
+    )
+    assert (stats.targets, stats.files, stats.missing) == (2, 1, 1)
+    path = get_mirror_path(tmp_path, requested[0])
+    assert get_mirror_codec(tmp_path).read(path) == b'{"2023-01": 1}'
+
+    requested.clear()
+    stats = asyncio.run(
+        MirrorSync(tmp_path, [OpenRankRepoDataloader()], jobs=4).run(targets)
+    )
+    assert stats.resumed == 2
+    assert not requested
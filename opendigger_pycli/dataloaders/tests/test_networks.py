@@ -1,3 +1,6 @@
+import json
+
+from opendigger_pycli.dataloaders import networks
 from opendigger_pycli.dataloaders.networks import (
     DeveloperNetworkRepoDataloader,
     DeveloperNetworkUserDataloader,
@@ -5,6 +8,12 @@ from opendigger_pycli.dataloaders.networks import (
     RepoNetworkRepoDataloader,
     RepoNetworkUserDataloader,
 )
+from opendigger_pycli.dataloaders.utils import (
+    decode_network_data,
+    decode_openrank_network_data,
+    load_network_data,
+)
+from opendigger_pycli.datatypes import symbol_scope
 
 from . import TEST_ORG, TEST_REPO, TEST_USER_NAME
 
@@ -52,3 +61,92 @@ def test_project_openrank_network():
         TEST_ORG, "non-exist-repo", [(2022, 12)]
     )
     assert not fail_data.data.value[0].value
+
+
+def test_project_openrank_detail_months(monkeypatch):
+    def fake_get_repo_data(org, repo, indicator_name, date, decode):
+        if date == (2023, 2):
+            # Cut off in the middle of the file
+            return decode([b'{"nodes": [{"id": '])
+        return decode(
+            [
+                b'{"nodes": [{"id": "a", "n": "a", "c": "u", "i": 1, "r": 1, "v": 1}],'
+                b' "links": []}'
+            ]
+        )
+
+    monkeypatch.setattr(networks, "get_repo_data", fake_get_repo_data)
+    result = ProjectOpenRankNetworkRepoDataloader().load(
+        "X-lab2017", "open-digger", [(2023, 3), (2023, 1), (2023, 2), (2023, 1)]
+    )
+
+    assert result.is_success
+    assert result.data is not None
+    assert [(v.year, v.month) for v in result.data.value] == [
+        (2023, 1),
+        (2023, 2),
+        (2023, 3),
+    ]
+    assert result.data.value[1].value is None
+    assert result.desc == "Failed to load data in 2023-02"
+
+
+def test_decode_network_data_from_chunks():
+    data = {
+        "nodes": [["frank-zsy", 12.5], ["CoderChen01", 3]],
+        "edges": [["frank-zsy", "CoderChen01", 1.25]],
+    }
+    body = json.dumps(data, indent=2).encode()
+    # Split the body at every few bytes, cutting through tokens
+    chunks = [body[i : i + 7] for i in range(0, len(body), 7)]  # noqa: E203
+
+    assert decode_network_data(chunks) == load_network_data(data)
+
+
+def test_network_names_shared_across_snapshots():
+    def snapshot(value: float) -> bytes:
+        return json.dumps(
+            {
+                "nodes": [
+                    {
+                        "id": "u1",
+                        "n": "frank-zsy",
+                        "c": "u",
+                        "i": 1,
+                        "r": 1,
+                        "v": value,
+                    },
+                    {"id": "r1", "n": "open-digger", "c": "r", "i": 1, "r": 1, "v": 1},
+                ],
+                "links": [{"s": "u1", "t": "r1", "w": value}],
+            }
+        ).encode()
+
+    with symbol_scope() as symbols:
+        january = decode_openrank_network_data([snapshot(1.0)])
+        february = decode_openrank_network_data([snapshot(2.0)])
+    # Months keep the symbols of the names, not strings
+    assert january.nodes.symbols is february.nodes.symbols is symbols
+    assert list(january.nodes.name_column("id")) == [
+        symbols.get("u1"),
+        symbols.get("r1"),
+    ]
+    assert january.nodes.name_column("n") == february.nodes.name_column("n")
+    assert january.edges.name_column("s") == february.edges.name_column("s")
+    # Names are looked up when the network is read
+    assert list(january.nodes) == [
+        {"id": "u1", "n": "frank-zsy", "c": "u", "i": 1.0, "r": 1.0, "v": 1.0},
+        {"id": "r1", "n": "open-digger", "c": "r", "i": 1.0, "r": 1.0, "v": 1.0},
+    ]
+    assert february.edges[0] == {"s": "u1", "t": "r1", "w": 2.0}
+    assert february.to_dict()["edges"] == [{"s": "u1", "t": "r1", "w": 2.0}]
+    # The graph shares the columns of the nodes
+    assert january.indexed.node_symbols is january.nodes.name_column("id")
+    assert january.indexed.symbols is symbols
+    assert list(january.indexed.out_edges("u1")) == [("r1", 1.0)]
+
+    # Outside of a scope every network has a table of its own
+    march = decode_openrank_network_data([snapshot(3.0)])
+    assert march.nodes.symbols is not symbols
+    assert march.edges.symbols is march.nodes.symbols
+    assert march.nodes[0]["n"] == "frank-zsy"
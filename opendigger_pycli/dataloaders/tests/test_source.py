@@ -0,0 +1,27 @@
+import json
+
+from opendigger_pycli.dataloaders import source
+from opendigger_pycli.dataloaders.indices import OpenRankRepoDataloader
+from opendigger_pycli.utils import http
+
+from . import TEST_ORG, TEST_REPO
+
+
+def test_mirror(tmp_path, monkeypatch):
+    repo_dir = tmp_path / TEST_ORG / TEST_REPO
+    repo_dir.mkdir(parents=True)
+    (repo_dir / "openrank.json").write_text(json.dumps({"2023-01": 1.5}))
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("the network must not be used")
+
+    monkeypatch.setattr(http, "request", no_network)
+    monkeypatch.setattr(
+        source, "_DATA_SOURCE", source.DataSource(mirror_dir=tmp_path, offline=False)
+    )
+    dataloader = OpenRankRepoDataloader()
+
+    result = dataloader.load(TEST_ORG, TEST_REPO)
+    assert result.is_success
+    assert [d.value for d in result.data.value] == [1.5]
+    assert not dataloader.load(TEST_ORG, "non-exist-repo").is_success
@@ -0,0 +1,84 @@
+import asyncio
+import time
+
+import pytest
+
+from opendigger_pycli.dataloaders import utils
+from opendigger_pycli.dataloaders.indices import OpenRankRepoDataloader
+from opendigger_pycli.results.query import RepoQueryResult, aload_dataloader
+from opendigger_pycli.utils.hedging import hedged_call
+from opendigger_pycli.utils.rate_limit import HostLimiter, ThrottledError
+
+from . import TEST_ORG, TEST_REPO
+
+
+def test_host_limiter():
+    limiter = HostLimiter("a", max_rate=100, failure_threshold=2, reset_timeout=60)
+    assert limiter.acquire() == 0
+
+    assert limiter.check_response(429, {"Retry-After": "1"})
+    assert limiter.bucket.rate == 50
+    assert limiter.acquire(retry=True) >= 0.9
+    assert not limiter.check_response(404, {})
+
+    limiter.record_result(429, throttled=True)
+    limiter.record_result(429, throttled=True)
+    # The circuit is open, requests fail without waiting
+    with pytest.raises(ThrottledError):
+        limiter.acquire()
+    # and no hedge is sent
+    assert not limiter.try_acquire()
+
+    limiter = HostLimiter("a", max_rate=2, failure_threshold=2, reset_timeout=60)
+    # A hedge never waits for a token
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_throttled_result_is_not_missing(monkeypatch):
+    async def fake_afetch_body(url):
+        if TEST_REPO in url:
+            raise ThrottledError("oss.x-lab.info")
+        return None
+
+    monkeypatch.setattr(utils, "afetch_body", fake_afetch_body)
+
+    def load(repo):
+        result = RepoQueryResult(
+            repo=(TEST_ORG, repo),
+            dataloaders=[OpenRankRepoDataloader()],
+            indicator_queries=[],
+            uniform_query=None,
+            fetch=False,
+        )
+        return asyncio.run(aload_dataloader(result, result.dataloaders[0]))
+
+    throttled = load(TEST_REPO)
+    assert not throttled.is_success
+    assert throttled.desc == "Throttled by oss.x-lab.info, try again later"
+    assert load("non-exist-repo").desc == "Cannot find data for this indicator"
+
+
+def test_hedged_call():
+    calls = []
+    discarded = []
+
+    def call():
+        calls.append(None)
+        n = len(calls)
+        # The first copy stalls, the hedged one answers at once
+        time.sleep(0.5 if n == 1 else 0)
+        return n
+
+    start = time.perf_counter()
+    assert hedged_call(call, 0.05, discarded.append) == 2
+    assert time.perf_counter() - start < 0.3
+    assert hedged_call(lambda: 1, None, discarded.append) == 1
+    time.sleep(0.5)
+    assert discarded == [1]
+
+    calls.clear()
+    # No second copy when the hedge is refused
+    assert hedged_call(call, 0.05, discarded.append, can_hedge=lambda: False) == 1
+    assert len(calls) == 1
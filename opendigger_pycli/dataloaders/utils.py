@@ -1,5 +1,13 @@
+import asyncio
+import json
+import zlib
 import typing as t
+from contextlib import closing
+from contextvars import ContextVar, copy_context
+from operator import attrgetter
+from urllib.parse import urlsplit
 
+import aiohttp
 import requests
 
 from opendigger_pycli.datatypes import (
@@ -9,37 +17,411 @@ from opendigger_pycli.datatypes import (
     NameNameAndValue,
     ProjectOpenRankNetworkEdgeDict,
     ProjectOpenRankNetworkNodeDict,
+    SymbolRecords,
     TimeDurationRelatedIndicatorDict,
+    TimeSeries,
+    get_symbols,
+    intern_name,
+)
+from opendigger_pycli.config.utils import get_data_config, is_config_value_true
+from opendigger_pycli.utils import aio_http, http
+from opendigger_pycli.utils.deadline import (
+    DeadlineExceededError,
+    check_deadline,
+    deadline_exceeded,
+    is_past_deadline,
+)
+from opendigger_pycli.utils.json_stream import CHUNK_SIZE, iter_object_members
+from opendigger_pycli.utils.rate_limit import (
+    HostUnavailableError,
+    ThrottledError,
+    is_throttled,
 )
 
+from .cache import get_http_cache
+from .source import get_data_source, get_mirror_codec
+
 BASE_API_URL = "https://oss.x-lab.info/open_digger/github/"
 
 T = t.TypeVar("T")
 
 
+# Turns the chunks of an indicator file into its final value
+Decoder = t.Callable[[t.Iterable[bytes]], t.Any]
+
+
+def decode_json(chunks: t.Iterable[bytes]) -> t.Any:
+    return json.loads(b"".join(chunks))
+
+
+class FetchScope(t.NamedTuple):
+    # Bodies already fetched asynchronously (None for a missing file),
+    # or the exception raised while fetching them
+    responses: t.Dict[str, t.Union[t.Optional[bytes], BaseException]]
+    # Urls requested by the dataloader that have not been fetched yet
+    missing: t.Dict[str, None]
+
+
+_FETCH_SCOPE: ContextVar[t.Optional[FetchScope]] = ContextVar(
+    "opendigger_fetch_scope", default=None
+)
+
+
+def read_local_file(url: str) -> t.Optional[t.Iterator[bytes]]:
+    """Read the chunks of an indicator file without the network
+
+    From the mirror directory if one is configured, otherwise from the
+    on-disk cache whatever its age.
+    """
+    mirror_dir = get_data_source().mirror_dir
+    if mirror_dir is not None:
+        if not url.startswith(BASE_API_URL):
+            return None
+        relative_path = url.split(BASE_API_URL, 1)[1]
+        try:
+            f = (mirror_dir / relative_path).open("rb")
+        except OSError:
+            return None
+        return get_mirror_codec(mirror_dir).read_file(f)
+
+    cache = get_http_cache()
+    entry = cache.lookup(url) if cache is not None else None
+    if cache is None or entry is None:
+        return None
+    return cache.open_body(entry)
+
+
+def decode_chunks(chunks: t.Optional[t.Iterator[bytes]], decode: Decoder) -> t.Any:
+    """Decode the chunks of a stored body and close the underlying file"""
+    if chunks is None:
+        return None
+    with closing(chunks):  # type: ignore
+        return decode(chunks)
+
+
+def check_status(url: str, status_code: int, headers: t.Mapping[str, str]) -> bool:
+    """Whether a response has the file, False if the file does not exist
+
+    Raises ``ThrottledError`` for rate limited responses and
+    ``HostUnavailableError`` for server errors, which say nothing about
+    whether the file exists.
+    """
+    if status_code == 200:
+        return True
+    host = urlsplit(url).netloc
+    if is_throttled(status_code, headers):
+        raise ThrottledError(host)
+    if status_code >= 500:
+        raise HostUnavailableError(host, f"HTTP {status_code}")
+    return False
+
+
+# Errors that say nothing about whether the data exists, and may go away
+# when the fetch is tried again
+FETCH_ERRORS = (HostUnavailableError, DeadlineExceededError)
+
+# Errors of a file that was fetched but is not valid JSON, cannot be
+# decompressed, or lacks the fields of the indicator
+DECODE_ERRORS = (ValueError, KeyError, TypeError, zlib.error)
+
+
+def describe_fetch_error(e: Exception) -> str:
+    if isinstance(e, ThrottledError):
+        return f"Throttled by {e.host}, try again later"
+    if isinstance(e, DeadlineExceededError):
+        return str(e)
+    return f"{e}, try again later"
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    try:
+        return http.get(url, **kwargs)
+    except (requests.ConnectionError, requests.Timeout) as e:
+        raise HostUnavailableError(urlsplit(url).netloc, str(e)) from e
+
+
+def _iter_body(url: str, r: requests.Response) -> t.Iterator[bytes]:
+    """Yield the chunks of a streamed body until the deadline passes"""
+    try:
+        for chunk in r.iter_content(CHUNK_SIZE):
+            check_deadline()
+            yield chunk
+    except (requests.ConnectionError, requests.Timeout) as e:
+        if is_past_deadline():
+            raise deadline_exceeded() from e
+        raise HostUnavailableError(urlsplit(url).netloc, str(e)) from e
+
+
+async def _aget(
+    url: str, headers: t.Optional[t.Mapping[str, str]] = None
+) -> aio_http.Response:
+    try:
+        return await aio_http.get(url, headers=headers)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise HostUnavailableError(urlsplit(url).netloc, str(e) or repr(e)) from e
+
+
+def fetch_json(url: str, decode: Decoder = decode_json) -> t.Any:
+    """Fetch an indicator file, going through the on-disk cache if enabled
+
+    Fresh cache hits never touch the network, stale ones are revalidated
+    with a conditional request. Urls that recently answered 404 are not
+    requested again until ``cache.missing_ttl_hours`` has passed. In
+    offline mode the file is read from the mirror or the cache, and inside
+    ``aload_with`` it comes from the asynchronous prefetch.
+
+    The body is handed to ``decode`` chunk by chunk as it is read, so a
+    streaming decoder never needs the whole file in memory. Returns None
+    if the file does not exist, and raises ``HostUnavailableError`` if
+    that cannot be told because the host throttled or failed the request,
+    or ``DeadlineExceededError`` once the deadline of the enclosing
+    ``deadline_scope`` has passed.
+    """
+    scope = _FETCH_SCOPE.get()
+    if scope is not None:
+        if url not in scope.responses:
+            scope.missing[url] = None
+            return None
+        response = scope.responses[url]
+        if isinstance(response, BaseException):
+            raise response
+        return None if response is None else decode([response])
+
+    if get_data_source().is_local:
+        return decode_chunks(read_local_file(url), decode)
+
+    cache = get_http_cache()
+    if cache is None:
+        with _get(url, stream=True) as r:
+            if not check_status(url, r.status_code, r.headers):
+                return None
+            return decode(_iter_body(url, r))
+
+    entry = cache.lookup(url)
+    if entry is not None and cache.is_fresh(entry):
+        chunks = cache.open_body(entry)
+        if chunks is not None:
+            return decode_chunks(chunks, decode)
+        entry = None
+    if entry is None and cache.is_missing(url):
+        return None
+
+    r = _get(url, headers=cache.conditional_headers(entry), stream=True)
+    if r.status_code == 304 and entry is not None:
+        r.close()
+        chunks = cache.open_body(entry)
+        if chunks is not None:
+            cache.revalidate(entry)
+            return decode_chunks(chunks, decode)
+        r = _get(url, stream=True)
+    with r:
+        if r.status_code == 404:
+            cache.mark_missing(url)
+        if not check_status(url, r.status_code, r.headers):
+            return None
+        stored_chunks = cache.store_stream(
+            url,
+            _iter_body(url, r),
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
+        value = decode(stored_chunks)
+        # Read what the decoder left (e.g. trailing whitespace), the file
+        # is only added to the cache once it has been read to the end
+        for _ in stored_chunks:
+            pass
+        return value
+
+
+async def afetch_body(url: str) -> t.Optional[bytes]:
+    """Asynchronous version of ``fetch_json`` returning the raw body"""
+    if get_data_source().is_local:
+        return decode_chunks(read_local_file(url), b"".join)
+
+    cache = get_http_cache()
+    if cache is None:
+        r = await _aget(url)
+        if not check_status(url, r.status_code, r.headers):
+            return None
+        return r.content
+
+    entry = cache.lookup(url)
+    if entry is not None and cache.is_fresh(entry):
+        body = cache.read(entry)
+        if body is not None:
+            return body
+        entry = None
+    if entry is None and cache.is_missing(url):
+        return None
+
+    r = await _aget(url, headers=cache.conditional_headers(entry))
+    if r.status_code == 304 and entry is not None:
+        body = cache.read(entry)
+        if body is not None:
+            cache.revalidate(entry)
+            return body
+        r = await _aget(url)
+    if r.status_code == 404:
+        cache.mark_missing(url)
+    if not check_status(url, r.status_code, r.headers):
+        return None
+
+    cache.store(
+        url,
+        r.content,
+        etag=r.headers.get("ETag"),
+        last_modified=r.headers.get("Last-Modified"),
+    )
+    return r.content
+
+
+async def afetch_json(url: str, decode: Decoder = decode_json) -> t.Any:
+    """Asynchronous version of ``fetch_json``"""
+    body = await afetch_body(url)
+    return None if body is None else decode([body])
+
+
+async def run_in_executor(func: t.Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking ``func`` in the default executor of the event loop
+
+    ``func`` runs in a copy of the current context, so it sees the context
+    variables of the caller, such as the fetch scope and the deadline.
+    """
+    context = copy_context()
+
+    def run() -> T:
+        return context.run(func, *args, **kwargs)
+
+    return await asyncio.get_running_loop().run_in_executor(None, run)
+
+
+async def aload_with(load: t.Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking ``load`` with its downloads done on the event loop
+
+    ``load`` is first run with every ``fetch_json`` call answered by
+    ``None``, which records the urls it needs. These are fetched
+    concurrently, and ``load`` is run again against the fetched responses.
+    This repeats until ``load`` asks for nothing new, so every dataloader
+    built on ``fetch_json`` gets an ``aload`` without being rewritten.
+    Each pass of ``load`` decodes and converts data, so it runs in the
+    default executor instead of blocking the event loop.
+    """
+    scope = FetchScope(responses={}, missing={})
+    async with aio_http.session_scope():
+        while True:
+            scope.missing.clear()
+            token = _FETCH_SCOPE.set(scope)
+            try:
+                result = await run_in_executor(load, *args, **kwargs)
+            finally:
+                _FETCH_SCOPE.reset(token)
+            if not scope.missing:
+                return result
+
+            urls = list(scope.missing)
+            responses = await asyncio.gather(
+                *(afetch_body(url) for url in urls), return_exceptions=True
+            )
+            for url, response in zip(urls, responses):
+                if isinstance(response, asyncio.CancelledError):
+                    raise response
+                scope.responses[url] = response
+
+
+def record_urls(load: t.Callable, *args, **kwargs) -> t.List[str]:
+    """Return the urls ``load`` starts with, without fetching any of them"""
+    scope = FetchScope(responses={}, missing={})
+    token = _FETCH_SCOPE.set(scope)
+    try:
+        load(*args, **kwargs)
+    except Exception:
+        pass
+    finally:
+        _FETCH_SCOPE.reset(token)
+    return list(scope.missing)
+
+
+# Recorded with placeholders instead of the names and dates of a target
+_URL_PLACEHOLDER = "\x00{}\x00"
+_PLACEHOLDER_YEAR = 9999
+_URL_TEMPLATES: t.Dict[t.Tuple[t.Any, t.Tuple], t.List[str]] = {}
+
+
+def get_urls(load: t.Callable, *args) -> t.List[str]:
+    """Return the urls ``load`` starts with, like ``record_urls``
+
+    The urls of a load function are recorded once with placeholder names
+    and dates, and the real ones are then put in their place, so finding
+    the urls of every target of a query costs a single ``load`` call.
+    Arguments other than names and up to twelve dates are recorded as is.
+    """
+    shape = tuple(len(arg) if isinstance(arg, list) else None for arg in args)
+    if not all(
+        isinstance(arg, str) or (isinstance(arg, list) and len(arg) <= 12)
+        for arg in args
+    ):
+        return record_urls(load, *args)
+
+    key = (getattr(load, "__func__", load), shape)
+    templates = _URL_TEMPLATES.get(key)
+    if templates is None:
+        placeholders = [
+            [(_PLACEHOLDER_YEAR, month) for month in range(1, size + 1)]
+            if size is not None
+            else _URL_PLACEHOLDER.format(index)
+            for index, size in enumerate(shape)
+        ]
+        templates = _URL_TEMPLATES[key] = record_urls(load, *placeholders)
+
+    replacements: t.List[t.Tuple[str, str]] = []
+    for index, arg in enumerate(args):
+        if isinstance(arg, str):
+            replacements.append((_URL_PLACEHOLDER.format(index), arg))
+            continue
+        for month, (year, real_month) in enumerate(arg, 1):
+            replacements.append(
+                (f"{_PLACEHOLDER_YEAR}-{month:02}", f"{year}-{real_month:02}")
+            )
+    urls = []
+    for url in templates:
+        for placeholder, value in replacements:
+            url = url.replace(placeholder, value)
+        urls.append(url)
+    return urls
+
+
+def is_known_missing(load: t.Callable, *args) -> bool:
+    """Whether every url ``load`` needs is known to answer 404"""
+    if get_data_source().is_local:
+        # The negative cache only describes the remote dataset
+        return False
+    cache = get_http_cache()
+    if cache is None or not cache.has_missing():
+        return False
+    urls = get_urls(load, *args)
+    return bool(urls) and all(cache.is_missing(url) for url in urls)
+
+
 def get_repo_data(
     org: str,
     repo: str,
     indicator_name: str,
     date: t.Optional[t.Tuple[int, int]] = None,
-) -> t.Optional[t.Dict]:
+    decode: Decoder = decode_json,
+) -> t.Any:
     if date is not None:
         year, month = date
         url = f"{BASE_API_URL}{org}/{repo}/{indicator_name}/{year}-{month:02}.json"
     else:
         url = f"{BASE_API_URL}{org}/{repo}/{indicator_name}.json"
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+    return fetch_json(url, decode)
 
 
-def get_developer_data(username: str, indicator_name: str) -> t.Optional[t.Dict]:
+def get_developer_data(
+    username: str, indicator_name: str, decode: Decoder = decode_json
+) -> t.Any:
     url = f"{BASE_API_URL}{username}/{indicator_name}.json"
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+    return fetch_json(url, decode)
 
 
 def load_base_data(
@@ -69,19 +451,38 @@ def load_base_data(
             )
         )
 
-    base_data_list.sort()
+    base_data_list.sort(key=attrgetter("sort_key"))
 
     return base_data_list
 
 
+def load_number_data(
+    data: t.Dict[str, t.Any], value_type: t.Type[t.Union[int, float]]
+) -> t.Union[t.List[BaseData], TimeSeries]:
+    """Load an indicator with one number per month
+
+    It is kept in a TimeSeries when ``data.columnar`` is enabled.
+    """
+    if is_config_value_true(get_data_config().columnar):
+        return TimeSeries.from_dict(data, value_type)
+    return load_base_data(data, value_type)
+
+
+# Names of developers and repositories repeat in every month, so within a
+# symbol scope the names of NameAndValue values are shared through its
+# symbol table instead of being a new string each time they are loaded
+
+
 def load_name_and_value(data: t.Tuple[str, float]) -> NameAndValue:
     name, value = data
-    return NameAndValue(name=name, value=value)
+    return NameAndValue(name=intern_name(name), value=value)
 
 
 def load_name_name_and_value(data: t.Tuple[str, str, float]) -> NameNameAndValue:
     name0, name1, value = data
-    return NameNameAndValue(name0=name0, name1=name1, value=value)
+    return NameNameAndValue(
+        name0=intern_name(name0), name1=intern_name(name1), value=value
+    )
 
 
 def load_avg_data(data: t.Dict[str, t.Any]) -> t.List[BaseData[float]]:
@@ -110,23 +511,104 @@ def load_non_trival_indicator_data(
     )
 
 
+# Names and numbers of the nodes and edges of project_openrank_detail
+OPENRANK_NETWORK_NODE_NAMES = ("id", "n", "c")
+OPENRANK_NETWORK_NODE_NUMBERS = ("i", "r", "v")
+OPENRANK_NETWORK_EDGE_NAMES = ("s", "t")
+OPENRANK_NETWORK_EDGE_NUMBERS = ("w",)
+
+
+# Networks keep the symbols of the names of their nodes and edges, from the
+# symbol table of the current scope, so the networks of every month share
+# one number per developer or repository
+
+
+def new_openrank_network_records() -> (
+    t.Tuple[
+        SymbolRecords[ProjectOpenRankNetworkNodeDict],
+        SymbolRecords[ProjectOpenRankNetworkEdgeDict],
+    ]
+):
+    symbols = get_symbols()
+    return (
+        SymbolRecords(
+            symbols,
+            ProjectOpenRankNetworkNodeDict,
+            OPENRANK_NETWORK_NODE_NAMES,
+            OPENRANK_NETWORK_NODE_NUMBERS,
+        ),
+        SymbolRecords(
+            symbols,
+            ProjectOpenRankNetworkEdgeDict,
+            OPENRANK_NETWORK_EDGE_NAMES,
+            OPENRANK_NETWORK_EDGE_NUMBERS,
+        ),
+    )
+
+
+def new_network_records() -> (
+    t.Tuple[SymbolRecords[NameAndValue], SymbolRecords[NameNameAndValue]]
+):
+    symbols = get_symbols()
+    return (
+        SymbolRecords(symbols, NameAndValue, ("name",), ("value",)),
+        SymbolRecords(symbols, NameNameAndValue, ("name0", "name1"), ("value",)),
+    )
+
+
+def load_openrank_network_record(
+    records: SymbolRecords, data: t.Dict[str, t.Any]
+) -> None:
+    records.append([data[field] for field in records.fields])
+
+
 def load_openrank_network_data(
     data: t.Dict[str, t.List],
 ) -> BaseNetworkData[ProjectOpenRankNetworkNodeDict, ProjectOpenRankNetworkEdgeDict]:
-    nodes = data["nodes"]
-    edges = data["links"]
+    nodes, edges = new_openrank_network_records()
+    for node in data["nodes"]:
+        load_openrank_network_record(nodes, node)
+    for edge in data["links"]:
+        load_openrank_network_record(edges, edge)
     return BaseNetworkData(nodes=nodes, edges=edges)
 
 
 def load_network_data(
     data: t.Dict[str, t.List]
 ) -> BaseNetworkData[NameAndValue, NameNameAndValue]:
-    nodes = data["nodes"]
-    edges = data["edges"]
-    return BaseNetworkData(
-        nodes=[NameAndValue(name=node[0], value=node[1]) for node in nodes],
-        edges=[
-            NameNameAndValue(name0=edge[0], name1=edge[1], value=edge[2])
-            for edge in edges
-        ],
-    )
+    nodes, edges = new_network_records()
+    for node in data["nodes"]:
+        nodes.append(node)
+    for edge in data["edges"]:
+        edges.append(edge)
+    return BaseNetworkData(nodes=nodes, edges=edges)
+
+
+def decode_openrank_network_data(
+    chunks: t.Iterable[bytes],
+) -> BaseNetworkData[ProjectOpenRankNetworkNodeDict, ProjectOpenRankNetworkEdgeDict]:
+    """Streaming version of ``load_openrank_network_data``"""
+    nodes, edges = new_openrank_network_records()
+    for key, value in iter_object_members(chunks, ("nodes", "links")):
+        if key == "nodes":
+            load_openrank_network_record(nodes, value)
+        elif key == "links":
+            load_openrank_network_record(edges, value)
+    return BaseNetworkData(nodes=nodes, edges=edges)
+
+
+def decode_network_data(
+    chunks: t.Iterable[bytes],
+) -> BaseNetworkData[NameAndValue, NameNameAndValue]:
+    """Streaming version of ``load_network_data``
+
+    Nodes and edges are converted as soon as they are decoded, instead of
+    after the whole file has been loaded into lists.
+    """
+    nodes, edges = new_network_records()
+    for key, value in iter_object_members(chunks, ("nodes", "edges")):
+        if key == "nodes":
+            nodes.append(value)
+        elif key == "edges":
+            edges.append(value)
+    return BaseNetworkData(nodes=nodes, edges=edges)
@@ -1,4 +1,28 @@
-from .config import ALL_CONFIGS, AppKeyConfig, UserInfoConfig
+import importlib
+import typing as t
+
+from .config import (
+    ALL_CONFIGS,
+    AppKeyConfig,
+    CacheConfig,
+    DataConfig,
+    HttpConfig,
+    SourceConfig,
+    UserInfoConfig,
+)
 from .dataloader import DataloaderProto, DataloaderResult
-from .indicators import *  # noqa F403
 from .query import IndicatorQuery
+
+if t.TYPE_CHECKING:
+    from .indicators import *  # noqa F403
+
+
+def __getattr__(name: str) -> t.Any:
+    # The indicator dataclasses are only imported once data is loaded,
+    # the CLI does not need them to parse its options
+    indicators = importlib.import_module(".indicators", __name__)
+    if name not in vars(indicators):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(indicators, name)
+    globals()[name] = value
+    return value
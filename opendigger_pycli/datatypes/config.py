@@ -21,7 +21,49 @@ class UserInfoConfig(BaseConfig):
     email: str = "Unknown"
 
 
+@dataclass
+class CacheConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "cache"
+    enabled: str = "True"
+    max_size_mb: str = "1024"
+    ttl_hours: str = "24"
+    missing_ttl_hours: str = "6"
+    compress: str = "True"
+    verify_ttl_hours: str = "168"
+
+
+@dataclass
+class HttpConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "http"
+    pool_size: str = "32"
+    connect_timeout: str = "5"
+    read_timeout: str = "30"
+    max_retries: str = "3"
+    max_requests_per_second: str = "20"
+    circuit_failures: str = "5"
+    circuit_reset_seconds: str = "30"
+    hedge: str = "True"
+
+
+@dataclass
+class SourceConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "source"
+    mirror_dir: str = "None"
+    offline: str = "False"
+
+
+@dataclass
+class DataConfig(BaseConfig):
+    config_name: t.ClassVar[str] = "data"
+    # Keep indicators with one number per month in a TimeSeries
+    columnar: str = "False"
+
+
 ALL_CONFIGS: t.Dict[str, t.Type[BaseConfig]] = {
     "app_keys": AppKeyConfig,
     "user_info": UserInfoConfig,
+    "cache": CacheConfig,
+    "http": HttpConfig,
+    "source": SourceConfig,
+    "data": DataConfig,
 }
@@ -10,6 +10,9 @@ class DataloaderResult(t.Generic[T]):
     dataloader: "DataloaderProto"
     desc: str
     data: t.Optional[T] = None
+    # The data could not be loaded for now (e.g. throttled or timed out),
+    # which says nothing about whether it exists
+    is_retryable: bool = False
 
     def __repr__(self) -> str:
         data_class_name = "None" if self.data is None else self.data.__class__.__name__
@@ -34,3 +37,6 @@ class DataloaderProto(t.Protocol):
 
     def load(self, *args, **kwargs) -> DataloaderResult:
         ...
+
+    async def aload(self, *args, **kwargs) -> DataloaderResult:
+        ...
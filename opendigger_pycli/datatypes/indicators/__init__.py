@@ -46,3 +46,12 @@ from .metrics import (
     ActivityDetailData,
 )
 from .networks import DeveloperNetworkData, ProjectOpenRankNetworkData, RepoNetworkData
+from .graph import (
+    IndexedGraph,
+    SymbolRecords,
+    SymbolTable,
+    get_symbols,
+    intern_name,
+    symbol_scope,
+)
+from .timeseries import TimeSeries
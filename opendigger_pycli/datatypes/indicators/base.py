@@ -1,10 +1,18 @@
+import heapq
 import typing as t
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from functools import cached_property
 from typing import Generic, List, NamedTuple, TypedDict, TypeVar
 
+if t.TYPE_CHECKING:
+    from .graph import IndexedGraph
+    from .timeseries import TimeSeries
+
 T = TypeVar("T")
 S = TypeVar("S")
 
+_setattr = object.__setattr__
+
 TRIVIAL_INDICATOR_DATA: t.Literal["trivial_indicator_data"] = "trivial_indicator_data"
 NON_TRIVIAL_INDICATOR_DATA: t.Literal[
     "non_trivial_indicator_data"
@@ -71,7 +79,8 @@ class NonTrivalNetworkInciatorData:
 @dataclass
 class TrivialIndicatorData(Generic[TrivalIndicatorValue]):
     name: t.ClassVar[str]
-    value: List["BaseData[TrivalIndicatorValue]"]
+    # A TimeSeries when data.columnar is enabled and the values are numbers
+    value: t.Union[List["BaseData[TrivalIndicatorValue]"], "TimeSeries"]
     data_class: t.Literal["trivial_indicator_data"] = TRIVIAL_INDICATOR_DATA
 
 
@@ -82,25 +91,93 @@ class NonTrivialIndicatorData:
     data_class: t.Literal["non_trivial_indicator_data"] = NON_TRIVIAL_INDICATOR_DATA
 
 
-class BaseDataValueSortableMixin:
-    def __post_init__(self):
-        if not isinstance(self.value, list):
-            return
-        warmup = self.value[0]
-        if isinstance(warmup, int) or isinstance(warmup, float):
-            self.value = list(sorted(self.value, reverse=True))  # type: ignore
-        if hasattr(warmup, "value"):
-            self.value = list(sorted(self.value, key=lambda x: x.value, reverse=True))  # type: ignore
-        if isinstance(warmup, dict) and "value" in warmup:
-            self.value = list(sorted(self.value, key=lambda x: x["value"], reverse=True))  # type: ignore
+def _get_value(item: t.Any) -> t.Any:
+    return item.value
 
 
-@dataclass
+def _get_value_item(item: t.Any) -> t.Any:
+    return item["value"]
+
+
+def _get_value_sort_key(
+    warmup: t.Any,
+) -> t.Tuple[bool, t.Optional[t.Callable[[t.Any], t.Any]]]:
+    """Whether values like ``warmup`` are ranked, and their sort key"""
+    if isinstance(warmup, (int, float)):
+        return True, None
+    if hasattr(warmup, "value"):
+        return True, _get_value
+    if isinstance(warmup, dict) and "value" in warmup:
+        return True, _get_value_item
+    return False, None
+
+
+class BaseDataValueSortableMixin:
+    """Rank list values by descending value when they are read
+
+    Nothing is sorted when the data is created: ``sorted_value`` sorts on
+    first use, and ``top(k)`` finds the k largest values in O(n log k)
+    unless they are already sorted.
+    """
+
+    value: t.Any
+
+    @cached_property
+    def _top_cache(self) -> t.Dict[int, t.List[t.Any]]:
+        return {}
+
+    def _get_ranking(self) -> t.Tuple[bool, t.Optional[t.Callable[[t.Any], t.Any]]]:
+        if not isinstance(self.value, list) or not self.value:
+            return False, None
+        return _get_value_sort_key(self.value[0])
+
+    @cached_property
+    def sorted_value(self) -> t.Any:
+        is_ranked, key = self._get_ranking()
+        if not is_ranked:
+            return self.value
+        return sorted(self.value, key=key, reverse=True)
+
+    def top(self, k: int) -> t.Any:
+        """The k largest values, in descending order"""
+        if k not in self._top_cache:
+            is_ranked, key = self._get_ranking()
+            if not is_ranked or "sorted_value" in self.__dict__:
+                self._top_cache[k] = self.sorted_value[:k]
+            else:
+                # nlargest keeps the order of equal values, like sorted
+                self._top_cache[k] = heapq.nlargest(k, self.value, key=key)
+        return self._top_cache[k]
+
+
+@dataclass(frozen=True, init=False)
 class BaseData(Generic[T]):
+    """The value of an indicator in one month
+
+    Instances are immutable and keep their attributes in slots, with no
+    ``__dict__``. Sort lists of them with ``key=attrgetter("sort_key")``,
+    which computes one integer per value instead of calling ``__lt__`` for
+    every comparison.
+    """
+
+    __slots__ = ("year", "month", "value", "is_raw")
+
     year: int
     month: int
     value: T
-    is_raw: bool = False
+    is_raw: bool
+
+    def __init__(self, year: int, month: int, value: T, is_raw: bool = False) -> None:
+        _setattr(self, "year", year)
+        _setattr(self, "month", month)
+        _setattr(self, "value", value)
+        _setattr(self, "is_raw", is_raw)
+
+    @property
+    def sort_key(self) -> int:
+        """The month index (``year * 12 + month - 1``) times two, plus one
+        unless the value is raw, so raw values come first in a month"""
+        return (self.year * 12 + self.month - 1) * 2 + (not self.is_raw)
 
     def __lt__(self, other: "BaseData[T]") -> bool:
         if self.year == other.year:
@@ -111,6 +188,11 @@ class BaseData(Generic[T]):
             return self.month < other.month
         return self.year < other.year
 
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        # Frozen slots cannot be restored by setattr, so pickle and copy
+        # go through __init__
+        return (self.__class__, (self.year, self.month, self.value, self.is_raw))
+
 
 class NameAndValue(NamedTuple):
     name: str
@@ -175,10 +257,65 @@ class ProjectOpenRankNetworkEdgeDict(t.TypedDict):
 
 @dataclass
 class BaseNetworkData(Generic[T, S]):
-    nodes: List[T]
-    edges: List[S]
+    """Nodes and edges of a network
+
+    Loaded networks keep them as ``SymbolRecords``, which build each node
+    and edge with its names when it is read.
+    """
 
-    def __post_init__(self):
-        if isinstance(self.nodes[0], NameAndValue):
-            self.nodes = list(sorted(self.nodes, key=lambda x: x.value, reverse=True))  # type: ignore
-            self.edges = list(sorted(self.edges, key=lambda x: x.value, reverse=True))  # type: ignore
+    nodes: t.Sequence[T]
+    edges: t.Sequence[S]
+
+    @property
+    def _is_ranked(self) -> bool:
+        # Networks of NameAndValue are ranked by value, the nodes and edges
+        # of project_openrank_detail keep the order they are loaded in
+        return bool(self.nodes) and isinstance(self.nodes[0], NameAndValue)
+
+    @cached_property
+    def _top_cache(self) -> t.Dict[t.Tuple[str, int], list]:
+        return {}
+
+    @cached_property
+    def sorted_nodes(self) -> t.Sequence[T]:
+        """The nodes by descending value, sorted on first use"""
+        if not self._is_ranked:
+            return self.nodes
+        return sorted(self.nodes, key=_get_value, reverse=True)
+
+    @cached_property
+    def sorted_edges(self) -> t.Sequence[S]:
+        """The edges by descending value, sorted on first use"""
+        if not self._is_ranked:
+            return self.edges
+        return sorted(self.edges, key=_get_value, reverse=True)
+
+    def top_nodes(self, k: int) -> List[T]:
+        """The k nodes of largest value, without sorting all of them"""
+        return self._top("nodes", k)
+
+    def top_edges(self, k: int) -> List[S]:
+        """The k edges of largest value, without sorting all of them"""
+        return self._top("edges", k)
+
+    def _top(self, name: str, k: int) -> list:
+        if (name, k) not in self._top_cache:
+            sorted_name = f"sorted_{name}"
+            if not self._is_ranked or sorted_name in self.__dict__:
+                top = getattr(self, sorted_name)[:k]
+            else:
+                # nlargest keeps the order of equal values, like sorted
+                top = heapq.nlargest(k, getattr(self, name), key=_get_value)
+            self._top_cache[name, k] = top
+        return self._top_cache[name, k]
+
+    @cached_property
+    def indexed(self) -> "IndexedGraph":
+        """The nodes and edges indexed by node id, built on first use"""
+        from .graph import IndexedGraph
+
+        return IndexedGraph.from_network(self.nodes, self.edges, self._is_ranked)
+
+    def to_dict(self) -> t.Dict[str, t.List[t.Any]]:
+        """``asdict`` of the network, with the names of its nodes and edges"""
+        return asdict(replace(self, nodes=list(self.nodes), edges=list(self.edges)))
@@ -0,0 +1,413 @@
+"""
+Indexed form of the networks of OpenDigger.
+
+``BaseNetworkData`` keeps nodes and edges in the order they are loaded in,
+and finding the node of an edge there means scanning the nodes. An
+``IndexedGraph`` maps every node id to its position once and stores the
+edges in compressed sparse row (CSR) form: the edges leaving node ``i`` are
+``targets[offsets[i]:offsets[i + 1]]`` with the same slice of ``weights``.
+Building it is O(N + E), after which every edge lookup is O(1).
+
+Names of developers and repositories are numbered by the symbol table of
+the current ``symbol_scope``, which a query opens while it loads its data.
+Loaded networks are ``SymbolRecords``: their nodes and edges are kept column
+by column as arrays of symbols and numbers, and the networks of every month
+and every repository of the query refer to a developer with the same
+integer. Names are only looked up in the table when a node or an edge is
+read, to be displayed or exported. The table is dropped with the last
+network that uses it.
+"""
+import threading
+import typing as t
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import accumulate
+
+R = t.TypeVar("R")
+
+# Source symbol, target symbol and weight
+Edge = t.Tuple[int, int, float]
+
+
+class SymbolTable:
+    """Interns strings and numbers them in the order they are first seen"""
+
+    def __init__(self) -> None:
+        self._symbols: t.Dict[str, int] = {}
+        self._names: t.List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._symbols
+
+    def __getstate__(self) -> t.List[str]:
+        return self._names
+
+    def __setstate__(self, names: t.List[str]) -> None:
+        self.__init__()  # type: ignore
+        for name in names:
+            self._add(name)
+
+    def _add(self, name: str) -> int:
+        with self._lock:
+            # Another thread may have added it since it was looked up
+            symbol = self._symbols.get(name)
+            if symbol is None:
+                symbol = len(self._names)
+                self._names.append(name)
+                self._symbols[name] = symbol
+            return symbol
+
+    def get(self, name: str) -> t.Optional[int]:
+        """The symbol of ``name``, None if it was never seen"""
+        return self._symbols.get(name)
+
+    def symbol(self, name: str) -> int:
+        symbol = self._symbols.get(name)
+        if symbol is None:
+            symbol = self._add(name)
+        return symbol
+
+    def intern(self, name: str) -> str:
+        """The first string equal to ``name`` that was seen"""
+        return self._names[self.symbol(name)]
+
+    def name(self, symbol: int) -> str:
+        return self._names[symbol]
+
+
+_SYMBOLS: ContextVar[t.Optional[SymbolTable]] = ContextVar(
+    "opendigger_symbols", default=None
+)
+
+
+@contextmanager
+def symbol_scope() -> t.Iterator[SymbolTable]:
+    """Share names through one symbol table until the scope exits
+
+    A scope opened inside another one uses the table of the outer scope.
+    """
+    symbols = _SYMBOLS.get()
+    if symbols is not None:
+        yield symbols
+        return
+    symbols = SymbolTable()
+    token = _SYMBOLS.set(symbols)
+    try:
+        yield symbols
+    finally:
+        _SYMBOLS.reset(token)
+
+
+def get_symbols() -> SymbolTable:
+    """The symbol table of the current scope, a new one outside of any scope"""
+    symbols = _SYMBOLS.get()
+    return SymbolTable() if symbols is None else symbols
+
+
+def intern_name(name: str) -> str:
+    """``name`` interned in the current symbol table, if there is one"""
+    symbols = _SYMBOLS.get()
+    return name if symbols is None else symbols.intern(name)
+
+
+class SymbolRecords(t.Sequence[R]):
+    """Records kept column by column, with their names as symbols
+
+    A record costs 4 bytes per name and 8 bytes per number, instead of a
+    dict or a tuple of its own. ``fields`` are the names followed by the
+    numbers, and reading a record builds it with ``make`` from its fields,
+    with the names looked up in ``symbols``.
+    """
+
+    __slots__ = ("symbols", "fields", "_make", "_name_columns", "_number_columns")
+
+    def __init__(
+        self,
+        symbols: SymbolTable,
+        make: t.Callable[..., R],
+        names: t.Sequence[str],
+        numbers: t.Sequence[str],
+    ) -> None:
+        self.symbols = symbols
+        self.fields: t.Tuple[str, ...] = (*names, *numbers)
+        self._make = make
+        self._name_columns: t.Tuple["array[int]", ...] = tuple(
+            array("i") for _ in names
+        )
+        self._number_columns: t.Tuple["array[float]", ...] = tuple(
+            array("d") for _ in numbers
+        )
+
+    def append(self, values: t.Sequence[t.Any]) -> None:
+        """Add a record from the values of its ``fields``, in order"""
+        if len(values) != len(self.fields):
+            raise ValueError(f"Expected values of {self.fields}, got {values!r}")
+        symbol = self.symbols.symbol
+        names = len(self._name_columns)
+        # Numbers are converted first, so a bad record adds nothing
+        numbers = [float(number) for number in values[names:]]
+        symbols = [symbol(name) for name in values[:names]]
+        for column, value in zip(self._name_columns, symbols):
+            column.append(value)
+        for number_column, number in zip(self._number_columns, numbers):
+            number_column.append(number)
+
+    def name_column(self, field: str) -> "array[int]":
+        """The symbols of the name ``field``, without copying them"""
+        return self._name_columns[self.fields.index(field)]
+
+    def number_column(self, field: str) -> "array[float]":
+        """The numbers of ``field``, without copying them"""
+        return self._number_columns[self.fields.index(field) - len(self._name_columns)]
+
+    def __len__(self) -> int:
+        columns = self._name_columns or self._number_columns
+        return len(columns[0]) if columns else 0
+
+    def _record(self, index: int) -> R:
+        name = self.symbols.name
+        values: t.List[t.Any] = [name(column[index]) for column in self._name_columns]
+        values.extend(column[index] for column in self._number_columns)
+        return self._make(**dict(zip(self.fields, values)))
+
+    @t.overload
+    def __getitem__(self, index: int) -> R:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[R]:
+        ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[R, t.List[R]]:
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self)))]
+        return self._record(index)
+
+    def __iter__(self) -> t.Iterator[R]:
+        return map(self._record, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (SymbolRecords, list)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _node_columns(nodes: SymbolRecords) -> t.Tuple["array[int]", "array[float]"]:
+    # Nodes of project_openrank_detail, or NameAndValue
+    id_field, value_field = ("id", "v") if "id" in nodes.fields else ("name", "value")
+    return nodes.name_column(id_field), nodes.number_column(value_field)
+
+
+def _edge_columns(
+    edges: SymbolRecords,
+) -> t.Tuple["array[int]", "array[int]", "array[float]"]:
+    # Edges of project_openrank_detail, or NameNameAndValue
+    source, target, weight = (
+        ("s", "t", "w") if "s" in edges.fields else ("name0", "name1", "value")
+    )
+    return (
+        edges.name_column(source),
+        edges.name_column(target),
+        edges.number_column(weight),
+    )
+
+
+def _node_id_and_value(node: t.Any) -> t.Tuple[str, float]:
+    if isinstance(node, dict):
+        return node["id"], node["v"]
+    return node.name, node.value
+
+
+def _edge(edge: t.Any) -> t.Tuple[str, str, float]:
+    if isinstance(edge, dict):
+        return edge["s"], edge["t"], edge["w"]
+    return edge.name0, edge.name1, edge.value
+
+
+class IndexedGraph:
+    """The nodes and edges of a network as arrays indexed by position
+
+    Nodes are stored as their symbols in ``symbols``, so a graph holds no
+    strings of its own, and the graphs of every month of a query refer to a
+    developer with the same integer. Edges are given by the symbols of
+    their nodes.
+    """
+
+    __slots__ = (
+        "symbols",
+        "node_symbols",
+        "node_values",
+        "offsets",
+        "targets",
+        "weights",
+        "out_weights",
+        "in_weights",
+        "_node_index",
+    )
+
+    def __init__(
+        self,
+        node_symbols: t.Iterable[int],
+        node_values: t.Iterable[float],
+        edges: t.Iterable[Edge],
+        symbols: SymbolTable,
+    ) -> None:
+        self.symbols = symbols
+        # The columns of SymbolRecords are shared, not copied
+        self.node_symbols: "array[int]" = (
+            node_symbols
+            if isinstance(node_symbols, array)
+            else array("i", node_symbols)
+        )
+        self.node_values: "array[float]" = (
+            t.cast("array[float]", node_values)
+            if isinstance(node_values, array)
+            else array("d", node_values)
+        )
+        # Built on the first lookup by id, see ``index``
+        self._node_index: t.Optional[t.Dict[int, int]] = None
+
+        node_count = len(self.node_symbols)
+        # Only needed while the edges are indexed. The first node wins when
+        # a symbol is repeated.
+        positions: t.Dict[int, int] = {}
+        for position, node_symbol in enumerate(self.node_symbols):
+            positions.setdefault(node_symbol, position)
+        edges = list(edges)
+        try:
+            sources = [positions[source] for source, _, _ in edges]
+            targets = [positions[target] for _, target, _ in edges]
+        except KeyError as e:
+            raise ValueError(
+                f"Edge refers to unknown node {symbols.name(e.args[0])!r}"
+            ) from None
+        weights = [weight for _, _, weight in edges]
+
+        # Edges sorted by source, the sort is stable so edges keep their
+        # order within a node
+        order = sorted(range(len(edges)), key=sources.__getitem__)
+        self.targets: "array[int]" = array("i", [targets[i] for i in order])
+        self.weights: "array[float]" = array("d", [weights[i] for i in order])
+        offsets = [0] * (node_count + 1)
+        out_weights = [0.0] * node_count
+        in_weights = [0.0] * node_count
+        for source, target, weight in zip(sources, targets, weights):
+            offsets[source + 1] += 1
+            out_weights[source] += weight
+            in_weights[target] += weight
+        self.offsets: "array[int]" = array("i", accumulate(offsets))
+        self.out_weights: "array[float]" = array("d", out_weights)
+        self.in_weights: "array[float]" = array("d", in_weights)
+
+    @classmethod
+    def from_network(
+        cls,
+        nodes: t.Sequence[t.Any],
+        edges: t.Sequence[t.Any],
+        ranked: bool = False,
+    ) -> "IndexedGraph":
+        """Index nodes and edges given as ``SymbolRecords``, or as lists of
+        ``NameAndValue`` and ``NameNameAndValue`` or of the dicts of
+        project_openrank_detail
+
+        Nodes and edges of a ``ranked`` network are indexed by descending
+        value.
+        """
+        node_symbols: t.Sequence[int]
+        node_values: t.Sequence[float]
+        sources: t.Sequence[int]
+        targets: t.Sequence[int]
+        weights: t.Sequence[float]
+        if isinstance(nodes, SymbolRecords):
+            symbols = nodes.symbols
+            node_symbols, node_values = _node_columns(nodes)
+        else:
+            symbols = get_symbols()
+            node_ids_and_values = [_node_id_and_value(node) for node in nodes]
+            node_symbols = [
+                symbols.symbol(node_id) for node_id, _ in node_ids_and_values
+            ]
+            node_values = [node_value for _, node_value in node_ids_and_values]
+        if isinstance(edges, SymbolRecords):
+            if edges.symbols is not symbols:
+                raise ValueError("Nodes and edges have different symbol tables")
+            sources, targets, weights = _edge_columns(edges)
+        else:
+            plain_edges = [_edge(edge) for edge in edges]
+            sources = [symbols.symbol(source_id) for source_id, _, _ in plain_edges]
+            targets = [symbols.symbol(target_id) for _, target_id, _ in plain_edges]
+            weights = [weight for _, _, weight in plain_edges]
+
+        if ranked:
+            # sorted keeps the order of equal values, like the sorted nodes
+            # and edges of BaseNetworkData
+            node_order = sorted(
+                range(len(node_values)), key=node_values.__getitem__, reverse=True
+            )
+            node_symbols = [node_symbols[i] for i in node_order]
+            node_values = [node_values[i] for i in node_order]
+            edge_order = sorted(
+                range(len(weights)), key=weights.__getitem__, reverse=True
+            )
+            sources = [sources[i] for i in edge_order]
+            targets = [targets[i] for i in edge_order]
+            weights = [weights[i] for i in edge_order]
+        return cls(node_symbols, node_values, zip(sources, targets, weights), symbols)
+
+    def __len__(self) -> int:
+        return len(self.node_symbols)
+
+    @property
+    def node_ids(self) -> t.List[str]:
+        """The ids of the nodes, by position"""
+        return [self.symbols.name(symbol) for symbol in self.node_symbols]
+
+    def index(self, node_id: str) -> int:
+        """The position of a node, raises ``KeyError`` for unknown ids"""
+        if self._node_index is None:
+            node_index: t.Dict[int, int] = {}
+            for position, node_symbol in enumerate(self.node_symbols):
+                node_index.setdefault(node_symbol, position)
+            self._node_index = node_index
+        symbol = self.symbols.get(node_id)
+        if symbol is None or symbol not in self._node_index:
+            raise KeyError(node_id)
+        return self._node_index[symbol]
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def out_edges(self, node_id: str) -> t.Iterator[t.Tuple[str, float]]:
+        """``(target id, weight)`` of the edges leaving ``node_id``"""
+        source = self.index(node_id)
+        node_symbols, name = self.node_symbols, self.symbols.name
+        for position in range(self.offsets[source], self.offsets[source + 1]):
+            yield name(node_symbols[self.targets[position]]), self.weights[position]
+
+    def iter_edges(self) -> t.Iterator[t.Tuple[int, int, float]]:
+        """``(source, target, weight)`` of every edge, as node indices"""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for source in range(len(self)):
+            for position in range(offsets[source], offsets[source + 1]):
+                yield source, targets[position], weights[position]
+
+    def to_dense(self) -> t.List[t.List[float]]:
+        """The N x N adjacency matrix, the last edge wins between two nodes"""
+        node_count = len(self)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        matrix = []
+        for source in range(node_count):
+            row = [0.0] * node_count
+            for position in range(offsets[source], offsets[source + 1]):
+                row[targets[position]] = weights[position]
+            matrix.append(row)
+        return matrix
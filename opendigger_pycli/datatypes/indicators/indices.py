@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import ClassVar, List
+from typing import ClassVar, List, Union
 
 from .base import BaseData, NameAndValue, TrivialIndicatorData
+from .timeseries import TimeSeries
 
 
 @dataclass
@@ -23,7 +24,7 @@ class OpenRankData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "openrank"
-    value: List[BaseData[float]]
+    value: Union[List[BaseData[float]], TimeSeries]
 
 
 @dataclass
@@ -36,7 +37,7 @@ class ActivityData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "activity"
-    value: List[BaseData[float]]
+    value: Union[List[BaseData[float]], TimeSeries]
 
 
 @dataclass
@@ -49,4 +50,4 @@ class AttentionData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "attention"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import ClassVar, List
+from typing import ClassVar, List, Union
 
 from .base import (
     BaseData,
@@ -8,6 +8,7 @@ from .base import (
     TimeDurationRelatedIndicatorDict,
     TrivialIndicatorData,
 )
+from .timeseries import TimeSeries
 
 
 @dataclass
@@ -30,7 +31,7 @@ class StarData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "stars"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -43,7 +44,7 @@ class TechnicalForkData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "technical_fork"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -54,7 +55,7 @@ class ParticipantData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "participants"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -83,7 +84,7 @@ class InactiveContributorData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "inactive_contributors"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -109,7 +110,7 @@ class NewIssueData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "issues_new"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -121,7 +122,7 @@ class ClosedIssueData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "issues_closed"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -132,7 +133,7 @@ class IssueCommentData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "issue_comments"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -190,7 +191,7 @@ class AddedCodeChangeLineData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "code_change_lines_add"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -203,7 +204,7 @@ class RemovedCodeChangeLineData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "code_change_lines_remove"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -216,7 +217,7 @@ class SumCodeChangeLineData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "code_change_lines_sum"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -229,7 +230,7 @@ class ChangeRequestData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "change_requests"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -242,7 +243,7 @@ class AcceptedChangeRequestData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "change_requests_accepted"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
@@ -255,7 +256,7 @@ class ChangeRequestReviewData(TrivialIndicatorData):
     """
 
     name: ClassVar[str] = "change_requests_reviews"
-    value: List[BaseData[int]]
+    value: Union[List[BaseData[int]], TimeSeries]
 
 
 @dataclass
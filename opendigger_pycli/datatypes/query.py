@@ -1,5 +1,11 @@
 import typing as t
 from dataclasses import dataclass, field
+from functools import cached_property
+
+
+def to_month_index(year: int, month: int) -> int:
+    """Number of months since year 0, which sorts like ``(year, month)``"""
+    return year * 12 + month - 1
 
 
 @dataclass(frozen=True)
@@ -7,3 +13,26 @@ class IndicatorQuery:
     months: t.FrozenSet[int] = field(default_factory=frozenset)
     years: t.FrozenSet[int] = field(default_factory=frozenset)
     year_months: t.FrozenSet[t.Tuple[int, int]] = field(default_factory=frozenset)
+
+    @cached_property
+    def year_month_indices(self) -> t.FrozenSet[int]:
+        return frozenset(to_month_index(*year_month) for year_month in self.year_months)
+
+    @cached_property
+    def intervals(self) -> t.Tuple[t.Tuple[int, int], ...]:
+        """The queried years and year-months as sorted, disjoint and inclusive
+        month index intervals, e.g. ``2015~2023`` is a single interval"""
+        bounds = sorted(
+            [(to_month_index(year, 1), to_month_index(year, 12)) for year in self.years]
+            + [
+                (to_month_index(*year_month), to_month_index(*year_month))
+                for year_month in self.year_months
+            ]
+        )
+        intervals: t.List[t.Tuple[int, int]] = []
+        for start, end in bounds:
+            if intervals and start <= intervals[-1][1] + 1:
+                intervals[-1] = (intervals[-1][0], max(intervals[-1][1], end))
+            else:
+                intervals.append((start, end))
+        return tuple(intervals)
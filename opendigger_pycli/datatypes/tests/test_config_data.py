@@ -1,8 +1,53 @@
 from dataclasses import fields
+from pathlib import Path
 
+from opendigger_pycli.config import config as config_module
+from opendigger_pycli.config import get_config
+from opendigger_pycli.config.utils import get_github_pat, has_github_pat
 from opendigger_pycli.datatypes import AppKeyConfig, UserInfoConfig
+from opendigger_pycli.utils.http import get_http_settings
 
 
 def test_config_data():
     print(fields(AppKeyConfig))
     print(fields(UserInfoConfig))
+
+
+def test_config_is_shared_and_reloaded(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("OPENDIGGER_APP_KEYS_GITHUB_PAT", raising=False)
+    monkeypatch.setattr(config_module, "_CONFIG", None)
+
+    config = get_config()
+    assert get_config() is config
+    assert not has_github_pat()
+
+    monkeypatch.setenv("OPENDIGGER_APP_KEYS_GITHUB_PAT", "from-env")
+    assert config.is_stale()
+    config = get_config(reload=True)
+    assert get_github_pat() == "from-env"
+
+    # Values from the environment are not written to config.ini
+    config.user_info.name = "someone"
+    config.update_config()
+    assert not config.is_stale()
+    user_config = Path(config.user_config_file_path).read_text()
+    assert "someone" in user_config and "from-env" not in user_config
+
+
+def test_http_settings_follow_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("OPENDIGGER_HTTP_MAX_RETRIES", raising=False)
+    monkeypatch.setattr(config_module, "_CONFIG", None)
+
+    settings = get_http_settings()
+    assert get_http_settings() is settings
+
+    monkeypatch.setenv("OPENDIGGER_HTTP_MAX_RETRIES", "7")
+    get_config(reload=True)
+    assert get_http_settings().max_retries == 7
+
+    config = get_config()
+    config.http.max_retries = "2"
+    config.update_config()
+    assert get_http_settings().max_retries == 2
@@ -1,3 +1,10 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, asdict
+from operator import attrgetter
+
+import pytest
+
 from opendigger_pycli.datatypes.indicators.base import AvgDataType, BaseData
 from opendigger_pycli.datatypes.indicators.indices import OpenRankData
 from opendigger_pycli.datatypes.indicators.metrics import IssueResponseTimeData
@@ -18,3 +25,24 @@ def test_init_data():
         }
     )
     assert issue_response_time is not None
+
+
+def test_base_data_is_slotted_and_immutable():
+    base_data = BaseData(year=2023, month=1, value=[1], is_raw=True)
+    assert not hasattr(base_data, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        base_data.value = [2]  # type: ignore[misc]
+    assert asdict(base_data) == {"year": 2023, "month": 1, "value": [1], "is_raw": True}
+    assert copy.deepcopy(base_data) == base_data
+    assert pickle.loads(pickle.dumps(base_data)) == base_data
+
+    base_data_list = [
+        BaseData(year=2023, month=2, value=1.0),
+        BaseData(year=2022, month=12, value=2.0),
+        BaseData(year=2023, month=1, value=3.0),
+        BaseData(year=2023, month=1, value=4.0, is_raw=True),
+    ]
+    expected = [base_data_list[i] for i in (1, 3, 2, 0)]
+    # Sorting by key and by comparison agree, raw values first in a month
+    assert sorted(base_data_list, key=attrgetter("sort_key")) == expected
+    assert sorted(base_data_list) == expected
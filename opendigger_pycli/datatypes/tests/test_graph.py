@@ -0,0 +1,89 @@
+import pytest
+
+from opendigger_pycli.datatypes import (
+    BaseNetworkData,
+    NameAndValue,
+    NameNameAndValue,
+    SymbolRecords,
+    SymbolTable,
+)
+
+
+def test_indexed_graph():
+    network_data = BaseNetworkData(
+        nodes=[NameAndValue("a", 3.0), NameAndValue("b", 2.0), NameAndValue("c", 1.0)],
+        edges=[
+            NameNameAndValue("b", "a", 1.0),
+            NameNameAndValue("a", "c", 2.0),
+            NameNameAndValue("a", "b", 4.0),
+        ],
+    )
+    graph = network_data.indexed
+    assert graph is network_data.indexed
+    assert graph.node_ids == ["a", "b", "c"]
+    assert [graph.index(node_id) for node_id in "abc"] == [0, 1, 2]
+    with pytest.raises(KeyError):
+        graph.index("x")
+    assert graph.edge_count == 3
+    assert list(graph.offsets) == [0, 2, 3, 3]
+    assert list(graph.out_edges("a")) == [("b", 4.0), ("c", 2.0)]
+    assert list(graph.out_weights) == [6.0, 1.0, 0.0]
+    assert list(graph.in_weights) == [1.0, 4.0, 2.0]
+    assert graph.to_dense() == [[0.0, 4.0, 2.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_indexed_project_openrank_network():
+    network_data = BaseNetworkData(
+        nodes=[
+            {"id": "a", "n": "", "c": "", "i": 0, "r": 0, "v": 1.5},
+            {"id": "b", "n": "", "c": "", "i": 0, "r": 0, "v": 0.5},
+        ],
+        edges=[{"s": "b", "t": "a", "w": 2.0}, {"s": "b", "t": "x", "w": 1.0}],
+    )
+    with pytest.raises(ValueError, match="unknown node 'x'"):
+        network_data.indexed
+
+    network_data.edges.pop()
+    graph = network_data.indexed
+    assert list(graph.node_values) == [1.5, 0.5]
+    assert list(graph.iter_edges()) == [(1, 0, 2.0)]
+
+
+def test_network_ranked_on_read():
+    nodes = [NameAndValue(name, value) for name, value in zip("abcde", [2, 5, 1, 5, 3])]
+    network_data = BaseNetworkData(nodes=nodes, edges=[])
+    # Nothing is sorted when the network is created
+    assert network_data.nodes is nodes
+    assert network_data.top_nodes(3) == [nodes[1], nodes[3], nodes[4]]
+    assert "sorted_nodes" not in vars(network_data)
+    assert network_data.sorted_nodes == [nodes[i] for i in (1, 3, 4, 0, 2)]
+    assert network_data.top_nodes(2) == network_data.sorted_nodes[:2]
+    assert network_data.top_edges(2) == []
+
+
+def test_symbol_records():
+    symbols = SymbolTable()
+    nodes = SymbolRecords(symbols, NameAndValue, ("name",), ("value",))
+    edges = SymbolRecords(symbols, NameNameAndValue, ("name0", "name1"), ("value",))
+    for node in [["a", 1], ["b", 3], ["c", 2]]:
+        nodes.append(node)
+    for edge in [["a", "b", 1], ["c", "a", 2]]:
+        edges.append(edge)
+    with pytest.raises(ValueError):
+        nodes.append(["d", "not a number"])
+    # A bad record adds nothing, not even its name
+    assert len(nodes) == 3
+    assert "d" not in symbols
+
+    assert list(nodes.name_column("name")) == [0, 1, 2]
+    assert nodes[1] == NameAndValue("b", 3.0)
+    assert nodes[-1:] == [NameAndValue("c", 2.0)]
+    assert edges == [NameNameAndValue("a", "b", 1.0), NameNameAndValue("c", "a", 2.0)]
+
+    # Indexed like the same network of NameAndValue lists
+    network_data = BaseNetworkData(nodes=nodes, edges=edges)
+    plain_network_data = BaseNetworkData(nodes=list(nodes), edges=list(edges))
+    assert network_data.indexed.node_ids == ["b", "c", "a"]
+    assert network_data.indexed.node_ids == plain_network_data.indexed.node_ids
+    assert network_data.indexed.to_dense() == plain_network_data.indexed.to_dense()
+    assert network_data.to_dict() == plain_network_data.to_dict()
@@ -15,3 +15,15 @@ def test_metric_query_set():
     q3 = None
 
     assert set([q1, q2, q3]) == set([q1, q3])
+
+
+def test_metric_query_intervals():
+    query = IndicatorQuery(
+        years=frozenset([2019, 2020, 2022]),
+        year_months=frozenset([(2021, 1), (2021, 3), (2018, 12)]),
+    )
+    assert query.intervals == (
+        (2018 * 12 + 11, 2021 * 12),
+        (2021 * 12 + 2, 2021 * 12 + 2),
+        (2022 * 12, 2022 * 12 + 11),
+    )
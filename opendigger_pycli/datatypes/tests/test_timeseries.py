@@ -0,0 +1,66 @@
+from opendigger_pycli.dataloaders.utils import load_base_data
+from opendigger_pycli.datatypes import (
+    BaseData,
+    IndicatorQuery,
+    OpenRankData,
+    TimeSeries,
+)
+from opendigger_pycli.results.query import query_trival_indicator
+
+DATA = {
+    "2023-02": 2.0,
+    "2022-12": 1.5,
+    "2023-01": 1.0,
+    "2023-01-raw": 0.5,
+    "2023-03": 3.0,
+}
+
+
+def test_time_series_matches_base_data_list():
+    series = TimeSeries.from_dict(DATA, float)
+    assert list(series) == load_base_data(DATA, float)
+    assert series == load_base_data(DATA, float)
+    assert series[1] == BaseData(year=2023, month=1, value=0.5, is_raw=True)
+    assert series[-1] == BaseData(year=2023, month=3, value=3.0)
+    assert series.nbytes == 5 * 13
+
+    counts = TimeSeries.from_dict({"2023-01": 3, "2023-02": 4}, int)
+    assert counts.value_type is int
+    assert [base_data.value for base_data in counts] == [3, 4]
+
+
+def test_time_series_slices_are_views():
+    series = TimeSeries.from_dict(DATA, float)
+    view = series[1:3]
+    assert isinstance(view, TimeSeries)
+    assert view._values is series._values
+    assert list(view) == list(series)[1:3]
+    assert list(view[1:]) == list(series)[2:3]
+    assert list(series[::2]) == list(series)[::2]
+    assert list(series[4:1]) == []
+
+
+def test_query_time_series():
+    series = TimeSeries.from_dict(DATA, float)
+    data = OpenRankData(value=series)
+    queried, failed_query = query_trival_indicator(data, [])
+    assert queried.value is series
+    assert failed_query is None
+
+    queried, failed_query = query_trival_indicator(
+        data,
+        [
+            IndicatorQuery(
+                years=frozenset([2022]),
+                months=frozenset(),
+                year_months=frozenset([(2023, 1), (2021, 5)]),
+            )
+        ],
+    )
+    assert isinstance(queried.value, TimeSeries)
+    assert [(d.year, d.month, d.value) for d in queried.value] == [
+        (2022, 12, 1.5),
+        (2023, 1, 0.5),
+        (2023, 1, 1.0),
+    ]
+    assert failed_query is not None and (2021, 5) in failed_query.year_months
@@ -3,7 +3,6 @@ import base64
 import math
 import typing as t
 from collections import OrderedDict
-from dataclasses import asdict
 from functools import cached_property
 from pathlib import Path
 
@@ -49,11 +48,19 @@ from opendigger_pycli.datatypes import (
     TechnicalForkData,
 )
 
-from .ai_report_utils import analyze_indicators_data
-
 if t.TYPE_CHECKING:
     from pyecharts.charts.base import Base as EchartsBase
 
+
+def analyze_indicators_data(
+    indicator_datum: t.List[t.Any],
+) -> t.Dict[str, t.Union[str, t.List[str]]]:
+    # openai takes long to import, only pay for it once a report is made
+    from .ai_report_utils import analyze_indicators_data as analyze
+
+    return analyze(indicator_datum)
+
+
 JINJA_ENV = Environment(
     loader=FileSystemLoader(str(Path(__file__).parent / "templates"))
 )
@@ -1207,11 +1214,11 @@ class NetworkExporter(BaseChartExporter):
                     "value": node.value,
                     "symbolSize": math.log(node.value + 1) * 10,
                 }
-                for node in indicator_data.value.nodes
+                for node in indicator_data.value.sorted_nodes
             ]
             edges = [
                 {"source": edge.name0, "target": edge.name1, "value": edge.value / 100}
-                for edge in indicator_data.value.edges
+                for edge in indicator_data.value.sorted_edges
             ]
 
             export_datum.append(
@@ -1259,7 +1266,7 @@ class ProjectOpenRankNetworkExporter(BaseChartExporter):
                     ExportData(
                         name=f"{get_indicator_title(indicator_data.name)}: {base_data.year}-{base_data.month:02}",
                         chart=ProjectOpenRankGraph(
-                            graph_data=str(asdict(base_data.value))
+                            graph_data=str(base_data.value.to_dict())
                         ),
                     )
                 )
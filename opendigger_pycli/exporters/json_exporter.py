@@ -23,9 +23,9 @@ def export_trivial_network_to_json(
         nodes: t.List[t.Tuple[str, float]] = []
         edges: t.List[t.Tuple[str, str, float]] = []
         base_network_data = t.cast("TrivialNetworkIndicatorData", indicator_data).value
-        for node in base_network_data.nodes:
+        for node in base_network_data.sorted_nodes:
             nodes.append(node.tuple)
-        for edge in base_network_data.edges:
+        for edge in base_network_data.sorted_edges:
             edges.append(edge.tuple)
         result = {"nodes": nodes, "edges": edges}
     else:
@@ -79,7 +79,7 @@ def export_indicator_to_json(
                 if base_data.is_raw
                 else f"{base_data.year}-{base_data.month:02}"
             )
-            result[key] = asdict(base_data.value) if base_data.value else None
+            result[key] = base_data.value.to_dict() if base_data.value else None
     else:
         values = t.cast("t.List[BaseData]", values)
         for value in values:
@@ -89,8 +89,8 @@ def export_indicator_to_json(
                 else f"{value.year}-{value.month:02}"
             )
             if isinstance(value.value, list) and hasattr(value.value[0], "name"):
-                value.value = t.cast("t.List[NameAndValue]", value.value)
-                result[key] = [v.tuple for v in value.value]
+                name_and_values = t.cast("t.List[NameAndValue]", value.value)
+                result[key] = [v.tuple for v in name_and_values]
             else:
                 result[key] = value.value
 
@@ -5,7 +5,6 @@ import typing as t
 from opendigger_pycli.console import CONSOLE
 from opendigger_pycli.console.utils import print_failed_query
 from opendigger_pycli.exporters import JSON_FORMT, REPORT_FORMAT
-from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
 from opendigger_pycli.exporters.json_exporter import export_indicator_to_json
 
 from .query import QueryResults, RepoQueryResult, UserQueryResult
@@ -77,6 +76,9 @@ class ExportResult:
     def _query_result_to_report(
         self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
     ) -> str:
+        # pyecharts and jinja2 are only needed for reports
+        from opendigger_pycli.exporters.chart_exporter import ChartReportExporter
+
         chart_report_exporter = ChartReportExporter()
 
         queried_indicators_data = query_result.queried_data
@@ -149,32 +151,46 @@ class ExportResult:
 
         return save_path
 
-    def export(self) -> None:
-        if not self.query_results:
-            CONSOLE.print("[red]No results to export")
-            return
+    def _export_query_result(
+        self, query_result: t.Union["RepoQueryResult", "UserQueryResult"]
+    ) -> None:
+        save_path = self._handle_save_path(query_result)
+        if save_path is None:
+            raise ValueError("Save path is None")
+
+        if self.format == "json":
+            result = self._query_result_to_json(query_result)
+
+            if self.is_split:
+                for indicator_name, indicator_json_data in result.items():
+                    save_path_splited = save_path / f"{indicator_name}.json"
+                    save_path_splited.write_text(
+                        json.dumps(indicator_json_data, indent=2, sort_keys=True)
+                    )
+                    CONSOLE.print(
+                        f"[green]Save Indicator {indicator_name} Data to {save_path}"
+                    )
+            else:
+                save_path.write_text(json.dumps(result, indent=2, sort_keys=True))
+                CONSOLE.print(f"[green]Save All Indicator Data to {save_path}")
+        else:
+            rv = self._query_result_to_report(query_result)
+            save_path.write_text(rv, encoding="utf-8")
+            CONSOLE.print(f"[green]Save Report to {save_path}")
 
+    def iter_export(
+        self,
+    ) -> t.Iterator[t.Union["RepoQueryResult", "UserQueryResult"]]:
+        """Export every result as it arrives and pass it through"""
+        is_empty = True
         for query_result in self.query_results:
-            save_path = self._handle_save_path(query_result)
-            if save_path is None:
-                raise ValueError("Save path is None")
-
-            if self.format == "json":
-                result = self._query_result_to_json(query_result)
-
-                if self.is_split:
-                    for indicator_name, indicator_json_data in result.items():
-                        save_path_splited = save_path / f"{indicator_name}.json"
-                        save_path_splited.write_text(
-                            json.dumps(indicator_json_data, indent=2, sort_keys=True)
-                        )
-                        CONSOLE.print(
-                            f"[green]Save Indicator {indicator_name} Data to {save_path}"
-                        )
-                else:
-                    save_path.write_text(json.dumps(result, indent=2, sort_keys=True))
-                    CONSOLE.print(f"[green]Save All Indicator Data to {save_path}")
-            else:
-                rv = self._query_result_to_report(query_result)
-                save_path.write_text(rv, encoding="utf-8")
-                CONSOLE.print(f"[green]Save Report to {save_path}")
+            is_empty = False
+            self._export_query_result(query_result)
+            yield query_result
+
+        if is_empty:
+            CONSOLE.print("[red]No results to export")
+
+    def export(self) -> None:
+        for _ in self.iter_export():
+            pass
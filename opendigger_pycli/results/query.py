@@ -1,16 +1,23 @@
 from __future__ import annotations
-import copy
+import asyncio
+import bisect
 import datetime
+import functools
+import itertools
+import operator
 import typing as t
-from dataclasses import dataclass, field, replace
+from concurrent.futures import Future, TimeoutError, as_completed
+from dataclasses import InitVar, dataclass, field, replace
+from urllib.parse import urlsplit
 
-from rich.progress import track
+from rich.progress import Progress
 
 from opendigger_pycli.datatypes import (
     NON_TRIVAL_NETWORK_INDICATOR_DATA,
     NON_TRIVIAL_INDICATOR_DATA,
     TRIVIAL_INDICATOR_DATA,
     TRIVIAL_NETWORK_INDICATOR_DATA,
+    DataloaderResult,
     IndicatorQuery,
 )
 from opendigger_pycli.console import CONSOLE
@@ -22,82 +29,472 @@ from opendigger_pycli.utils.gtihub_api import (
     create_issue_comment_reactions,
 )
 from opendigger_pycli.config.utils import get_github_pat, has_github_pat, get_user_info
-from opendigger_pycli.utils import THREAD_POOL
+from opendigger_pycli.utils import THREAD_POOL, aio_http, chunked
+from opendigger_pycli.dataloaders import filter_dataloader
+from opendigger_pycli.dataloaders.base import (
+    BaseOpenRankNetworkDataloader,
+    BaseRepoDataloader,
+    BaseUserDataloader,
+)
+from opendigger_pycli.dataloaders.utils import (
+    BASE_API_URL,
+    FETCH_ERRORS,
+    describe_fetch_error,
+    is_known_missing,
+)
+from opendigger_pycli.utils.deadline import (
+    DeadlineExceededError,
+    deadline_exceeded,
+    deadline_scope,
+    get_remaining,
+    is_past_deadline,
+)
+from opendigger_pycli.datatypes import TimeSeries, symbol_scope
+
+from .scheduler import DEFAULT_HOST_JOBS, DEFAULT_JOBS, FetchScheduler
 
 if t.TYPE_CHECKING:
     from opendigger_pycli.datatypes import (
         BaseData,
         DataloaderProto,
-        DataloaderResult,
         NonTrivalNetworkInciatorData,
         NonTrivialIndicatorData,
+        TimeDurationRelatedIndicatorDict,
         TrivialIndicatorData,
         TrivialNetworkIndicatorData,
     )
     from opendigger_pycli.utils.gtihub_api import IssueCommentInfoType, IssueInfoType
 
 
-@t.overload
-def run_dataloader(result: "RepoQueryResult") -> None:
-    ...
+# Number of targets fetched together by iter_query_results
+TARGETS_CHUNK_SIZE = 64
+# Host of the dataloaders that do not tell which host they fetch from
+DEFAULT_HOST = urlsplit(BASE_API_URL).netloc
 
+QueryResultT = t.TypeVar("QueryResultT", bound="BaseQueryResult")
 
-@t.overload
-def run_dataloader(result: "UserQueryResult") -> None:
-    ...
 
+def get_dataloader_host(dataloader: "DataloaderProto") -> str:
+    # Dataloaders document the url they fetch in demo_url, those of plugins
+    # may not, and then count as fetching from OpenDigger
+    demo_url = getattr(dataloader, "demo_url", None)
+    host = urlsplit(demo_url).netloc if isinstance(demo_url, str) else ""
+    return host or DEFAULT_HOST
 
-def run_dataloader(result) -> None:
-    if not isinstance(result, RepoQueryResult) and not isinstance(
-        result, UserQueryResult
-    ):
+
+def get_dataloader_dates(
+    result: "BaseQueryResult", dataloader: "DataloaderProto"
+) -> t.List[t.Tuple[int, int]]:
+    current_indicator_queries = [
+        indicator_query[1]
+        for indicator_query in result.indicator_queries
+        if indicator_query[0] == dataloader.name and indicator_query[1] is not None
+    ]
+
+    current_year = datetime.date.today().year
+    dates = set()
+    for query in current_indicator_queries:
+        for month in query.months:
+            dates.add((current_year, month))
+        for year in query.years:
+            for month in range(1, 13):
+                dates.add((year, month))
+        for year_month in query.year_months:
+            dates.add(year_month)
+    return sorted(dates)
+
+
+def get_load_args(
+    result: "BaseQueryResult",
+    dates: t.Optional[t.List[t.Tuple[int, int]]] = None,
+) -> t.Tuple[t.Any, ...]:
+    if isinstance(result, RepoQueryResult):
+        args: t.Tuple[t.Any, ...] = (result.org_name, result.repo_name)
+    elif isinstance(result, UserQueryResult):
+        args = (result.username,)
+    else:
         raise TypeError("result must be RepoQueryResult or UserQueryResult")
+    if dates is None:
+        return args
+    return (*args, dates)
+
+
+def get_unavailable_result(
+    dataloader: "DataloaderProto", e: Exception
+) -> "DataloaderResult":
+    """A failed result telling a throttled, failing or timed out fetch from
+    missing data"""
+    return DataloaderResult(
+        is_success=False,
+        dataloader=dataloader,
+        data=None,
+        desc=describe_fetch_error(e),
+        is_retryable=True,
+    )
+
+
+def get_error_result(dataloader: "DataloaderProto", e: Exception) -> "DataloaderResult":
+    """A failed result for an error raised by a dataloader, so that it fails
+    this indicator instead of the whole query"""
+    if isinstance(e, FETCH_ERRORS):
+        return get_unavailable_result(dataloader, e)
+    return DataloaderResult(
+        is_success=False,
+        dataloader=dataloader,
+        data=None,
+        desc=f"Failed to load data: {e.__class__.__name__}: {e}",
+    )
+
+
+def load_dataloader(
+    result: "BaseQueryResult",
+    dataloader: "DataloaderProto",
+    dates: t.Optional[t.List[t.Tuple[int, int]]] = None,
+) -> "DataloaderResult":
+    try:
+        return dataloader.load(*get_load_args(result, dates))
+    except Exception as e:
+        return get_error_result(dataloader, e)
+
+
+def get_known_missing_result(
+    result: "BaseQueryResult",
+    dataloader: "DataloaderProto",
+    dates: t.Optional[t.List[t.Tuple[int, int]]] = None,
+) -> t.Optional["DataloaderResult"]:
+    """Return a failed result if the data is known to be missing
+
+    This is decided from the negative cache alone, without any request.
+    Only dataloaders built on the base classes are known to fetch their
+    data through ``fetch_json``, so only those are checked.
+    """
+    if not isinstance(
+        dataloader,
+        (BaseRepoDataloader, BaseUserDataloader, BaseOpenRankNetworkDataloader),
+    ):
+        return None
+    if not is_known_missing(dataloader.load, *get_load_args(result, dates)):
+        return None
+    return DataloaderResult(
+        is_success=False,
+        dataloader=dataloader,
+        data=None,
+        desc="Cannot find data for this indicator",
+    )
+
+
+async def aload_dataloader(
+    result: "BaseQueryResult",
+    dataloader: "DataloaderProto",
+    dates: t.Optional[t.List[t.Tuple[int, int]]] = None,
+) -> "DataloaderResult":
+    known_missing_result = get_known_missing_result(result, dataloader, dates)
+    if known_missing_result is not None:
+        return known_missing_result
+    remaining = get_remaining()
+    try:
+        if remaining is None:
+            return await dataloader.aload(*get_load_args(result, dates))
+        return await asyncio.wait_for(
+            dataloader.aload(*get_load_args(result, dates)), max(remaining, 0)
+        )
+    except asyncio.TimeoutError as e:
+        if not is_past_deadline():
+            return get_error_result(dataloader, e)
+        return get_unavailable_result(dataloader, deadline_exceeded())
+    except Exception as e:
+        return get_error_result(dataloader, e)
+
+
+def plan_dataloader_jobs(
+    results: t.Sequence["BaseQueryResult"],
+) -> t.Iterator[
+    t.Tuple[
+        "BaseQueryResult",
+        "DataloaderProto",
+        t.List[t.Optional[t.List[t.Tuple[int, int]]]],
+    ]
+]:
+    """Yield every dataloader of every result with the dates of its jobs
+
+    Date-based dataloaders get one job per month, the others a single job
+    without dates.
+    """
+    for result in results:
+        for dataloader in result.dataloaders:
+            if not dataloader.pass_date:
+                yield result, dataloader, [None]
+                continue
+            dates = get_dataloader_dates(result, dataloader)
+            # For indicators that do not specify a query and need to pass in a date query, ignore it directly
+            if not dates:
+                continue
+            yield result, dataloader, [[date] for date in dates]
 
-    process_desc = (
-        f"Fetching data for {result.type}: [green]{result.username}"
-        if isinstance(result, UserQueryResult)
-        else f"Fetching data for {result.type}: [green]{result.org_name}/{result.repo_name}"
+
+def merge_dataloader_results(
+    dataloader_results: t.List["DataloaderResult"],
+) -> "DataloaderResult":
+    """Merge the results of a date-based dataloader loaded month by month"""
+    loaded_results = [
+        dataloader_result
+        for dataloader_result in dataloader_results
+        if dataloader_result.data is not None
+    ]
+    if len(dataloader_results) == 1 or not loaded_results:
+        return dataloader_results[0]
+    loaded_data = [
+        dataloader_result.data
+        for dataloader_result in loaded_results
+        if dataloader_result.data is not None
+    ]
+
+    descs = []
+    for dataloader_result in dataloader_results:
+        if dataloader_result.desc and dataloader_result.desc not in descs:
+            descs.append(dataloader_result.desc)
+    return replace(
+        loaded_results[0],
+        is_success=any(
+            dataloader_result.is_success for dataloader_result in dataloader_results
+        ),
+        desc="; ".join(descs),
+        data=replace(
+            loaded_data[0],
+            value=sorted(
+                itertools.chain.from_iterable(data.value for data in loaded_data),
+                key=operator.attrgetter("sort_key"),
+            ),
+        ),
+    )
+
+
+def describe_query_results(results: t.Sequence["BaseQueryResult"]) -> str:
+    if len(results) != 1:
+        return f"Fetching data for {len(results)} {results[0].type}s"
+    result = results[0]
+    if isinstance(result, UserQueryResult):
+        return f"Fetching data for {result.type}: [green]{result.username}"
+    result = t.cast("RepoQueryResult", result)
+    return (
+        f"Fetching data for {result.type}: [green]{result.org_name}/{result.repo_name}"
     )
-    for dataloader in track(result.dataloaders, description=process_desc):
-        if not dataloader.pass_date:
-            result.data[dataloader.name] = (
-                dataloader.load(
-                    result.org_name,
-                    result.repo_name,
+
+
+def get_job_result(
+    future: "Future[DataloaderResult]",
+    dataloader: "DataloaderProto",
+    deadline: t.Optional[float],
+) -> "DataloaderResult":
+    if future.done() and not future.cancelled():
+        e = future.exception()
+        if isinstance(e, Exception):
+            return get_error_result(dataloader, e)
+        return future.result()
+    # Still running or cancelled when the deadline passed
+    return get_unavailable_result(dataloader, DeadlineExceededError(deadline))
+
+
+def run_dataloaders(
+    results: t.Sequence["BaseQueryResult"],
+    jobs: int = DEFAULT_JOBS,
+    host_jobs: int = DEFAULT_HOST_JOBS,
+    deadline: t.Optional[float] = None,
+    transient: bool = False,
+) -> None:
+    """Fetch the data of all results through one shared work queue
+
+    Every (target, dataloader, date) fetch is a separate job, so that the
+    concurrency caps apply to the whole query instead of to one target at a
+    time. Jobs whose data is known to be missing are not scheduled at all.
+    The loaded data is put back into each result in dataloader order.
+    The names in the networks loaded by one call share a symbol table.
+
+    With a ``deadline`` in seconds, every fetch gets its timeouts capped by
+    the time left, and the function returns once it has passed, keeping
+    what was loaded and marking the other dataloaders as failed.
+    A ``transient`` progress bar is removed once the data is loaded.
+    """
+    if not results:
+        return
+
+    planned_jobs: t.List[
+        t.Tuple[
+            "BaseQueryResult", "DataloaderProto", t.List["Future[DataloaderResult]"]
+        ]
+    ] = []
+    with Progress(transient=transient) as progress, FetchScheduler(
+        jobs, host_jobs
+    ) as scheduler, deadline_scope(deadline), symbol_scope():
+        for result, dataloader, job_dates in plan_dataloader_jobs(results):
+            host = get_dataloader_host(dataloader)
+            futures: t.List["Future[DataloaderResult]"] = []
+            for dates in job_dates:
+                known_missing_result = get_known_missing_result(
+                    result, dataloader, dates
+                )
+                if known_missing_result is None:
+                    futures.append(
+                        scheduler.submit(
+                            host, load_dataloader, result, dataloader, dates
+                        )
+                    )
+                    continue
+                future: "Future[DataloaderResult]" = Future()
+                future.set_result(known_missing_result)
+                futures.append(future)
+            planned_jobs.append((result, dataloader, futures))
+
+        all_futures = [future for _, _, futures in planned_jobs for future in futures]
+        task_id = progress.add_task(
+            describe_query_results(results), total=len(all_futures)
+        )
+        remaining = get_remaining()
+        try:
+            for _ in as_completed(
+                all_futures, timeout=None if remaining is None else max(remaining, 0)
+            ):
+                progress.advance(task_id)
+        except TimeoutError:
+            # Running fetches end on their own at the deadline, do not wait
+            scheduler.shutdown(cancel=True)
+
+    for result, dataloader, futures in planned_jobs:
+        result.data[dataloader.name] = merge_dataloader_results(
+            [get_job_result(future, dataloader, deadline) for future in futures]
+        )
+
+
+def run_dataloader(result: "BaseQueryResult", jobs: int = DEFAULT_JOBS) -> None:
+    run_dataloaders([result], jobs=jobs)
+
+
+def iter_query_results(
+    results: t.Iterable[QueryResultT],
+    jobs: int = DEFAULT_JOBS,
+    host_jobs: int = DEFAULT_HOST_JOBS,
+    deadline: t.Optional[float] = None,
+    report_nodata: bool = True,
+    chunk_size: int = TARGETS_CHUNK_SIZE,
+) -> t.Iterator[QueryResultT]:
+    """Fetch and query results chunk by chunk, yielding them as they finish
+
+    ``results`` is consumed lazily, ``chunk_size`` results at a time, so
+    that only one chunk is held in memory however many targets there are.
+    The ``deadline`` applies to each chunk.
+    """
+    for chunk in chunked(results, chunk_size):
+        # The console records its output for display --save, which
+        # exports it after every result, so older output is never needed
+        CONSOLE.export_text(clear=True)
+        run_dataloaders(
+            chunk, jobs=jobs, host_jobs=host_jobs, deadline=deadline, transient=True
+        )
+        for result in chunk:
+            run_query(result, report_nodata=report_nodata)
+            yield result
+
+
+async def arun_dataloaders(
+    results: t.Sequence["BaseQueryResult"], deadline: t.Optional[float] = None
+) -> None:
+    """Asynchronous version of ``run_dataloaders``
+
+    All fetches run as tasks of the current event loop and share one HTTP
+    session, whose connection pool bounds the concurrency per host.
+    """
+    planned_jobs = list(plan_dataloader_jobs(results))
+    with deadline_scope(deadline), symbol_scope():
+        async with aio_http.session_scope():
+            dataloader_results = await asyncio.gather(
+                *(
+                    asyncio.gather(
+                        *(
+                            aload_dataloader(result, dataloader, dates)
+                            for dates in job_dates
+                        )
+                    )
+                    for result, dataloader, job_dates in planned_jobs
                 )
-                if isinstance(result, RepoQueryResult)
-                else dataloader.load(result.username)
             )
-            continue
-        current_indicator_queries = [
-            indicator_query[1]
-            for indicator_query in result.indicator_queries
-            if indicator_query[0] == dataloader.name and indicator_query[1] is not None
-        ]
-        # For indicators that do not specify a query and need to pass in a date query, ignore it directly
-        if not current_indicator_queries:
-            continue
 
-        current_year = datetime.date.today().year
-        dates = set()
-        for query in current_indicator_queries:
-            for month in query.months:
-                dates.add((current_year, month))
-            for year in query.years:
-                for month in range(1, 13):
-                    dates.add((year, month))
-            for year_month in query.year_months:
-                dates.add(year_month)
-
-        result.data[dataloader.name] = (
-            dataloader.load(result.org_name, result.repo_name, list(dates))
-            if isinstance(result, RepoQueryResult)
-            else dataloader.load(result.username, list(dates))
+    for (result, dataloader, _), current_results in zip(
+        planned_jobs, dataloader_results
+    ):
+        result.data[dataloader.name] = merge_dataloader_results(list(current_results))
+
+
+def get_all_dataloaders(
+    dataloader_type: t.Literal["repo", "user"]
+) -> t.List["DataloaderProto"]:
+    return list(
+        filter_dataloader(
+            {dataloader_type}, {"index", "metric", "network"}, {"X-lab", "CHAOSS"}
         )
+    )
+
+
+async def query_repo(
+    org: str,
+    repo: str,
+    dataloaders: t.Optional[t.List["DataloaderProto"]] = None,
+    indicator_queries: t.Optional[
+        t.List[t.Tuple[str, t.Optional["IndicatorQuery"]]]
+    ] = None,
+    uniform_query: t.Optional["IndicatorQuery"] = None,
+    deadline: t.Optional[float] = None,
+) -> "RepoQueryResult":
+    """Fetch and query the indicators of a repo without blocking the event loop
+
+    Queries gathered in the same ``aio_http.session_scope()`` share its
+    connection pool. With a ``deadline`` in seconds, the indicators not
+    loaded in time are failed results, see ``run_dataloaders``.
+    """
+    result = RepoQueryResult(
+        repo=(org, repo),
+        dataloaders=get_all_dataloaders("repo") if dataloaders is None else dataloaders,
+        indicator_queries=indicator_queries or [],
+        uniform_query=uniform_query,
+        fetch=False,
+    )
+    await arun_dataloaders([result], deadline=deadline)
+    run_query(result, report_nodata=False)
+    return result
+
+
+async def query_user(
+    username: str,
+    dataloaders: t.Optional[t.List["DataloaderProto"]] = None,
+    indicator_queries: t.Optional[
+        t.List[t.Tuple[str, t.Optional["IndicatorQuery"]]]
+    ] = None,
+    uniform_query: t.Optional["IndicatorQuery"] = None,
+    deadline: t.Optional[float] = None,
+) -> "UserQueryResult":
+    """Fetch and query the indicators of a user without blocking the event loop"""
+    result = UserQueryResult(
+        username=username,
+        dataloaders=get_all_dataloaders("user") if dataloaders is None else dataloaders,
+        indicator_queries=indicator_queries or [],
+        uniform_query=uniform_query,
+        fetch=False,
+    )
+    await arun_dataloaders([result], deadline=deadline)
+    run_query(result, report_nodata=False)
+    return result
 
 
 def merge_indicator_queries(
     indicator_queries: t.List["IndicatorQuery"],
+) -> "IndicatorQuery":
+    # Cached so that the intervals of the merged query are computed once
+    # for all the series it is run on
+    return _merge_indicator_queries(tuple(indicator_queries))
+
+
+@functools.lru_cache(maxsize=256)
+def _merge_indicator_queries(
+    indicator_queries: t.Tuple["IndicatorQuery", ...],
 ) -> "IndicatorQuery":
     need_years_list = [{year for year in query.years} for query in indicator_queries]
     need_years = set.union(*need_years_list) if need_years_list else set()
@@ -118,38 +515,148 @@ def merge_indicator_queries(
     )
 
 
+class BaseDataMonthIndices(t.Sequence[int]):
+    """The month indices of a ``List[BaseData]``, computed when read
+
+    The list must be sorted by ``sort_key``, which ``load_base_data`` and
+    the merge of monthly results guarantee, so no copy of its months is
+    made for a query and the binary searches read only the values they
+    visit.
+    """
+
+    __slots__ = ("_base_data_list",)
+
+    def __init__(self, base_data_list: t.List["BaseData"]) -> None:
+        self._base_data_list = base_data_list
+
+    def __len__(self) -> int:
+        return len(self._base_data_list)
+
+    @t.overload
+    def __getitem__(self, index: int) -> int:
+        ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[int]:
+        ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[int, t.List[int]]:
+        # to_month_index, inlined as slices run it for every value
+        if isinstance(index, slice):
+            return [
+                base_data.year * 12 + base_data.month - 1
+                for base_data in self._base_data_list[index]
+            ]
+        base_data = self._base_data_list[index]
+        return base_data.year * 12 + base_data.month - 1
+
+
+def get_month_indices(
+    base_data_list: t.Union[t.List["BaseData"], TimeSeries],
+) -> t.Sequence[int]:
+    """The sorted month indices of ``base_data_list``, without copying them"""
+    if isinstance(base_data_list, TimeSeries):
+        return base_data_list.month_indices
+    return BaseDataMonthIndices(base_data_list)
+
+
 def query_base_data(
-    base_data_list: t.List["BaseData"],
+    base_data_list: t.Union[t.List["BaseData"], TimeSeries],
     indicator_queries: t.List["IndicatorQuery"],
 ):
+    """Select the values matching any of ``indicator_queries``
+
+    The values are sorted by month, so every queried interval is found with
+    two binary searches, and a query costs O(log n) per interval plus the
+    number of values it selects. Values that are None are never selected.
+    """
     merged_indicator_query = merge_indicator_queries(indicator_queries)
-    success_year_query = set()
+    month_indices = get_month_indices(base_data_list)
+    count = len(month_indices)
+
+    def find(first: int, last: int) -> t.Tuple[int, int]:
+        lo = bisect.bisect_left(month_indices, first)
+        return lo, bisect.bisect_right(month_indices, last, lo)
+
+    def has_value(lo: int, hi: int) -> bool:
+        # A TimeSeries only holds numbers, a list may hold months that
+        # failed to load
+        if isinstance(base_data_list, TimeSeries):
+            return lo < hi
+        return any(base_data_list[i].value is not None for i in range(lo, hi))
+
+    selected_ranges: t.List[t.Tuple[int, int]] = []
+    if not indicator_queries:
+        selected_ranges.append((0, count))
+    for first, last in merged_indicator_query.intervals:
+        lo, hi = find(first, last)
+        if lo < hi:
+            selected_ranges.append((lo, hi))
+
     success_month_query = set()
-    success_year_month_query = set()
+    if merged_indicator_query.months and count:
+        # A month of every year is not an interval, look it up year by year
+        for year in range(month_indices[0] // 12, month_indices[-1] // 12 + 1):
+            for month in merged_indicator_query.months:
+                month_index = year * 12 + month - 1
+                lo, hi = find(month_index, month_index)
+                if has_value(lo, hi):
+                    success_month_query.add(month)
+                    selected_ranges.append((lo, hi))
+
+    merged_ranges: t.List[t.Tuple[int, int]] = []
+    for lo, hi in sorted(selected_ranges):
+        if merged_ranges and lo <= merged_ranges[-1][1]:
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], hi))
+        else:
+            merged_ranges.append((lo, hi))
 
-    queried_data = []
-    for base_data in base_data_list:
-        is_add = False
-        if base_data.value is None:
-            continue
-        if base_data.year in merged_indicator_query.years:
-            success_year_query.add(base_data.year)
-            is_add = True
-        if base_data.month in merged_indicator_query.months:
-            success_month_query.add(base_data.month)
-            is_add = True
-        if (
-            base_data.year,
-            base_data.month,
-        ) in merged_indicator_query.year_months:
-            success_year_month_query.add((base_data.year, base_data.month))
-            is_add = True
-        if not indicator_queries:
-            is_add = True
-
-        if not is_add:
-            continue
-        queried_data.append(base_data)
+    # Queried years are within the intervals too, jump from year to year
+    # through the selected values to find them
+    success_year_query = set()
+    if merged_indicator_query.years:
+        for lo, hi in merged_ranges:
+            while lo < hi:
+                year = month_indices[lo] // 12
+                next_lo = bisect.bisect_left(month_indices, (year + 1) * 12, lo, hi)
+                if year in merged_indicator_query.years and has_value(lo, next_lo):
+                    success_year_query.add(year)
+                lo = next_lo
+    # Queried year-months are within the intervals, the ones found are
+    # among the selected values
+    year_month_indices = merged_indicator_query.year_month_indices
+    success_year_month_query = (
+        {
+            (month_indices[index] // 12, month_indices[index] % 12 + 1)
+            for lo, hi in merged_ranges
+            for index in range(lo, hi)
+            if month_indices[index] in year_month_indices
+            and has_value(index, index + 1)
+        }
+        if year_month_indices
+        else set()
+    )
+
+    queried_data: t.Union[t.List["BaseData"], TimeSeries]
+    if isinstance(base_data_list, TimeSeries):
+        if len(merged_ranges) <= 1:
+            # The whole series is shared, a slice shares its arrays
+            lo, hi = merged_ranges[0] if merged_ranges else (0, 0)
+            queried_data = base_data_list if hi - lo == count else base_data_list[lo:hi]
+        else:
+            queried_data = base_data_list.take(
+                [index for lo, hi in merged_ranges for index in range(lo, hi)]
+            )
+    else:
+        queried_data = [
+            base_data
+            for lo, hi in merged_ranges
+            for base_data in base_data_list[lo:hi]
+            if base_data.value is not None
+        ]
+        if len(queried_data) == count:
+            # Everything is selected, share the list itself
+            queried_data = base_data_list
 
     faild_query = None
     if (
@@ -160,7 +667,7 @@ def query_base_data(
         faild_query = IndicatorQuery(
             years=merged_indicator_query.years - success_year_query,
             months=merged_indicator_query.months - success_month_query,
-            year_months=merged_indicator_query.year_months,
+            year_months=merged_indicator_query.year_months - success_year_month_query,
         )
 
     return queried_data, faild_query
@@ -170,15 +677,19 @@ def query_non_trivial_indicator(
     indicator_data: "NonTrivialIndicatorData",
     indicator_queries: t.List["IndicatorQuery"],
 ) -> t.Tuple["NonTrivialIndicatorData", t.Dict[str, t.Optional["IndicatorQuery"]]]:
-    queried_indicator_data = copy.deepcopy(indicator_data)
+    # The queried series share their values with the loaded ones, which
+    # are never modified, so nothing is copied
+    queried_value = {}
     failed_queries = {}
     for key, base_data_list in indicator_data.value.items():
         base_data_list = t.cast(t.List["BaseData"], base_data_list)
-        queried_base_data, failed_query = query_base_data(
+        queried_value[key], failed_queries[key] = query_base_data(
             base_data_list, indicator_queries
         )
-        queried_indicator_data.value[key] = queried_base_data  # type: ignore
-        failed_queries[key] = failed_query
+    queried_indicator_data = replace(
+        indicator_data,
+        value=t.cast("TimeDurationRelatedIndicatorDict", queried_value),
+    )
     return queried_indicator_data, failed_queries
 
 
@@ -298,11 +809,12 @@ class NodataIssueCreator:
             return
 
 
-def run_query(query_result: "BaseQueryResult") -> None:
+def run_query(query_result: "BaseQueryResult", report_nodata: bool = True) -> None:
     indicator_queries = query_result.indicator_queries
     indicators_data = query_result.data
 
     nodata_indicator_names = []
+    unavailable_indicator_descs = []
     for (
         indicator_name,
         indicator_dataloder_result,
@@ -318,6 +830,12 @@ def run_query(query_result: "BaseQueryResult") -> None:
             if query_result.uniform_query is None
             else [query_result.uniform_query]
         )
+        if indicator_dataloder_result.is_retryable:
+            # Not loaded for now, which is not missing data to report
+            unavailable_indicator_descs.append(
+                f"{indicator_name} ({indicator_dataloder_result.desc})"
+            )
+            continue
         if (
             not indicator_dataloder_result.is_success
             or not indicator_dataloder_result.data
@@ -372,6 +890,11 @@ def run_query(query_result: "BaseQueryResult") -> None:
             indicator_dataloder_result, data=queried_indciator_data
         )
 
+    if unavailable_indicator_descs:
+        CONSOLE.print(
+            "[yellow]Not loaded, try again later: "
+            f"{', '.join(unavailable_indicator_descs)}[/yellow]"
+        )
     if not nodata_indicator_names:
         return
 
@@ -385,6 +908,10 @@ def run_query(query_result: "BaseQueryResult") -> None:
         print_str = f"{title}, Indicator Names: {str(nodata_indicator_names)}, No Data"
 
     CONSOLE.print(f"[red]{print_str}[/red]")
+    # Missing data is reported to OpenDigger as issues, unless that is off,
+    # e.g. when the data comes from a mirror
+    if not report_nodata:
+        return
     if not has_github_pat():
         CONSOLE.print(
             "[yellow]You can config github personal access token to create issues automatically[/yellow]"
@@ -420,20 +947,28 @@ class RepoQueryResult(BaseQueryResult):
     org_name: str = field(init=False)
     repo_name: str = field(init=False)
 
-    def __post_init__(self) -> None:
+    # Fetch and query the data when created, pass False to fetch many
+    # results together with run_dataloaders or iter_query_results
+    fetch: InitVar[bool] = True
+
+    def __post_init__(self, fetch: bool) -> None:
         self.org_name, self.repo_name = self.repo
-        run_dataloader(self)
-        run_query(self)
+        if fetch:
+            run_dataloader(self)
+            run_query(self)
 
 
 @dataclass
 class UserQueryResult(BaseQueryResult):
     type: t.ClassVar[t.Literal["user"]] = "user"
     username: str
+    # See RepoQueryResult.fetch
+    fetch: InitVar[bool] = True
 
-    def __post_init__(self) -> None:
-        run_dataloader(self)
-        run_query(self)
+    def __post_init__(self, fetch: bool) -> None:
+        if fetch:
+            run_dataloader(self)
+            run_query(self)
 
 
-QueryResults = t.Union[t.List["RepoQueryResult"], t.List["UserQueryResult"]]
+QueryResults = t.Union[t.Iterable["RepoQueryResult"], t.Iterable["UserQueryResult"]]
@@ -0,0 +1,114 @@
+import contextvars
+import functools
+import threading
+import typing as t
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+T = t.TypeVar("T")
+
+# Number of fetches running at the same time for a whole query
+DEFAULT_JOBS = 16
+# Number of fetches running at the same time against one host. All the
+# built-in dataloaders fetch from the same host, so this is as high as
+# DEFAULT_JOBS for --jobs to be the limit by default.
+DEFAULT_HOST_JOBS = DEFAULT_JOBS
+
+
+class FetchScheduler:
+    """A work queue shared by all the fetches of a query
+
+    At most ``max_workers`` jobs run at the same time, and at most
+    ``max_per_host`` of them talk to the same host. Jobs over the host cap
+    wait in a per-host queue instead of occupying a worker, so a slow host
+    does not starve the others. Jobs run in a copy of the context they were
+    submitted from, so that they see its deadline.
+    """
+
+    def __init__(self, max_workers: int, max_per_host: int) -> None:
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._running: t.Dict[str, int] = defaultdict(int)
+        self._pending: t.Dict[
+            str, t.Deque[t.Tuple["Future[t.Any]", t.Callable[[], t.Any]]]
+        ] = defaultdict(deque)
+        self._futures: t.List["Future[t.Any]"] = []
+        self._is_shutdown = False
+
+    def submit(self, host: str, fn: t.Callable[..., T], *args, **kwargs) -> "Future[T]":
+        future: "Future[T]" = Future()
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        with self._lock:
+            self._futures.append(future)
+            if self._running[host] >= self.max_per_host:
+                self._pending[host].append((future, call))
+                return future
+            self._running[host] += 1
+        self._start(host, future, call)
+        return future
+
+    def _start(
+        self, host: str, future: "Future[t.Any]", call: t.Callable[[], t.Any]
+    ) -> None:
+        def run() -> None:
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    result = call()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            finally:
+                self._release(host)
+
+        self._executor.submit(run)
+
+    def _release(self, host: str) -> None:
+        with self._lock:
+            pending = self._pending[host]
+            if not pending:
+                self._running[host] -= 1
+                return
+            future, call = pending.popleft()
+        self._start(host, future, call)
+
+    def cancel_pending(self) -> None:
+        """Cancel the jobs still waiting for their host"""
+        with self._lock:
+            pending = [
+                future for queue in self._pending.values() for future, _ in queue
+            ]
+            self._pending.clear()
+        for future in pending:
+            future.cancel()
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """Wait for every job, or with ``cancel`` cancel the queued ones and
+        return while the running ones finish in the background."""
+        if self._is_shutdown:
+            return
+        self._is_shutdown = True
+        if cancel:
+            self.cancel_pending()
+            self._executor.shutdown(wait=False)
+            return
+        # Queued jobs are started by finishing ones, so wait for every job
+        # before shutting the executor down.
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            wait(futures)
+            with self._lock:
+                if len(futures) == len(self._futures):
+                    break
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "FetchScheduler":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
@@ -0,0 +1,245 @@
+import time
+import typing as t
+
+import pytest
+
+from opendigger_pycli.cli.parsers import QueryParser
+from opendigger_pycli.console import CONSOLE
+from opendigger_pycli.dataloaders.utils import load_non_trival_indicator_data
+from opendigger_pycli.datatypes import (
+    BaseData,
+    DataloaderResult,
+    IssueResponseTimeData,
+    OpenRankData,
+)
+from opendigger_pycli.results import query as query_module
+from opendigger_pycli.results.query import (
+    RepoQueryResult,
+    get_month_indices,
+    iter_query_results,
+    query_base_data,
+    query_non_trivial_indicator,
+    run_dataloaders,
+    run_query,
+)
+
+
+class SleepyRepoDataloader:
+    pass_date = False
+    indicator_type = "index"
+    introducer = "X-lab"
+    type = "repo"
+    demo_url = ""
+
+    def __init__(self, name: str, delay: float) -> None:
+        self.name = name
+        self.delay = delay
+
+    def load(self, org: str, repo: str) -> DataloaderResult:
+        time.sleep(self.delay)
+        return DataloaderResult(
+            is_success=True,
+            dataloader=t.cast(t.Any, self),
+            data=OpenRankData(value=[BaseData(year=2023, month=1, value=1.0)]),
+            desc="",
+        )
+
+
+def test_run_dataloaders_concurrently():
+    dataloaders = [
+        SleepyRepoDataloader(f"indicator_{i}", delay=0.2 - i * 0.02) for i in range(8)
+    ]
+    results = [
+        RepoQueryResult(
+            repo=("X-lab2017", f"repo-{i}"),
+            dataloaders=t.cast(t.Any, dataloaders),
+            indicator_queries=[],
+            uniform_query=None,
+            fetch=False,
+        )
+        for i in range(4)
+    ]
+    start = time.perf_counter()
+    run_dataloaders(results, jobs=32, host_jobs=32)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    for result in results:
+        assert list(result.data) == [dataloader.name for dataloader in dataloaders]
+        assert all(data.is_success for data in result.data.values())
+
+
+def test_run_dataloaders_deadline():
+    dataloaders = [SleepyRepoDataloader("fast", 0.01), SleepyRepoDataloader("slow", 1)]
+    result = RepoQueryResult(
+        repo=("X-lab2017", "open-digger"),
+        dataloaders=t.cast(t.Any, dataloaders),
+        indicator_queries=[],
+        uniform_query=None,
+        fetch=False,
+    )
+    start = time.perf_counter()
+    run_dataloaders([result], deadline=0.2)
+
+    # The query returns at the deadline with what it has
+    assert time.perf_counter() - start < 0.6
+    assert result.data["fast"].is_success
+    assert not result.data["slow"].is_success
+    assert result.data["slow"].is_retryable
+    assert result.data["slow"].desc == "Deadline of 0.2s exceeded"
+
+
+def test_iter_query_results_reads_targets_lazily():
+    dataloaders = [SleepyRepoDataloader("fast", 0)]
+    read_targets = []
+
+    def results():
+        for i in range(1000):
+            read_targets.append(i)
+            yield RepoQueryResult(
+                repo=("X-lab2017", f"repo-{i}"),
+                dataloaders=t.cast(t.Any, dataloaders),
+                indicator_queries=[],
+                uniform_query=None,
+                fetch=False,
+            )
+
+    query_results = iter_query_results(results(), report_nodata=False, chunk_size=10)
+    first = next(query_results)
+    # Only the first chunk has been read and loaded
+    assert len(read_targets) == 10
+    assert first.queried_data["fast"].is_success
+    assert sum(1 for _ in query_results) == 999
+
+
+def test_query_base_data():
+    base_data_list = [
+        BaseData(year=2020, month=12, value=1.0),
+        BaseData(year=2021, month=1, value=0.5, is_raw=True),
+        BaseData(year=2021, month=1, value=2.0),
+        BaseData(year=2021, month=2, value=None),
+        BaseData(year=2021, month=3, value=3.0),
+        BaseData(year=2023, month=3, value=4.0),
+    ]
+    query = QueryParser().try_parse_indicator_query("2021-01~2021-02,3,2022~2023")
+    assert query is not None
+
+    queried, failed_query = query_base_data(base_data_list, [query])
+    assert queried == [base_data_list[i] for i in (1, 2, 4, 5)]
+    assert failed_query is not None
+    assert failed_query.years == {2022}
+    assert failed_query.months == set()
+    assert failed_query.year_months == {(2021, 2)}
+
+    queried, failed_query = query_base_data(base_data_list, [])
+    assert queried == [base_data_list[i] for i in (0, 1, 2, 4, 5)]
+    assert failed_query is None
+
+
+def test_query_base_data_reads_months_from_the_list():
+    base_data_list = [
+        BaseData(year=2021, month=2, value=None),
+        BaseData(year=2021, month=3, value=3.0),
+        BaseData(year=2022, month=2, value=None),
+    ]
+    month_indices = get_month_indices(base_data_list)
+    # Months are read from the list, not copied for every query
+    assert month_indices[1] == 2021 * 12 + 2
+    assert month_indices[1:] == [2021 * 12 + 2, 2022 * 12 + 1]
+    base_data_list.append(BaseData(year=2023, month=2, value=1.0))
+    assert len(month_indices) == 4
+
+    query = QueryParser().try_parse_indicator_query("2,2022")
+    assert query is not None
+    queried, failed_query = query_base_data(base_data_list, [query])
+    # Months that failed to load are neither selected nor found
+    assert queried == [base_data_list[3]]
+    assert failed_query is not None
+    assert failed_query.years == {2022}
+    assert failed_query.months == set()
+
+    base_data_list[2] = BaseData(year=2022, month=2, value=2.0)
+    queried, failed_query = query_base_data(base_data_list, [])
+    assert queried == base_data_list[1:]
+    assert failed_query is None
+
+
+def test_query_non_trivial_indicator_shares_values():
+    months = ["2021-12", "2022-01", "2022-02"]
+    indicator_data = IssueResponseTimeData(
+        value=load_non_trival_indicator_data(
+            {
+                "avg": {month: 1.5 for month in months},
+                "levels": {month: [1, 2] for month in months},
+                **{
+                    f"quantile_{i}": {month: float(i) for month in months}
+                    for i in range(5)
+                },
+            }
+        )
+    )
+    query = QueryParser().try_parse_indicator_query("2022")
+    assert query is not None
+
+    queried, failed_queries = query_non_trivial_indicator(indicator_data, [query])
+    assert queried is not indicator_data
+    assert not any(failed_queries.values())
+    for key, base_data_list in indicator_data.value.items():
+        # Queried values are the loaded ones, not copies of them
+        assert len(queried.value[key]) == 2
+        assert all(
+            queried_data is base_data
+            for queried_data, base_data in zip(queried.value[key], base_data_list[1:])
+        )
+    # The loaded data is left untouched
+    assert len(indicator_data.value["avg"]) == 3
+
+    queried, _ = query_non_trivial_indicator(indicator_data, [])
+    assert all(
+        queried.value[key] is base_data_list
+        for key, base_data_list in indicator_data.value.items()
+    )
+
+
+class BrokenRepoDataloader(SleepyRepoDataloader):
+    def load(self, org: str, repo: str) -> DataloaderResult:
+        raise ValueError("Expecting value")
+
+
+def test_run_dataloaders_fails_one_indicator_per_error():
+    dataloaders = [SleepyRepoDataloader("fast", 0), BrokenRepoDataloader("broken", 0)]
+    result = RepoQueryResult(
+        repo=("X-lab2017", "open-digger"),
+        dataloaders=t.cast(t.Any, dataloaders),
+        indicator_queries=[],
+        uniform_query=None,
+        fetch=False,
+    )
+    run_dataloaders([result])
+
+    # The error fails its indicator, the others are still loaded
+    assert result.data["fast"].is_success
+    assert not result.data["broken"].is_success
+    assert not result.data["broken"].is_retryable
+    assert (
+        result.data["broken"].desc == "Failed to load data: ValueError: Expecting value"
+    )
+
+
+def test_run_query_prints_missing_data_without_reporting_it(monkeypatch):
+    dataloaders = [SleepyRepoDataloader("fast", 0), BrokenRepoDataloader("broken", 0)]
+    result = RepoQueryResult(
+        repo=("X-lab2017", "open-digger"),
+        dataloaders=t.cast(t.Any, dataloaders),
+        indicator_queries=[],
+        uniform_query=None,
+        fetch=False,
+    )
+    run_dataloaders([result])
+    monkeypatch.setattr(
+        query_module, "has_github_pat", lambda: pytest.fail("no issue to file")
+    )
+    with CONSOLE.capture() as capture:
+        run_query(result, report_nodata=False)
+
+    assert "Indicator Names: ['broken'], No Data" in capture.get()
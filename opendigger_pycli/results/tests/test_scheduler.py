@@ -0,0 +1,29 @@
+import threading
+import time
+
+from opendigger_pycli.results.scheduler import FetchScheduler
+
+
+def test_fetch_scheduler_host_cap():
+    lock = threading.Lock()
+    running = {"a": 0, "b": 0}
+    max_running = {"a": 0, "b": 0}
+
+    def job(host: str, i: int) -> int:
+        with lock:
+            running[host] += 1
+            max_running[host] = max(max_running[host], running[host])
+        time.sleep(0.01)
+        with lock:
+            running[host] -= 1
+        return i
+
+    with FetchScheduler(max_workers=8, max_per_host=2) as scheduler:
+        futures = [
+            scheduler.submit(host, job, host, i) for i in range(10) for host in "ab"
+        ]
+
+    assert [future.result() for future in futures] == [
+        i for i in range(10) for _ in "ab"
+    ]
+    assert max_running == {"a": 2, "b": 2}
@@ -1,3 +1,17 @@
+import itertools
+import typing as t
 from concurrent.futures import ThreadPoolExecutor
 
+T = t.TypeVar("T")
+
 THREAD_POOL = ThreadPoolExecutor()
+
+
+def chunked(iterable: t.Iterable[T], size: int) -> t.Iterator[t.List[T]]:
+    """Yield lists of ``size`` items, consuming ``iterable`` lazily"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,168 @@
+"""
+Asyncio counterpart of :mod:`opendigger_pycli.utils.http`.
+
+All requests made inside one :func:`session_scope` share a single aiohttp
+session, so thousands of fetches can run in one event loop over a bounded
+pool of keep-alive connections. Timeouts and retries follow the ``[http]``
+config section, and requests go through the same per-host ``HostLimiter``
+as the blocking transport, with the same deadline and hedging. aiohttp asks for gzip,
+deflate and, with the ``brotli`` package installed, br responses itself.
+"""
+import asyncio
+import contextlib
+import functools
+import random
+import time
+import typing as t
+from contextvars import ContextVar
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .http import (
+    RETRY_BACKOFF_FACTOR,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+    get_host_limiter,
+    get_http_settings,
+)
+from .deadline import check_deadline, deadline_exceeded, is_past_deadline
+from .hedging import LatencyTracker, ahedged_call, get_latency_tracker
+from .rate_limit import HostLimiter
+
+_SESSION: ContextVar[t.Optional[aiohttp.ClientSession]] = ContextVar(
+    "opendigger_aio_session", default=None
+)
+
+
+class Response(t.NamedTuple):
+    status_code: int
+    headers: t.Mapping[str, str]
+    content: bytes
+
+
+def create_session() -> aiohttp.ClientSession:
+    settings = get_http_settings()
+    connect_timeout, read_timeout = settings.timeout
+    # trust_env picks up proxy settings from the environment, like requests
+    return aiohttp.ClientSession(
+        trust_env=True,
+        connector=aiohttp.TCPConnector(limit_per_host=settings.pool_size),
+        timeout=aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        ),
+    )
+
+
+@contextlib.asynccontextmanager
+async def session_scope() -> t.AsyncIterator[aiohttp.ClientSession]:
+    """Reuse the session of the enclosing scope, or open one for this scope"""
+    session = _SESSION.get()
+    if session is not None:
+        yield session
+        return
+    async with create_session() as session:
+        token = _SESSION.set(session)
+        try:
+            yield session
+        finally:
+            _SESSION.reset(token)
+
+
+def get_retry_delay(attempt: int) -> float:
+    return random.uniform(0, RETRY_BACKOFF_FACTOR * 2**attempt)
+
+
+async def _wait_for_limiter(limiter: HostLimiter, retry: bool = False) -> None:
+    delay = limiter.acquire(retry=retry)
+    remaining = check_deadline()
+    if remaining is not None and delay >= remaining:
+        raise deadline_exceeded()
+    await asyncio.sleep(delay)
+
+
+async def _send(
+    session: aiohttp.ClientSession,
+    limiter: HostLimiter,
+    tracker: LatencyTracker,
+    max_retries: int,
+    method: str,
+    url: str,
+    headers: t.Optional[t.Mapping[str, str]],
+) -> Response:
+    """Send a request whose first attempt the limiter has let through"""
+    attempt = 0
+    while True:
+        if attempt > 0:
+            await _wait_for_limiter(limiter, retry=True)
+        started_at = time.monotonic()
+        try:
+            async with session.request(method, url, headers=headers) as r:
+                content = await r.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= max_retries:
+                limiter.record_error()
+                raise
+            await asyncio.sleep(get_retry_delay(attempt))
+            attempt += 1
+            continue
+
+        can_retry = attempt < max_retries
+        # The limiter itself delays the retry of a throttled request
+        throttled = limiter.check_response(r.status, r.headers)
+        if throttled and can_retry and method in RETRY_METHODS:
+            attempt += 1
+            continue
+        if r.status in RETRY_STATUS_CODES and can_retry:
+            await asyncio.sleep(get_retry_delay(attempt))
+            attempt += 1
+            continue
+        limiter.record_result(r.status, throttled)
+        if r.status < 500 and not throttled:
+            tracker.record(time.monotonic() - started_at)
+        return Response(r.status, r.headers, content)
+
+
+async def request(
+    method: str, url: str, headers: t.Optional[t.Mapping[str, str]] = None
+) -> Response:
+    """Send a request through the session of the scope and its host limiter
+
+    Raises ``DeadlineExceededError`` if the enclosing deadline passes
+    before the response has been read.
+    """
+    settings = get_http_settings()
+    host = urlsplit(url).netloc
+    tracker = get_latency_tracker(host)
+    limiter = get_host_limiter(host)
+    async with session_scope() as session:
+        # Waiting for the limiter is not part of the latency that is hedged
+        await _wait_for_limiter(limiter)
+        send = functools.partial(
+            _send,
+            session,
+            limiter,
+            tracker,
+            settings.max_retries,
+            method,
+            url,
+            headers,
+        )
+        hedge_delay = (
+            tracker.hedge_delay if settings.hedge and method in RETRY_METHODS else None
+        )
+        remaining = check_deadline()
+        if remaining is None:
+            return await ahedged_call(send, hedge_delay, limiter.try_acquire)
+        try:
+            return await asyncio.wait_for(
+                ahedged_call(send, hedge_delay, limiter.try_acquire), remaining
+            )
+        except asyncio.TimeoutError:
+            if is_past_deadline():
+                raise deadline_exceeded() from None
+            raise
+
+
+async def get(url: str, headers: t.Optional[t.Mapping[str, str]] = None) -> Response:
+    return await request("GET", url, headers=headers)
@@ -1,19 +1,135 @@
+"""
+Checks that repositories and users given on the command line exist on GitHub.
+
+All names are checked at once, with concurrent ``HEAD`` requests instead of
+downloading every GitHub page one after another. Names found to exist are
+remembered in a small file in the cache directory for
+``cache.verify_ttl_hours``, so that the names queried every day are not
+checked again on every run.
+"""
+import json
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
 
+from opendigger_pycli.config.utils import (
+    get_cache_config,
+    get_cache_dir_path,
+    strip_config_value,
+)
+
+from . import http
+from .files import write_file_atomic
+from .rate_limit import HostUnavailableError
+
+GITHUB_URL = "https://github.com"
+VERIFIED_NAMES_FILE = "verified_names.json"
+MAX_WORKERS = 16
+_HOUR = 60 * 60
+
+
+class VerifiedNames:
+    """GitHub paths (``org/repo`` or ``username``) known to exist
+
+    Paths are compared case-insensitively, as GitHub does.
+    """
+
+    def __init__(self, path: Path, ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._checked_at: t.Dict[str, float] = {}
+        try:
+            self._checked_at = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            # Missing or corrupted, every name gets checked again
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        checked_at = self._checked_at.get(name.lower())
+        return checked_at is not None and time.time() - checked_at < self.ttl
+
+    def add(self, names: t.Iterable[str]) -> None:
+        now = time.time()
+        names = [name.lower() for name in names]
+        if not names:
+            return
+        self._checked_at = {
+            name: checked_at
+            for name, checked_at in self._checked_at.items()
+            if now - checked_at < self.ttl
+        }
+        self._checked_at.update((name, now) for name in names)
+        try:
+            write_file_atomic(self.path, json.dumps(self._checked_at).encode("utf-8"))
+        except OSError:
+            # Not being able to remember the names only costs requests
+            pass
+
+
+def open_verified_names() -> VerifiedNames:
+    cache_config = get_cache_config()
+    return VerifiedNames(
+        get_cache_dir_path() / VERIFIED_NAMES_FILE,
+        ttl=float(strip_config_value(cache_config.verify_ttl_hours)) * _HOUR,
+    )
+
+
+def _exist_gh_path(path: str) -> t.Optional[bool]:
+    """Whether a GitHub page exists, None if GitHub could not tell"""
+    try:
+        # Renamed repositories and users redirect to their new name
+        resp = http.head(f"{GITHUB_URL}/{path}", allow_redirects=True)
+    except (requests.RequestException, HostUnavailableError):
+        return None
+    with resp:
+        if resp.status_code == 200:
+            return True
+        if resp.status_code == 404:
+            return False
+        return None
+
+
+def find_missing_gh_paths(paths: t.Iterable[str]) -> t.List[str]:
+    """Return the paths that do not exist on GitHub
+
+    Paths that cannot be checked, e.g. because GitHub throttles us, are
+    given the benefit of the doubt and not returned.
+    """
+    verified_names = open_verified_names()
+    unchecked = [path for path in dict.fromkeys(paths) if path not in verified_names]
+    if not unchecked:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(unchecked), MAX_WORKERS)) as pool:
+        results = list(pool.map(_exist_gh_path, unchecked))
+    verified_names.add(path for path, exists in zip(unchecked, results) if exists)
+    return [path for path, exists in zip(unchecked, results) if exists is False]
+
+
+def find_missing_gh_repos(
+    repos: t.Sequence[t.Tuple[str, str]]
+) -> t.List[t.Tuple[str, str]]:
+    """Return the ``(org, repo)`` pairs that do not exist on GitHub"""
+    missing = set(find_missing_gh_paths(f"{org}/{repo}" for org, repo in repos))
+    return [(org, repo) for org, repo in repos if f"{org}/{repo}" in missing]
+
+
+def find_missing_gh_users(usernames: t.Sequence[str]) -> t.List[str]:
+    """Return the usernames that do not exist on GitHub"""
+    return find_missing_gh_paths(usernames)
+
 
 def exist_gh_repo(org_name: str, repo_name: str) -> bool:
     """
     Check if a repo exists on GitHub
     """
-    url = f"https://github.com/{org_name}/{repo_name}"
-    resp = requests.get(url)
-    return resp.status_code == 200
+    return not find_missing_gh_repos([(org_name, repo_name)])
 
 
 def exist_gh_user(username: str) -> bool:
     """
     Check if a user exists on GitHub
     """
-    url = f"https://github.com/{username}"
-    resp = requests.get(url)
-    return resp.status_code == 200
+    return not find_missing_gh_users([username])
@@ -0,0 +1,273 @@
+"""
+Compressed storage of indicator files with a dictionary trained on them.
+
+Indicator files are small and look alike (``"2023-01"`` keys, short
+numbers), which is the case where a shared dictionary helps compression
+the most. A ``BodyCodec`` compresses with zstd when the optional
+``zstandard`` package is installed, otherwise with zlib and a preset
+dictionary. The first bodies written are kept as samples, and once there
+are enough of them a dictionary is trained and saved next to the data,
+so that later bodies, and later processes, use it.
+
+Reading detects the format from the first bytes, so plain JSON files,
+bodies written before a dictionary existed and bodies written with the
+other codec all stay readable.
+"""
+import threading
+import typing as t
+import zlib
+from pathlib import Path
+
+from opendigger_pycli.utils.files import open_file_atomic, write_file_atomic
+from opendigger_pycli.utils.json_stream import iter_file_chunks
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover
+    zstd = None  # type: ignore
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Samples needed before a dictionary is trained, sampling stops after ten
+# failed attempts
+TRAIN_SAMPLE_COUNT = 100
+# Bigger bodies are not sampled, they compress well on their own
+MAX_SAMPLE_SIZE = 64 * 1024
+DICT_SIZE = 32 * 1024
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 9
+
+
+class _Compressor(t.Protocol):
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
+
+class _Decompressor(t.Protocol):
+    def decompress(self, data: bytes) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
+
+class _ZstdCompressor:
+    def __init__(self, compressor: "zstd.ZstdCompressor") -> None:
+        self._compressobj = compressor.compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressobj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressobj.flush()
+
+
+def _is_zlib_header(header: bytes) -> bool:
+    return (
+        len(header) >= 2
+        and header[0] & 0x0F == 8
+        and (header[0] << 8 | header[1]) % 31 == 0
+    )
+
+
+class BodyCodec:
+    def __init__(self, dict_dir: Path, compress: bool = True) -> None:
+        self.dict_dir = Path(dict_dir)
+        self.enabled = compress
+        self.codec = "zstd" if zstd is not None else "zlib"
+        self._lock = threading.Lock()
+        self._dicts: t.Dict[str, bytes] = {}
+        self._samples: t.List[bytes] = []
+        self._training = True
+        self._active_dict = self._load_active_dict()
+
+    def _dict_path(self, codec: str, dict_id: int) -> Path:
+        return self.dict_dir / f"{codec}-{dict_id}.dict"
+
+    def _active_path(self) -> Path:
+        return self.dict_dir / f"{self.codec}.active"
+
+    def _load_dict(self, codec: str, dict_id: int) -> bytes:
+        key = f"{codec}-{dict_id}"
+        if key not in self._dicts:
+            self._dicts[key] = self._dict_path(codec, dict_id).read_bytes()
+        return self._dicts[key]
+
+    def _load_active_dict(self) -> t.Optional[t.Tuple[int, bytes]]:
+        try:
+            dict_id = int(self._active_path().read_text().strip())
+            return dict_id, self._load_dict(self.codec, dict_id)
+        except (OSError, ValueError):
+            return None
+
+    def _train(self) -> None:
+        # Called with _lock held
+        samples = self._samples
+        if self.codec == "zstd":
+            try:
+                trained = zstd.train_dictionary(DICT_SIZE, samples)
+            except zstd.ZstdError:
+                # Not enough data yet, keep sampling
+                return
+            dict_id, dict_data = trained.dict_id(), trained.as_bytes()
+        else:
+            # zlib has no training, a preset dictionary is raw content that
+            # later data is likely to repeat, most useful at its end
+            dict_data = b"".join(samples)[-DICT_SIZE:]
+            dict_id = zlib.adler32(dict_data)
+        self._samples = []
+        write_file_atomic(self._dict_path(self.codec, dict_id), dict_data)
+        write_file_atomic(self._active_path(), str(dict_id).encode())
+        self._dicts[f"{self.codec}-{dict_id}"] = dict_data
+        self._active_dict = dict_id, dict_data
+
+    def _add_sample(self, data: bytes) -> None:
+        if (
+            self._active_dict is not None
+            or not self._training
+            or len(data) > MAX_SAMPLE_SIZE
+        ):
+            return
+        with self._lock:
+            if self._active_dict is not None or not self._training:
+                return
+            self._samples.append(data)
+            if len(self._samples) % TRAIN_SAMPLE_COUNT:
+                return
+            if len(self._samples) > 10 * TRAIN_SAMPLE_COUNT:
+                self._training = False
+                self._samples = []
+                return
+            self._train()
+
+    def compressobj(self) -> _Compressor:
+        active_dict = self._active_dict
+        if self.codec == "zstd":
+            dict_data = (
+                zstd.ZstdCompressionDict(active_dict[1])
+                if active_dict is not None
+                else None
+            )
+            return _ZstdCompressor(
+                zstd.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dict_data)
+            )
+        if active_dict is not None:
+            return zlib.compressobj(ZLIB_LEVEL, zdict=active_dict[1])
+        return zlib.compressobj(ZLIB_LEVEL)
+
+    def compress(self, data: bytes) -> bytes:
+        if not self.enabled:
+            return data
+        compressor = self.compressobj()
+        compressed = compressor.compress(data) + compressor.flush()
+        self._add_sample(data)
+        # Tiny bodies grow with the frame header, JSON never starts like a
+        # compressed frame so they can be stored as they are
+        return compressed if len(compressed) < len(data) else data
+
+    def write(self, path: Path, data: bytes) -> int:
+        """Write data compressed and atomically, return the size on disk"""
+        compressed = self.compress(data)
+        write_file_atomic(path, compressed)
+        return len(compressed)
+
+    def write_stream(
+        self, path: Path, chunks: t.Iterable[bytes]
+    ) -> t.Generator[bytes, None, int]:
+        """Pass chunks through while writing them like ``write``
+
+        Returns the size on disk once the last chunk has been read, nothing
+        is written if the chunks are not read to the end. Small bodies are
+        collected and written with ``write``, so they are sampled too.
+        """
+        chunks = iter(chunks)
+        head: t.List[bytes] = []
+        head_size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            head_size += len(chunk)
+            yield chunk
+            if head_size > MAX_SAMPLE_SIZE:
+                break
+        else:
+            return self.write(path, b"".join(head))
+
+        compressor = self.compressobj() if self.enabled else None
+        size = 0
+        with open_file_atomic(path) as f:
+
+            def write(data: bytes) -> None:
+                nonlocal size
+                if compressor is not None:
+                    data = compressor.compress(data)
+                f.write(data)
+                size += len(data)
+
+            for chunk in head:
+                write(chunk)
+            for chunk in chunks:
+                write(chunk)
+                yield chunk
+            if compressor is not None:
+                data = compressor.flush()
+                f.write(data)
+                size += len(data)
+        return size
+
+    def decompress(self, chunks: t.Iterable[bytes]) -> t.Iterator[bytes]:
+        """Yield the decompressed chunks of a body in any supported format"""
+        chunks = iter(chunks)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            # Long enough for any zstd frame header
+            if len(head) >= 18:
+                break
+        if not head:
+            return
+
+        decompressobj: _Decompressor
+        if head.startswith(ZSTD_MAGIC):
+            if zstd is None:
+                raise RuntimeError(
+                    "Reading zstd compressed data needs the zstandard package"
+                )
+            dict_id = zstd.get_frame_parameters(head).dict_id
+            dict_data = (
+                zstd.ZstdCompressionDict(self._load_dict("zstd", dict_id))
+                if dict_id
+                else None
+            )
+            decompressobj = zstd.ZstdDecompressor(dict_data=dict_data).decompressobj()
+        elif _is_zlib_header(head):
+            if head[1] & 0x20:
+                dict_id = int.from_bytes(head[2:6], "big")
+                decompressobj = zlib.decompressobj(
+                    zdict=self._load_dict("zlib", dict_id)
+                )
+            else:
+                decompressobj = zlib.decompressobj()
+        else:
+            # Stored uncompressed
+            yield head
+            yield from chunks
+            return
+
+        yield decompressobj.decompress(head)
+        for chunk in chunks:
+            data = decompressobj.decompress(chunk)
+            if data:
+                yield data
+        tail = decompressobj.flush()
+        if tail:
+            yield tail
+
+    def read_file(self, f: t.BinaryIO) -> t.Iterator[bytes]:
+        """Yield the decompressed chunks of an open file, then close it"""
+        with f:
+            yield from self.decompress(iter_file_chunks(f))
+
+    def read(self, path: Path) -> bytes:
+        return b"".join(self.read_file(path.open("rb")))
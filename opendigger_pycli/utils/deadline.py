@@ -0,0 +1,93 @@
+"""
+End-to-end deadlines for fetches.
+
+``deadline_scope(seconds)`` sets an absolute deadline in a context variable,
+so that every request made inside it, in this thread, in worker threads
+started with a copy of the context, or in asyncio tasks, gets its timeouts
+capped by the time that is left. Once the deadline has passed, requests
+raise ``DeadlineExceededError`` instead of being sent.
+"""
+import contextlib
+import time
+import typing as t
+from contextvars import ContextVar
+
+T = t.TypeVar("T")
+
+_DEADLINE: ContextVar[t.Optional[float]] = ContextVar(
+    "opendigger_deadline", default=None
+)
+# The number of seconds the deadline was set to, for error messages
+_BUDGET: ContextVar[t.Optional[float]] = ContextVar("opendigger_budget", default=None)
+
+
+class DeadlineExceededError(Exception):
+    def __init__(self, budget: t.Optional[float] = None) -> None:
+        super().__init__(
+            "Deadline exceeded"
+            if budget is None
+            else f"Deadline of {budget:g}s exceeded"
+        )
+        self.budget = budget
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: t.Optional[float]) -> t.Iterator[None]:
+    """Give everything fetched inside the block ``seconds`` in total
+
+    A nested scope never extends the deadline of the enclosing one, and
+    ``None`` keeps the enclosing deadline, if any.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None and current < deadline:
+        yield
+        return
+    deadline_token = _DEADLINE.set(deadline)
+    budget_token = _BUDGET.set(seconds)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(deadline_token)
+        _BUDGET.reset(budget_token)
+
+
+def get_remaining() -> t.Optional[float]:
+    """Seconds left before the deadline, None without a deadline"""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def is_past_deadline() -> bool:
+    remaining = get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def deadline_exceeded() -> DeadlineExceededError:
+    return DeadlineExceededError(_BUDGET.get())
+
+
+def check_deadline() -> t.Optional[float]:
+    """Return the seconds left, raise if the deadline has passed"""
+    remaining = get_remaining()
+    if remaining is not None and remaining <= 0:
+        raise deadline_exceeded()
+    return remaining
+
+
+def cap_timeout(timeout: float) -> float:
+    """Cap a timeout by the time left, raise if the deadline has passed"""
+    remaining = check_deadline()
+    return timeout if remaining is None else min(timeout, remaining)
+
+
+def iter_until_deadline(chunks: t.Iterable[T]) -> t.Iterator[T]:
+    """Pass chunks through, raise once the deadline has passed"""
+    for chunk in chunks:
+        check_deadline()
+        yield chunk
@@ -0,0 +1,43 @@
+import contextlib
+import os
+import tempfile
+import typing as t
+from pathlib import Path
+
+import click
+
+
+@contextlib.contextmanager
+def open_file_atomic(path: Path) -> t.Iterator[t.BinaryIO]:
+    """Open a temporary file next to path and rename it into place on exit
+
+    Readers see either the old file or the complete new one, never a
+    partially written file. Nothing is written if the block raises.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    with open_file_atomic(path) as f:
+        f.write(data)
+
+
+def read_targets(path: t.Union[str, Path]) -> t.Iterator[str]:
+    """Yield the ``org/repo`` or username on each line, skipping comments
+
+    ``-`` reads the standard input. Lines are read one at a time, so the
+    file can be arbitrarily long.
+    """
+    with click.open_file(str(path), encoding="utf-8") as f:
+        for line in f:
+            target = line.split("#", 1)[0].strip()
+            if target:
+                yield target
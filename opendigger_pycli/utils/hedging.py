@@ -0,0 +1,145 @@
+"""
+Hedged requests against tail latency.
+
+Every host keeps a window of its recent response times. Once a request has
+been waiting longer than the 95th percentile of that window, a duplicate of
+it is sent, and whichever answers first is used. Only about one request in
+twenty is duplicated, and a single stalled connection no longer holds up a
+whole query.
+"""
+import asyncio
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+T = t.TypeVar("T")
+
+HEDGE_PERCENTILE = 0.95
+# No hedging before a host has answered this many requests
+MIN_SAMPLES = 20
+WINDOW_SIZE = 256
+# Both copies of a hedged request run in this pool while the caller waits,
+# so it has room for the requests of many concurrent callers
+HEDGE_POOL_SIZE = 128
+
+_TRACKERS: t.Dict[str, "LatencyTracker"] = {}
+_TRACKERS_LOCK = threading.Lock()
+_HEDGE_POOL: t.Optional[ThreadPoolExecutor] = None
+
+
+class LatencyTracker:
+    def __init__(self) -> None:
+        self._samples: t.Deque[float] = deque(maxlen=WINDOW_SIZE)
+        self._hedge_delay: t.Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            # Sorting the window for every sample would cost more than the
+            # requests it speeds up
+            if len(self._samples) >= MIN_SAMPLES and len(self._samples) % 8 == 0:
+                samples = sorted(self._samples)
+                self._hedge_delay = samples[int(len(samples) * HEDGE_PERCENTILE)]
+
+    @property
+    def hedge_delay(self) -> t.Optional[float]:
+        """Seconds after which to send a duplicate, None if not known yet"""
+        return self._hedge_delay
+
+
+def get_latency_tracker(host: str) -> LatencyTracker:
+    tracker = _TRACKERS.get(host)
+    if tracker is not None:
+        return tracker
+    with _TRACKERS_LOCK:
+        return _TRACKERS.setdefault(host, LatencyTracker())
+
+
+def _get_hedge_pool() -> ThreadPoolExecutor:
+    global _HEDGE_POOL
+    if _HEDGE_POOL is None:
+        with _TRACKERS_LOCK:
+            if _HEDGE_POOL is None:
+                _HEDGE_POOL = ThreadPoolExecutor(
+                    max_workers=HEDGE_POOL_SIZE, thread_name_prefix="opendigger-hedge"
+                )
+    return _HEDGE_POOL
+
+
+def _first_success(futures: t.List["Future[T]"]) -> "Future[T]":
+    pending = set(futures)
+    failed: t.Optional["Future[T]"] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future
+            failed = failed or future
+    return t.cast("Future[T]", failed)
+
+
+def _always() -> bool:
+    return True
+
+
+def hedged_call(
+    call: t.Callable[[], T],
+    delay: t.Optional[float],
+    discard: t.Callable[[T], None],
+    can_hedge: t.Callable[[], bool] = _always,
+) -> T:
+    """Run ``call``, and a second ``call`` if the first takes over ``delay``
+
+    ``call`` must be safe to run twice at the same time, and must copy the
+    context it needs. The second call is only made if ``can_hedge`` allows
+    it once ``delay`` has passed. The result that loses the race is handed
+    to ``discard`` once it is there.
+    """
+    if delay is None:
+        return call()
+    pool = _get_hedge_pool()
+    primary = pool.submit(call)
+    done, _ = wait([primary], timeout=delay)
+    if done or not can_hedge():
+        return primary.result()
+
+    futures = [primary, pool.submit(call)]
+    winner = _first_success(futures)
+    for future in futures:
+        if future is not winner:
+            future.add_done_callback(
+                lambda f: discard(f.result()) if f.exception() is None else None
+            )
+    return winner.result()
+
+
+async def ahedged_call(
+    call: t.Callable[[], t.Awaitable[T]],
+    delay: t.Optional[float],
+    can_hedge: t.Callable[[], bool] = _always,
+) -> T:
+    """Asynchronous version of ``hedged_call``, the loser is cancelled"""
+    if delay is None:
+        return await call()
+    tasks = [asyncio.ensure_future(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done and can_hedge():
+            tasks.append(asyncio.ensure_future(call()))
+        pending = set(tasks)
+        failed: t.Optional["asyncio.Future[T]"] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                failed = failed or task
+        return t.cast("asyncio.Future[T]", failed).result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
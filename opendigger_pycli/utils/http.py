@@ -0,0 +1,260 @@
+"""
+Shared HTTP transport used by the dataloaders and the GitHub API helpers.
+
+Every host gets its own connection-pooled ``requests.Session``, so repeated
+requests reuse TCP/TLS connections instead of doing a handshake each time.
+Requests get explicit connect/read timeouts, and idempotent requests are
+retried with jittered exponential backoff on 5xx responses. Requests to a
+host also go through its ``HostLimiter`` (see ``rate_limit``), which paces
+them, retries 429 responses at a lower rate and fails fast with
+``HostUnavailableError`` while the host is unhealthy. Timeouts are capped
+by the deadline of the enclosing ``deadline_scope``, and GET requests that
+take longer than usual for their host are hedged (see ``hedging``). Every
+request asks for a compressed response in all the encodings urllib3 can
+decode here (brotli and zstd when their packages are installed).
+"""
+import contextvars
+import functools
+import random
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from opendigger_pycli.config.utils import (
+    cache_per_config,
+    get_http_config,
+    is_config_value_true,
+    strip_config_value,
+)
+
+from .deadline import (
+    cap_timeout,
+    check_deadline,
+    deadline_exceeded,
+    get_remaining,
+    is_past_deadline,
+)
+from .hedging import LatencyTracker, get_latency_tracker, hedged_call
+from .rate_limit import HostLimiter
+
+# 429 is retried by the HostLimiter, so that it can lower the rate first
+RETRY_STATUS_CODES = frozenset([500, 502, 503, 504])
+# Idempotent methods, the only ones retried after a throttled response
+RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+RETRY_BACKOFF_FACTOR = 0.5
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Sessions and limiters of every host, with the settings they were built
+# with so that they are built again once the settings change
+_SESSIONS: t.Dict[str, t.Tuple["HttpSettings", requests.Session]] = {}
+_SESSIONS_LOCK = threading.Lock()
+_LIMITERS: t.Dict[str, t.Tuple["HttpSettings", HostLimiter]] = {}
+
+
+class JitteredRetry(Retry):
+    """Retry with "full jitter" backoff, so that concurrent clients that
+    failed at the same time do not retry at the same time. No retry is
+    started once the deadline of the request has passed."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        remaining = get_remaining()
+        if remaining is not None:
+            backoff = min(backoff, max(remaining, 0))
+        return random.uniform(0, backoff)
+
+    def is_exhausted(self) -> bool:
+        return super().is_exhausted() or is_past_deadline()
+
+
+class HttpSettings(t.NamedTuple):
+    pool_size: int
+    timeout: t.Tuple[float, float]
+    max_retries: int
+    max_requests_per_second: float
+    circuit_failures: int
+    circuit_reset_seconds: float
+    hedge: bool
+
+
+@cache_per_config
+def get_http_settings() -> HttpSettings:
+    http_config = get_http_config()
+    return HttpSettings(
+        pool_size=int(strip_config_value(http_config.pool_size)),
+        timeout=(
+            float(strip_config_value(http_config.connect_timeout)),
+            float(strip_config_value(http_config.read_timeout)),
+        ),
+        max_retries=int(strip_config_value(http_config.max_retries)),
+        max_requests_per_second=float(
+            strip_config_value(http_config.max_requests_per_second)
+        ),
+        circuit_failures=int(strip_config_value(http_config.circuit_failures)),
+        circuit_reset_seconds=float(
+            strip_config_value(http_config.circuit_reset_seconds)
+        ),
+        hedge=is_config_value_true(http_config.hedge),
+    )
+
+
+def _create_session(settings: HttpSettings) -> requests.Session:
+    retry = JitteredRetry(
+        total=settings.max_retries,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the pooled session for the host of the given url"""
+    host = urlsplit(url).netloc
+    settings = get_http_settings()
+    cached = _SESSIONS.get(host)
+    if cached is not None and cached[0] == settings:
+        return cached[1]
+    with _SESSIONS_LOCK:
+        cached = _SESSIONS.get(host)
+        if cached is None or cached[0] != settings:
+            cached = _SESSIONS[host] = (settings, _create_session(settings))
+    return cached[1]
+
+
+def get_host_limiter(host: str) -> HostLimiter:
+    """Return the limiter shared by all requests to a host"""
+    settings = get_http_settings()
+    cached = _LIMITERS.get(host)
+    if cached is not None and cached[0] == settings:
+        return cached[1]
+    with _SESSIONS_LOCK:
+        cached = _LIMITERS.get(host)
+        if cached is None or cached[0] != settings:
+            limiter = HostLimiter(
+                host,
+                max_rate=settings.max_requests_per_second,
+                failure_threshold=settings.circuit_failures,
+                reset_timeout=settings.circuit_reset_seconds,
+            )
+            cached = _LIMITERS[host] = (settings, limiter)
+    return cached[1]
+
+
+def _cap_timeouts(timeout: t.Any) -> t.Any:
+    if isinstance(timeout, tuple):
+        return tuple(cap_timeout(value) for value in timeout)
+    return cap_timeout(timeout)
+
+
+def _wait_for_limiter(limiter: HostLimiter, retry: bool = False) -> None:
+    delay = limiter.acquire(retry=retry)
+    remaining = check_deadline()
+    if remaining is not None and delay >= remaining:
+        raise deadline_exceeded()
+    time.sleep(delay)
+
+
+def _close_response(r: requests.Response) -> None:
+    r.close()
+
+
+def _send(
+    session: requests.Session,
+    limiter: HostLimiter,
+    tracker: LatencyTracker,
+    max_retries: int,
+    method: str,
+    url: str,
+    **kwargs,
+) -> requests.Response:
+    """Send a request whose first attempt the limiter has let through"""
+    attempt = 0
+    while True:
+        if attempt > 0:
+            _wait_for_limiter(limiter, retry=True)
+        kwargs["timeout"] = _cap_timeouts(kwargs["timeout"])
+        started_at = time.monotonic()
+        try:
+            r = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if is_past_deadline():
+                raise deadline_exceeded() from e
+            limiter.record_error()
+            raise
+        throttled = limiter.check_response(r.status_code, r.headers)
+        if throttled and method in RETRY_METHODS and attempt < max_retries:
+            r.close()
+            attempt += 1
+            continue
+        limiter.record_result(r.status_code, throttled)
+        if r.status_code < 500 and not throttled:
+            tracker.record(time.monotonic() - started_at)
+        return r
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through the pooled session and limiter of its host
+
+    Raises ``DeadlineExceededError`` if the enclosing deadline passes
+    before a response arrives.
+    """
+    settings = get_http_settings()
+    kwargs.setdefault("timeout", settings.timeout)
+    host = urlsplit(url).netloc
+    tracker = get_latency_tracker(host)
+    limiter = get_host_limiter(host)
+    # Waiting for the limiter is not part of the latency that is hedged
+    _wait_for_limiter(limiter)
+    send = functools.partial(
+        _send,
+        get_session(url),
+        limiter,
+        tracker,
+        settings.max_retries,
+        method,
+        url,
+        **kwargs,
+    )
+    if not settings.hedge or method not in RETRY_METHODS:
+        return send()
+    # Both copies run in other threads, each in its own copy of this
+    # context so that they see its deadline. The hedge is only sent if the
+    # limiter has a token for it right away.
+    context = contextvars.copy_context()
+    return hedged_call(
+        lambda: context.copy().run(send),
+        tracker.hedge_delay,
+        discard=_close_response,
+        can_hedge=limiter.try_acquire,
+    )
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    return request("HEAD", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
@@ -0,0 +1,119 @@
+"""
+Incremental decoding of a top-level JSON object from a stream of chunks.
+
+Arrays under the requested keys are decoded one element at a time, so a
+caller can turn each element into its final form while the rest of the
+document is still being read, and neither the whole text nor the whole
+intermediate dict is ever held in memory.
+"""
+import codecs
+import json
+import re
+import typing as t
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def iter_file_chunks(f: t.BinaryIO, chunk_size: int = CHUNK_SIZE) -> t.Iterator[bytes]:
+    return iter(lambda: f.read(chunk_size), b"")
+
+
+class _JsonStream:
+    def __init__(self, chunks: t.Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_size: int = 1) -> bool:
+        """Append at least min_size characters, return False at the end"""
+        if self.eof:
+            return False
+        # Drop what has been consumed so the buffer stays small
+        self.buf = self.buf[self.pos :]  # noqa: E203
+        self.pos = 0
+        parts = [self.buf]
+        added = 0
+        while added < min_size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self.eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            added += len(text)
+        self.buf = "".join(parts)
+        return True
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            self.pos = t.cast(t.Match, _WHITESPACE.match(self.buf, self.pos)).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"Expecting one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def decode_value(self) -> t.Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value, double the buffer so that long values
+                # are not decoded again for every chunk
+                if not self.fill(max(len(self.buf) - self.pos, CHUNK_SIZE)):
+                    raise
+                continue
+            if end == len(self.buf) and self.fill():
+                # A number may go on in the next chunk
+                continue
+            self.pos = end
+            return value
+
+
+def iter_object_members(
+    chunks: t.Iterable[bytes], array_keys: t.Container[str] = ()
+) -> t.Iterator[t.Tuple[str, t.Any]]:
+    """Yield the ``(key, value)`` members of a JSON object read from chunks
+
+    Arrays under ``array_keys`` are yielded element by element, as one
+    ``(key, element)`` pair per element.
+    """
+    stream = _JsonStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.decode_value()
+        if not isinstance(key, str):
+            raise stream.error("Expecting property name")
+        stream.expect(":")
+        if key in array_keys and stream.peek() == "[":
+            stream.pos += 1
+            if stream.peek() == "]":
+                stream.pos += 1
+            else:
+                while True:
+                    yield key, stream.decode_value()
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            yield key, stream.decode_value()
+        if stream.expect(",}") == "}":
+            return
@@ -0,0 +1,214 @@
+"""
+Per-host request rate limiting and circuit breaking.
+
+Every host gets a ``HostLimiter``, shared by the blocking and the asyncio
+transports. Its token bucket starts at ``http.max_requests_per_second``,
+halves its rate whenever the host answers 429 (waiting out ``Retry-After``
+when there is one) and slowly speeds up again on successes. Its circuit
+breaker opens after ``http.circuit_failures`` consecutive failed requests,
+so that requests to an unhealthy host fail fast instead of piling up, and
+lets a single trial request through once ``http.circuit_reset_seconds``
+have passed.
+"""
+import email.utils
+import threading
+import time
+import typing as t
+
+# The rate never goes below this many requests per second
+MIN_RATE = 0.5
+# Requests per second added back after every successful request
+RATE_INCREASE = 0.5
+# Longer waits (e.g. until an hourly GitHub quota resets) are not waited out,
+# the circuit breaker makes the requests fail fast instead
+MAX_RETRY_AFTER = 60.0
+
+
+class HostUnavailableError(Exception):
+    """A host keeps failing, or the circuit breaker of a host is open"""
+
+    def __init__(self, host: str, reason: str) -> None:
+        super().__init__(f"{host} is unavailable: {reason}")
+        self.host = host
+        self.reason = reason
+
+
+class ThrottledError(HostUnavailableError):
+    """A host keeps rejecting our requests with rate limit responses"""
+
+    def __init__(self, host: str, reason: str = "too many requests") -> None:
+        super().__init__(host, reason)
+
+
+def is_throttled(status_code: int, headers: t.Mapping[str, str]) -> bool:
+    if status_code == 429:
+        return True
+    # GitHub answers 403 once the rate limit of a token is used up
+    return status_code == 403 and headers.get("X-RateLimit-Remaining") == "0"
+
+
+def get_retry_after(headers: t.Mapping[str, str]) -> t.Optional[float]:
+    """Seconds to wait according to ``Retry-After`` or ``X-RateLimit-Reset``"""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after).timestamp()
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at - time.time(), 0.0)
+    reset_at = headers.get("X-RateLimit-Reset")
+    if reset_at is not None and reset_at.isdigit():
+        return max(float(reset_at) - time.time(), 0.0)
+    return None
+
+
+class TokenBucket:
+    def __init__(self, max_rate: float) -> None:
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self._tokens = max_rate
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.max_rate, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token, return how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Tokens taken in advance make the balance negative, so that
+            # concurrent callers get increasing delays
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._blocked_until - now)
+
+    def try_take(self) -> bool:
+        """Take a token only if one can be used right away"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens < 1 or now < self._blocked_until:
+                return False
+            self._tokens -= 1
+            return True
+
+    def slow_down(self, retry_after: t.Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.rate / 2, MIN_RATE)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after is not None:
+                self._blocked_until = max(
+                    self._blocked_until, now + min(retry_after, MAX_RETRY_AFTER)
+                )
+
+    def speed_up(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.rate + RATE_INCREASE, self.max_rate)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.throttled = False
+        self._opened_at: t.Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running:
+                return False
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # Half open, one trial request decides whether to close again
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.throttled = False
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self, throttled: bool = False) -> None:
+        with self._lock:
+            self.failures += 1
+            self.throttled = throttled
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class HostLimiter:
+    def __init__(
+        self,
+        host: str,
+        max_rate: float,
+        failure_threshold: int,
+        reset_timeout: float,
+    ) -> None:
+        self.host = host
+        self.bucket = TokenBucket(max_rate)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+    def acquire(self, retry: bool = False) -> float:
+        """Return the seconds to wait before the next request to the host
+
+        Raises ``HostUnavailableError`` (or ``ThrottledError``) without
+        waiting if the circuit breaker is open. Retries of a request that
+        was let through are not checked again.
+        """
+        if not retry and not self.breaker.allow():
+            if self.breaker.throttled:
+                raise ThrottledError(self.host)
+            raise HostUnavailableError(self.host, "too many failed requests")
+        return self.bucket.reserve()
+
+    def try_acquire(self) -> bool:
+        """Whether an extra copy of a request, like a hedge, may be sent now
+
+        Never waits: it is refused while the circuit breaker is not closed
+        or when the host has no token left for it.
+        """
+        return not self.breaker.is_open and self.bucket.try_take()
+
+    def check_response(self, status_code: int, headers: t.Mapping[str, str]) -> bool:
+        """Slow down if a response was throttled, return whether it was"""
+        if not is_throttled(status_code, headers):
+            return False
+        self.bucket.slow_down(get_retry_after(headers))
+        return True
+
+    def record_result(self, status_code: int, throttled: bool = False) -> None:
+        """Record the final response of a request, after all its retries"""
+        if throttled or status_code >= 500:
+            self.breaker.record_failure(throttled=throttled)
+        else:
+            self.breaker.record_success()
+            self.bucket.speed_up()
+
+    def record_error(self) -> None:
+        """The request failed without a response, e.g. a connection reset"""
+        self.breaker.record_failure()